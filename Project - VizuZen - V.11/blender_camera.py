@@ -1,156 +1,198 @@
 import bpy
-import base64
 import os
 import tempfile
 import json
 import math
 import eel
 import bpy.types
-import time
-import traceback
-import functools
-
-# Maximum retry attempts for Blender operations
-MAX_RETRIES = 3
-RETRY_DELAY = 1.5  # seconds
-
-def safe_blender_operation(func):
-    """Decorator to make Blender operations more robust with retry logic"""
-    @functools.wraps(func)  # This preserves the original function name and metadata
-    def safe_wrapper(*args, **kwargs):
-        attempts = 0
-        last_error = None
-        
-        while attempts < MAX_RETRIES:
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                last_error = e
-                print(f"Blender operation failed (attempt {attempts+1}/{MAX_RETRIES}): {e}")
-                traceback.print_exc()
-                attempts += 1
-                if attempts < MAX_RETRIES:
-                    print(f"Retrying in {RETRY_DELAY} seconds...")
-                    time.sleep(RETRY_DELAY)
-        
-        # If we get here, all retries failed
-        print(f"All retry attempts failed for {func.__name__}: {last_error}")
-        return {"success": False, "message": f"Operation failed after {MAX_RETRIES} attempts: {str(last_error)}"}
-    
-    return safe_wrapper  # Return the wrapped function with preserved name
 
-@safe_blender_operation
-def capture_viewport_screenshot():
-    """Capture a screenshot from the current viewport"""
+# Preview render size, the same for every engine and independent of the scene's output settings
+PREVIEW_RESOLUTION = (800, 600)
+PREVIEW_RESOLUTION_PERCENTAGE = 50
+PREVIEW_REDUCED_SAMPLES = 16
+
+PREVIEW_ENGINE_ITEMS = [
+    ('WORKBENCH', "Viewport", "Workbench render with material colors, takes milliseconds"),
+    ('REDUCED', "Reduced Samples", f"The scene's render engine with {PREVIEW_REDUCED_SAMPLES} samples and no compositing"),
+    ('FULL', "Full Render", "The scene's render engine and settings, only at preview resolution"),
+]
+
+def configure_preview_scene(preview_scene, engine, camera_obj, filepath):
+    """Set up a throwaway copy of the scene to render one preview"""
+    render = preview_scene.render
+    preview_scene.camera = camera_obj
+    render.filepath = filepath
+    render.use_file_extension = False
+    render.image_settings.file_format = 'PNG'
+    render.image_settings.color_mode = 'RGB'
+    render.resolution_x, render.resolution_y = PREVIEW_RESOLUTION
+    render.resolution_percentage = PREVIEW_RESOLUTION_PERCENTAGE
+    # Sequencer strips would replace the camera's view in the output
+    render.use_sequencer = False
+
+    if engine == 'FULL':
+        return
+    render.use_compositing = False
+    if engine == 'WORKBENCH':
+        render.engine = 'BLENDER_WORKBENCH'
+        preview_scene.display.shading.light = 'STUDIO'
+        preview_scene.display.shading.color_type = 'MATERIAL'
+        preview_scene.display.render_aa = 'FXAA'
+    elif render.engine == 'CYCLES':
+        preview_scene.cycles.samples = min(preview_scene.cycles.samples, PREVIEW_REDUCED_SAMPLES)
+    else:
+        preview_scene.eevee.taa_render_samples = min(preview_scene.eevee.taa_render_samples, PREVIEW_REDUCED_SAMPLES)
+
+def capture_viewport_screenshot(camera_obj):
+    """Capture a screenshot from the current viewport for a camera, returns its preview store id.
+    Errors are raised, the RPC taking the screenshot retries as a whole"""
+    # Check if Blender is in a valid state for taking a screenshot
+    if not bpy.context.window_manager or not bpy.context.window_manager.windows:
+        raise RuntimeError("Blender window manager is not in a valid state")
+    
+    # Create a temporary file
+    temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
+    temp_path = temp_file.name
+    temp_file.close()
+    
     try:
-        # Create a temporary file
-        temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-        temp_path = temp_file.name
-        temp_file.close()
-        
-        # Check if Blender is in a valid state for taking a screenshot
-        if not bpy.context.window_manager or not bpy.context.window_manager.windows:
-            raise Exception("Blender window manager is not in a valid state")
-        
         # Save viewport screenshot
         bpy.ops.screen.screenshot(filepath=temp_path, full=False)
         
-        # Read image and convert to base64
+        # Keep the PNG bytes in the preview store, the UI loads them by id
         with open(temp_path, 'rb') as img_file:
-            img_data = base64.b64encode(img_file.read()).decode('utf-8')
-            
+            preview_id = preview_store.put(img_file.read(), "image/png")
+    finally:
         # Clean up
         os.unlink(temp_path)
-        
-        return img_data
-    except Exception as e:
-        print(f"Error capturing viewport screenshot: {e}")
-        traceback.print_exc()
-        return None
+    
+    # Kept in the disk cache too so the saved URL still resolves in a later session. The key is
+    # not a render's preview_cache_key, so cached renders are never answered with a screenshot
+    save_preview_to_disk(("screenshot", preview_cache_key(camera_obj, bpy.context.scene), preview_id), preview_id)
+    return preview_id
 
-@safe_blender_operation
 def render_camera_view(camera_obj):
-    """Render an image from the camera's perspective"""
+    """Render an image from the camera's perspective with the scene's preview engine, returns its preview store id.
+    Errors are raised, get_camera_preview retries the render"""
+    # Check if camera object exists and is valid
+    if not camera_obj or camera_obj.type != 'CAMERA':
+        raise ValueError("Invalid camera object")
+        
+    # Create a temporary file
+    temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
+    temp_path = temp_file.name
+    temp_file.close()
+    
+    # The copy links the same objects and collections, only the scene settings are its own,
+    # so nothing the user set on the scene is ever changed, even when the render fails
+    scene = bpy.context.scene
+    preview_scene = scene.copy()
+    try:
+        configure_preview_scene(preview_scene, scene.preview_engine, camera_obj, temp_path)
+        bpy.ops.render.render(write_still=True, scene=preview_scene.name)
+    finally:
+        bpy.data.scenes.remove(preview_scene)
+    
+    # Keep the PNG bytes in the preview store, the UI loads them by id
     try:
-        # Check if camera object exists and is valid
-        if not camera_obj or camera_obj.type != 'CAMERA':
-            raise Exception("Invalid camera object")
-            
-        # Create a temporary file
-        temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-        temp_path = temp_file.name
-        temp_file.close()
-        
-        # Store original settings
-        original_camera = bpy.context.scene.camera
-        original_filepath = bpy.context.scene.render.filepath
-        original_resolution_x = bpy.context.scene.render.resolution_x
-        original_resolution_y = bpy.context.scene.render.resolution_y
-        original_percentage = bpy.context.scene.render.resolution_percentage
-        
-        # Set render settings
-        bpy.context.scene.camera = camera_obj
-        bpy.context.scene.render.filepath = temp_path
-        bpy.context.scene.render.resolution_x = 800  # Lower resolution for faster preview
-        bpy.context.scene.render.resolution_y = 600
-        bpy.context.scene.render.resolution_percentage = 50
-        
-        # Render
-        bpy.ops.render.render(write_still=True)
-        
-        # Restore original settings
-        bpy.context.scene.camera = original_camera
-        bpy.context.scene.render.filepath = original_filepath
-        bpy.context.scene.render.resolution_x = original_resolution_x
-        bpy.context.scene.render.resolution_y = original_resolution_y
-        bpy.context.scene.render.resolution_percentage = original_percentage
-        
-        # Read image and convert to base64
         with open(temp_path, 'rb') as img_file:
-            img_data = base64.b64encode(img_file.read()).decode('utf-8')
-            
+            preview_id = preview_store.put(img_file.read(), "image/png")
+    finally:
         # Clean up
         os.unlink(temp_path)
-        
-        return img_data
-    except Exception as e:
-        print(f"Error rendering camera view: {e}")
-        traceback.print_exc()
-        return None
+    
+    return preview_id
+
+def get_camera_preview(camera_obj, count=True):
+    """Rendered preview of a camera, only re-rendered when the camera, frame or scene changed.
+    Returns the preview id, or a Future of it while a failed render waits for its retry"""
+    key = preview_cache_key(camera_obj, bpy.context.scene)
+    preview_id = find_cached_preview(camera_obj.name, key, count)
+    if preview_id is not None:
+        return preview_id
+
+    name = camera_obj.name
+    future = run_with_retry(render_camera_view, (camera_obj,))
+    future.add_done_callback(lambda done: cache_rendered_preview(name, key, done.result()))
+    return future.result() if future.done() else future
+
+def cache_rendered_preview(name, key, preview_id):
+    # Renders that failed for good come back as an error dict, those are not cached
+    if isinstance(preview_id, str):
+        store_preview(name, key, preview_id)
+        save_preview_to_disk(key, preview_id)
+
+@eel.expose
+@main_thread_rpc
+def get_preview_engine():
+    """Engine used for camera previews, with the choices the UI can offer"""
+    return {
+        "success": True,
+        "engine": bpy.context.scene.preview_engine,
+        "engines": [{"id": item[0], "name": item[1], "description": item[2]} for item in PREVIEW_ENGINE_ITEMS],
+    }
 
 @eel.expose
+@main_thread_rpc
+def set_preview_engine(engine):
+    """Previews of the other engines stay cached, the engine is part of the preview key"""
+    if engine not in {item[0] for item in PREVIEW_ENGINE_ITEMS}:
+        return {"success": False, "message": f"Unknown preview engine: {engine}"}
+    bpy.context.scene.preview_engine = engine
+    return {"success": True, "engine": engine}
+
+@eel.expose
+def focus_camera_preview(section_id, camera_number):
+    """Render this slot's preview before any other queued one, the UI calls it for the camera in view"""
+    preview_queue.set_focus(section_id, camera_number)
+    return {"success": True}
+
+@eel.expose
+def cancel_section_previews(section_ids):
+    """Drop queued preview renders of deleted sections"""
+    for section_id in section_ids:
+        preview_queue.cancel_section(section_id)
+    return {"success": True}
+
+@eel.expose
+def get_camera_preview_stats():
+    """Hit / miss counters of the camera preview cache"""
+    return {"success": True, "stats": get_preview_cache_stats()}
+
+@eel.expose
+def get_operation_retry_stats():
+    """Retry counts and latencies of the Blender operations behind the camera RPCs"""
+    return {"success": True, "stats": get_operation_stats()}
+
+@eel.expose
+def get_dispatcher_stats():
+    """Queue depth and wait / run times of the RPCs run on Blender's main thread, in seconds"""
+    return {"success": True, "stats": main_thread_dispatcher.get_stats()}
+
+@eel.expose
+@main_thread_rpc
+@safe_blender_operation
+def get_camera_binding_report():
+    """Section slots bound to more than one camera, the first camera listed is the one in use"""
+    duplicates = [
+        {"section_id": section_id, "camera_number": camera_number, "cameras": names}
+        for (section_id, camera_number), names in get_duplicate_camera_bindings().items()
+    ]
+    return {"success": True, "duplicates": duplicates}
+
+@eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def get_all_cameras_in_scene():
     """Get all camera objects in the current Blender scene"""
-    try:
-        cameras = []
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA':
-                camera_data = {
-                    "name": obj.name,
-                    "position": {
-                        "x": obj.location.x,
-                        "y": obj.location.y,
-                        "z": obj.location.z
-                    },
-                    "rotation": {
-                        "x": obj.rotation_euler.x,
-                        "y": obj.rotation_euler.y,
-                        "z": obj.rotation_euler.z
-                    }
-                }
-                cameras.append(camera_data)
-        
-        return {"success": True, "cameras": cameras}
-    except Exception as e:
-        print(f"Error getting cameras: {e}")
-        traceback.print_exc()
-        return {"success": False, "message": str(e)}
+    return {"success": True, "cameras": list_scene_cameras()}
 
 @eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def add_camera_at_current_view(section_id, camera_number, frame, render_preview=False):
     """Add a camera at the current view in Blender"""
+    camera_obj = None
     try:
         # Create a new camera
         camera_data = bpy.data.cameras.new(f"Camera_{section_id}_{camera_number}")
@@ -187,17 +229,15 @@ def add_camera_at_current_view(section_id, camera_number, frame, render_preview=
         rot = camera_obj.rotation_euler
         
         # Add custom properties to the camera
-        camera_obj["section_id"] = section_id
-        camera_obj["camera_number"] = camera_number
-        camera_obj["camera_frame"] = frame
-        camera_obj["camera_name"] = f"Camera {camera_number}"
+        bind_camera(camera_obj, section_id, camera_number, frame)
         
         # Capture preview image (either simple screenshot or rendered view)
-        preview_image = None
+        # Renders are queued and pushed to the UI when done, the screenshot has to be taken now
+        preview_id = None
         if render_preview:
-            preview_image = render_camera_view(camera_obj)
+            preview_id = queue_camera_preview(camera_obj, section_id, camera_number)
         else:
-            preview_image = capture_viewport_screenshot()
+            preview_id = capture_viewport_screenshot(camera_obj)
         
         # Create camera data for UI
         camera_data = {
@@ -205,321 +245,326 @@ def add_camera_at_current_view(section_id, camera_number, frame, render_preview=
             "position": {"x": pos.x, "y": pos.y, "z": pos.z},
             "rotation": {"x": rot.x, "y": rot.y, "z": rot.z},
             "frame": frame,
-            "preview_image": preview_image,
+            "preview_url": preview_url(preview_id),
+            "preview_pending": render_preview and preview_id is None,
             "blender_name": camera_obj.name
         }
         
         return {"success": True, "camera_data": camera_data}
-    except Exception as e:
-        print(f"Error adding camera: {e}")
-        traceback.print_exc()
-        
-        # Attempt cleanup on error
-        try:
-            # Check if camera was created but not fully set up
-            camera_name = f"Camera_{section_id}_{camera_number}"
-            for obj in bpy.data.objects:
-                if obj.name == camera_name and obj.type == 'CAMERA':
-                    bpy.data.objects.remove(obj)
-        except:
-            pass
-            
-        return {"success": False, "message": str(e)}
+    except Exception:
+        # Remove the half set up camera, a retry starts from scratch and the error goes on to the retry policy
+        if camera_obj is not None:
+            try:
+                forget_camera(camera_obj)
+                bpy.data.objects.remove(camera_obj)
+            except Exception as cleanup_error:
+                print(f"Error removing camera after a failed add: {cleanup_error}")
+        raise
 
 @eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def link_existing_camera(section_id, camera_number, camera_name, frame):
     """Link an existing camera to the section"""
-    try:
-        # Find the camera by name
-        camera_obj = None
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA' and obj.name == camera_name:
-                camera_obj = obj
-                break
-        
-        if not camera_obj:
-            return {"success": False, "message": f"Camera '{camera_name}' not found"}
-        
-        # Add custom properties to the camera
-        camera_obj["section_id"] = section_id
-        camera_obj["camera_number"] = camera_number
-        camera_obj["camera_frame"] = frame
-        camera_obj["camera_name"] = f"Camera {camera_number}"
-        
-        # Capture preview image
-        preview_image = render_camera_view(camera_obj)
-        
-        # Get camera position and rotation
-        pos = camera_obj.location
-        rot = camera_obj.rotation_euler
-        
-        # Create camera data for UI
-        camera_data = {
-            "name": camera_obj.name,
-            "position": {"x": pos.x, "y": pos.y, "z": pos.z},
-            "rotation": {"x": rot.x, "y": rot.y, "z": rot.z},
-            "frame": frame,
-            "preview_image": preview_image,
-            "blender_name": camera_obj.name
-        }
-        
-        return {"success": True, "camera_data": camera_data}
-    except Exception as e:
-        print(f"Error linking camera: {e}")
-        traceback.print_exc()
-        return {"success": False, "message": str(e)}
+    # Find the camera by name
+    camera_obj = find_camera_by_name(camera_name)
+    
+    if not camera_obj:
+        return {"success": False, "message": f"Camera '{camera_name}' not found"}
+    
+    # Add custom properties to the camera
+    bind_camera(camera_obj, section_id, camera_number, frame)
+    
+    # Cached preview, or a placeholder until the queued render is pushed
+    preview_id = queue_camera_preview(camera_obj, section_id, camera_number)
+    
+    # Get camera position and rotation
+    pos = camera_obj.location
+    rot = camera_obj.rotation_euler
+    
+    # Create camera data for UI
+    camera_data = {
+        "name": camera_obj.name,
+        "position": {"x": pos.x, "y": pos.y, "z": pos.z},
+        "rotation": {"x": rot.x, "y": rot.y, "z": rot.z},
+        "frame": frame,
+        "preview_url": preview_url(preview_id),
+        "preview_pending": preview_id is None,
+        "blender_name": camera_obj.name
+    }
+    
+    return {"success": True, "camera_data": camera_data}
 
 @eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def update_camera_from_current_view(section_id, camera_number, frame, render_preview=False):
     """Update an existing camera from the current view"""
-    try:
-        # Find the camera
-        camera_obj = None
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA' and obj.get("section_id") == section_id and obj.get("camera_number") == camera_number:
-                camera_obj = obj
-                break
-        
-        if not camera_obj:
-            return {"success": False, "message": "Camera not found"}
-        
-        # Find active 3D viewport
-        view3d = None
-        region3d = None
-        
-        for window in bpy.context.window_manager.windows:
-            for area in window.screen.areas:
-                if area.type == 'VIEW_3D':
-                    for space in area.spaces:
-                        if space.type == 'VIEW_3D':
-                            view3d = space
-                            region3d = space.region_3d
-                            break
-                    if view3d:
+    # Find the camera
+    camera_obj = find_camera(section_id, camera_number)
+    
+    if not camera_obj:
+        return {"success": False, "message": "Camera not found"}
+    
+    # Find active 3D viewport
+    view3d = None
+    region3d = None
+    
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                for space in area.spaces:
+                    if space.type == 'VIEW_3D':
+                        view3d = space
+                        region3d = space.region_3d
                         break
-            if view3d:
-                break
-                
-        if not view3d or not region3d:
-            raise Exception("No active 3D viewport found")
-        
-        # Copy view to camera
-        camera_obj.matrix_world = region3d.view_matrix.inverted()
-        
-        # Update camera properties
-        pos = camera_obj.location
-        rot = camera_obj.rotation_euler
-        camera_obj["camera_frame"] = frame
-        
-        # Capture preview image (either simple screenshot or rendered view)
-        preview_image = None
-        if render_preview:
-            preview_image = render_camera_view(camera_obj)
-        else:
-            preview_image = capture_viewport_screenshot()
-        
-        # Create updated camera data for UI
-        camera_data = {
-            "name": camera_obj.name,
-            "position": {"x": pos.x, "y": pos.y, "z": pos.z},
-            "rotation": {"x": rot.x, "y": rot.y, "z": rot.z},
-            "frame": frame,
-            "preview_image": preview_image,
-            "blender_name": camera_obj.name
-        }
-        
-        return {"success": True, "camera_data": camera_data}
-    except Exception as e:
-        print(f"Error updating camera: {e}")
-        traceback.print_exc()
-        return {"success": False, "message": str(e)}
+                if view3d:
+                    break
+        if view3d:
+            break
+            
+    if not view3d or not region3d:
+        raise Exception("No active 3D viewport found")
+    
+    # Copy view to camera
+    camera_obj.matrix_world = region3d.view_matrix.inverted()
+    
+    # Update camera properties
+    pos = camera_obj.location
+    rot = camera_obj.rotation_euler
+    camera_obj["camera_frame"] = frame
+    
+    # Capture preview image (either simple screenshot or rendered view)
+    # Renders are queued and pushed to the UI when done, the screenshot has to be taken now
+    preview_id = None
+    if render_preview:
+        preview_id = queue_camera_preview(camera_obj, section_id, camera_number)
+    else:
+        preview_id = capture_viewport_screenshot(camera_obj)
+    
+    # Create updated camera data for UI
+    camera_data = {
+        "name": camera_obj.name,
+        "position": {"x": pos.x, "y": pos.y, "z": pos.z},
+        "rotation": {"x": rot.x, "y": rot.y, "z": rot.z},
+        "frame": frame,
+        "preview_url": preview_url(preview_id),
+        "preview_pending": render_preview and preview_id is None,
+        "blender_name": camera_obj.name
+    }
+    
+    return {"success": True, "camera_data": camera_data}
 
 @eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def change_camera_view(section_id, camera_number, new_camera_name):
     """Change the camera view to another existing camera"""
-    try:
-        # Find the new camera object
-        new_camera_obj = None
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA' and obj.name == new_camera_name:
-                new_camera_obj = obj
-                break
-        
-        if not new_camera_obj:
-            return {"success": False, "message": f"Camera '{new_camera_name}' not found"}
-        
-        # Get current frame
-        current_frame = bpy.context.scene.frame_current
-        
-        # Update custom properties
-        new_camera_obj["section_id"] = section_id
-        new_camera_obj["camera_number"] = camera_number
-        new_camera_obj["camera_frame"] = current_frame
-        new_camera_obj["camera_name"] = f"Camera {camera_number}"
-        
-        # Capture preview image
-        preview_image = render_camera_view(new_camera_obj)
-        
-        # Get camera properties
-        pos = new_camera_obj.location
-        rot = new_camera_obj.rotation_euler
-        
-        # Create updated camera data for UI
-        camera_data = {
-            "name": new_camera_obj.name,
-            "position": {"x": pos.x, "y": pos.y, "z": pos.z},
-            "rotation": {"x": rot.x, "y": rot.y, "z": rot.z},
-            "frame": current_frame,
-            "preview_image": preview_image,
-            "blender_name": new_camera_obj.name
-        }
-        
-        return {"success": True, "camera_data": camera_data}
-    except Exception as e:
-        print(f"Error changing camera view: {e}")
-        traceback.print_exc()
-        return {"success": False, "message": str(e)}
+    # Find the new camera object
+    new_camera_obj = find_camera_by_name(new_camera_name)
+    
+    if not new_camera_obj:
+        return {"success": False, "message": f"Camera '{new_camera_name}' not found"}
+    
+    # Get current frame
+    current_frame = bpy.context.scene.frame_current
+    
+    # Update custom properties
+    bind_camera(new_camera_obj, section_id, camera_number, current_frame)
+    
+    # Cached preview, or a placeholder until the queued render is pushed
+    preview_id = queue_camera_preview(new_camera_obj, section_id, camera_number)
+    
+    # Get camera properties
+    pos = new_camera_obj.location
+    rot = new_camera_obj.rotation_euler
+    
+    # Create updated camera data for UI
+    camera_data = {
+        "name": new_camera_obj.name,
+        "position": {"x": pos.x, "y": pos.y, "z": pos.z},
+        "rotation": {"x": rot.x, "y": rot.y, "z": rot.z},
+        "frame": current_frame,
+        "preview_url": preview_url(preview_id),
+        "preview_pending": preview_id is None,
+        "blender_name": new_camera_obj.name
+    }
+    
+    return {"success": True, "camera_data": camera_data}
 
 @eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def jump_to_camera_view(section_id, camera_number):
     """Jump to a specific camera view in Blender"""
-    try:
-        # Find the camera
-        camera_obj = None
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA' and obj.get("section_id") == section_id and obj.get("camera_number") == camera_number:
-                camera_obj = obj
-                break
-        
-        if not camera_obj:
-            return {"success": False, "message": "Camera not found"}
-        
-        # Set the active camera
-        bpy.context.scene.camera = camera_obj
-        
-        # Change to camera view in all 3D viewports
-        for area in bpy.context.screen.areas:
+    # Find the camera
+    camera_obj = find_camera(section_id, camera_number)
+    
+    if not camera_obj:
+        return {"success": False, "message": "Camera not found"}
+    
+    # Set the active camera, its preview is rendered before any other queued one
+    bpy.context.scene.camera = camera_obj
+    preview_queue.set_focus(section_id, camera_number)
+    
+    # Change to camera view in all 3D viewports, of every window: this runs from the dispatcher's
+    # timer, where bpy.context.screen is None; writing region_3d needs no context of its own
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
             if area.type == 'VIEW_3D':
-                area.spaces[0].region_3d.view_perspective = 'CAMERA'
-        
-        # Set frame if camera has one
-        if camera_obj.get("camera_frame"):
-            bpy.context.scene.frame_set(camera_obj["camera_frame"])
-        
-        return {"success": True}
-    except Exception as e:
-        print(f"Error jumping to camera view: {e}")
-        traceback.print_exc()
-        return {"success": False, "message": str(e)}
+                area.spaces.active.region_3d.view_perspective = 'CAMERA'
+                area.tag_redraw()
+    
+    # Set frame if camera has one
+    if camera_obj.get("camera_frame"):
+        bpy.context.scene.frame_set(camera_obj["camera_frame"])
+    
+    return {"success": True}
 
 @eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def remove_camera_reference(section_id, camera_number):
     """Remove a camera reference from a section without deleting the camera from Blender"""
-    try:
-        # Find the camera
-        camera_obj = None
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA' and obj.get("section_id") == section_id and obj.get("camera_number") == camera_number:
-                camera_obj = obj
-                break
-        
-        if not camera_obj:
-            return {"success": False, "message": "Camera not found"}
-        
-        # Just remove our reference properties but don't delete the camera
-        # This allows cameras to be reused across different sections
-        if "section_id" in camera_obj:
-            del camera_obj["section_id"]
-        if "camera_number" in camera_obj:
-            del camera_obj["camera_number"]
-        if "camera_frame" in camera_obj:
-            del camera_obj["camera_frame"]
-        if "camera_name" in camera_obj:
-            del camera_obj["camera_name"]
-        
-        return {"success": True}
-    except Exception as e:
-        print(f"Error removing camera reference: {e}")
-        traceback.print_exc()
-        return {"success": False, "message": str(e)}
+    # Find the camera
+    camera_obj = find_camera(section_id, camera_number)
+    
+    if not camera_obj:
+        return {"success": False, "message": "Camera not found"}
+    
+    # Just remove our reference properties but don't delete the camera
+    # This allows cameras to be reused across different sections
+    unbind_camera(camera_obj)
+    preview_queue.cancel_slot(section_id, camera_number)
+    
+    return {"success": True}
 
 @eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def delete_camera(section_id, camera_number, delete_from_blender=False):
     """Delete a camera from Blender"""
-    try:
-        # Find the camera
-        camera_obj = None
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA' and obj.get("section_id") == section_id and obj.get("camera_number") == camera_number:
-                camera_obj = obj
-                break
-        
-        if not camera_obj:
-            return {"success": False, "message": "Camera not found"}
-        
-        if delete_from_blender:
-            # Actually delete the camera from Blender
-            camera_data = camera_obj.data
-            bpy.data.objects.remove(camera_obj)
-            bpy.data.cameras.remove(camera_data)
-        else:
-            # Just remove our reference properties but don't delete the camera
-            if "section_id" in camera_obj:
-                del camera_obj["section_id"]
-            if "camera_number" in camera_obj:
-                del camera_obj["camera_number"]
-            if "camera_frame" in camera_obj:
-                del camera_obj["camera_frame"]
-            if "camera_name" in camera_obj:
-                del camera_obj["camera_name"]
-        
-        return {"success": True}
-    except Exception as e:
-        print(f"Error deleting camera: {e}")
-        traceback.print_exc()
-        return {"success": False, "message": str(e)}
+    # Find the camera
+    camera_obj = find_camera(section_id, camera_number)
+    
+    if not camera_obj:
+        return {"success": False, "message": "Camera not found"}
+    
+    if delete_from_blender:
+        # Actually delete the camera from Blender
+        camera_data = camera_obj.data
+        forget_camera(camera_obj)
+        bpy.data.objects.remove(camera_obj)
+        bpy.data.cameras.remove(camera_data)
+    else:
+        # Just remove our reference properties but don't delete the camera
+        unbind_camera(camera_obj)
+    preview_queue.cancel_slot(section_id, camera_number)
+    
+    return {"success": True}
+
+def read_camera_transforms(camera_objs):
+    """(location, rotation) tuples of many cameras, a plain loop over the objects reading each vector in one slice.
+
+    Deliberately not a bulk foreach_get: that reads a property of every item of a
+    bpy collection, and cameras have no collection of their own, so it would read
+    all of bpy.data.objects (tens of thousands) to keep a few hundred. The loop
+    costs two attribute reads per camera.
+    """
+    return [(obj.location[:], obj.rotation_euler[:]) for obj in camera_objs]
+
+def vector_dict(vector):
+    return {"x": vector[0], "y": vector[1], "z": vector[2]}
+
+def list_scene_cameras():
+    """Name, transform and section slot of every camera in the file, from the camera registry"""
+    ensure_camera_registry()
+    camera_objs = [obj for obj in map(find_camera_by_name, sorted(camera_registry["cameras"])) if obj is not None]
+    cameras = []
+    for obj, (pos, rot) in zip(camera_objs, read_camera_transforms(camera_objs)):
+        camera = {"name": obj.name, "position": vector_dict(pos), "rotation": vector_dict(rot)}
+        binding = read_camera_binding(obj)
+        if binding is not None:
+            camera["section_id"], camera["camera_number"] = binding
+        cameras.append(camera)
+    return cameras
+
+def camera_slot_data(camera_obj, section_id, camera_number, transform, render_missing=True):
+    """UI data of a bound camera, with its cached preview or a placeholder until the queued render is pushed.
+    Without render_missing an uncached preview is left out, for slots the UI already shows a preview for"""
+    pos, rot = transform
+    camera_data = {
+        "name": camera_obj.name,
+        "position": vector_dict(pos),
+        "rotation": vector_dict(rot),
+        "frame": camera_obj.get("camera_frame", 0),
+        "blender_name": camera_obj.name
+    }
+    preview_id = queue_camera_preview(camera_obj, section_id, camera_number, render_missing)
+    if preview_id:
+        camera_data["preview_url"] = preview_url(preview_id)
+    elif render_missing:
+        camera_data["preview_pending"] = True
+    return camera_data
 
 @eel.expose
+@main_thread_rpc
+@safe_blender_operation
+def get_section_cameras(section_ids, missing_previews=(), known_previews=()):
+    """Every bound camera of a set of sections in one call, plus the scene's cameras for the dropdowns.
+    Cached previews are attached, renders are only queued for the [section_id, camera_number] slots in
+    missing_previews (the UI has no preview for them at all); those arrive as camera_preview events.
+    known_previews lists [section_id, camera_number, preview_id] of the previews the UI shows, ids that
+    can't be served anymore are treated as missing and flagged preview_expired"""
+    ensure_camera_registry()
+    wanted = set(section_ids)
+    missing = {(section_id, camera_number) for section_id, camera_number in missing_previews}
+    expired = {(section_id, camera_number) for section_id, camera_number, preview_id in known_previews
+               if not preview_available(preview_id)}
+    missing |= expired
+    slots = [key for key in camera_registry["bindings"] if key[0] in wanted]
+    bound = []
+    for section_id, camera_number in slots:
+        camera_obj = find_camera(section_id, camera_number)
+        if camera_obj is not None:
+            bound.append((section_id, camera_number, camera_obj))
+    
+    transforms = read_camera_transforms([camera_obj for _, _, camera_obj in bound])
+    cameras = []
+    for (section_id, camera_number, camera_obj), transform in zip(bound, transforms):
+        camera_data = camera_slot_data(camera_obj, section_id, camera_number, transform,
+                                       render_missing=(section_id, camera_number) in missing)
+        if (section_id, camera_number) in expired:
+            camera_data["preview_expired"] = True
+        cameras.append({"section_id": section_id, "camera_number": camera_number, "camera_data": camera_data})
+    return {"success": True, "cameras": cameras, "available_cameras": list_scene_cameras()}
+
+@eel.expose
+@main_thread_rpc
 @safe_blender_operation
 def get_camera_data(section_id, camera_number):
     """Get data for a specific camera"""
-    try:
-        # Find the camera
-        camera_obj = None
-        for obj in bpy.data.objects:
-            if obj.type == 'CAMERA' and obj.get("section_id") == section_id and obj.get("camera_number") == camera_number:
-                camera_obj = obj
-                break
-        
-        if not camera_obj:
-            return {"success": False, "message": "Camera not found"}
-        
-        # Get camera properties
-        pos = camera_obj.location
-        rot = camera_obj.rotation_euler
-        
-        # Create camera data for UI
-        camera_data = {
-            "name": camera_obj.name,
-            "position": {"x": pos.x, "y": pos.y, "z": pos.z},
-            "rotation": {"x": rot.x, "y": rot.y, "z": rot.z},
-            "frame": camera_obj.get("camera_frame", 0),
-            "blender_name": camera_obj.name
-        }
-        
-        # Try to get a new preview image
-        preview_image = render_camera_view(camera_obj)
-        if preview_image:
-            camera_data["preview_image"] = preview_image
-        
-        return {"success": True, "camera_data": camera_data}
-    except Exception as e:
-        print(f"Error getting camera data: {e}")
-        traceback.print_exc()
-        return {"success": False, "message": str(e)}
\ No newline at end of file
+    # Find the camera
+    camera_obj = find_camera(section_id, camera_number)
+    
+    if not camera_obj:
+        return {"success": False, "message": "Camera not found"}
+    
+    transform = read_camera_transforms([camera_obj])[0]
+    camera_data = camera_slot_data(camera_obj, section_id, camera_number, transform)
+    
+    return {"success": True, "camera_data": camera_data}
+
+def register():
+    bpy.types.Scene.preview_engine = bpy.props.EnumProperty(
+        name="Preview Engine",
+        description="How storyboard camera previews are rendered",
+        items=PREVIEW_ENGINE_ITEMS,
+        default='WORKBENCH'
+    )
+
+def unregister():
+    del bpy.types.Scene.preview_engine
+
+if __name__ == "__main__":
+    register()
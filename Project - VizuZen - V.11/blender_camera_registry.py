@@ -0,0 +1,174 @@
+###################################################################### Camera registry
+import bpy
+
+
+# Custom properties that bind a camera to a storyboard section slot
+CAMERA_BINDING_PROPERTIES = ("section_id", "camera_number", "camera_frame", "camera_name")
+
+# Cameras of the file by section slot and by name, so camera RPCs don't scan bpy.data.objects
+camera_registry = {
+    "valid": False,     # False until built, and after file loads / undo
+    "bindings": {},     # (section_id, camera_number) -> camera object name
+    "cameras": {},      # camera object name -> (section_id, camera_number), None when unbound
+    "duplicates": {},   # (section_id, camera_number) -> names of every camera bound to it, if more than one
+}
+
+
+def read_camera_binding(obj):
+    """(section_id, camera_number) of a camera, None if it isn't bound to a section"""
+    section_id = obj.get("section_id")
+    camera_number = obj.get("camera_number")
+    if section_id is None or camera_number is None:
+        return None
+    return (section_id, camera_number)
+
+
+def registry_add(obj):
+    name = obj.name
+    key = read_camera_binding(obj)
+    camera_registry["cameras"][name] = key
+    if key is None:
+        return
+
+    bindings = camera_registry["bindings"]
+    holder = bindings.get(key)
+    if holder is None or holder == name:
+        bindings[key] = name
+        return
+
+    # Same slot bound twice, the first camera in name order wins like the old linear scans
+    camera_registry["duplicates"].setdefault(key, {holder}).add(name)
+    bindings[key] = min(holder, name)
+
+
+def registry_remove(name):
+    key = camera_registry["cameras"].pop(name, None)
+    if key is None:
+        return
+
+    bindings = camera_registry["bindings"]
+    duplicates = camera_registry["duplicates"]
+    names = duplicates.get(key)
+    if names is not None:
+        names.discard(name)
+        if len(names) < 2:
+            del duplicates[key]
+    if bindings.get(key) == name:
+        if names:
+            bindings[key] = min(names)
+        else:
+            del bindings[key]
+
+
+def rebuild_camera_registry():
+    """Full scan of bpy.data.objects, done once per file load, undo or stale entry"""
+    camera_registry.update(valid=True, bindings={}, cameras={}, duplicates={})
+    for obj in bpy.data.objects:
+        if obj.type == 'CAMERA':
+            registry_add(obj)
+
+    for key, names in camera_registry["duplicates"].items():
+        print(f"Camera slot {key} is bound to several cameras: {', '.join(sorted(names))}, using {camera_registry['bindings'][key]}")
+
+
+def ensure_camera_registry():
+    if not camera_registry["valid"]:
+        rebuild_camera_registry()
+
+
+def find_camera(section_id, camera_number):
+    """Camera bound to a section slot, or None"""
+    key = (section_id, camera_number)
+    for attempt in range(2):
+        ensure_camera_registry()
+        name = camera_registry["bindings"].get(key)
+        if name is None:
+            return None
+
+        # Entries are checked on use, so anything the handlers missed costs one rebuild, not a wrong camera
+        obj = bpy.data.objects.get(name)
+        if obj is not None and obj.type == 'CAMERA' and read_camera_binding(obj) == key:
+            return obj
+        camera_registry["valid"] = False
+    return None
+
+
+def find_camera_by_name(name):
+    """Camera object with a Blender name, or None"""
+    obj = bpy.data.objects.get(name)
+    if obj is not None and obj.type == 'CAMERA':
+        return obj
+    return None
+
+
+def bind_camera(obj, section_id, camera_number, frame):
+    """Bind a camera to a section slot, other cameras holding that slot are released"""
+    key = (section_id, camera_number)
+    find_camera(section_id, camera_number)  # Makes sure the slot's entries are current
+    holders = set(camera_registry["duplicates"].get(key, ())) | {camera_registry["bindings"].get(key)}
+    for name in holders - {None, obj.name}:
+        previous = find_camera_by_name(name)
+        if previous is not None:
+            unbind_camera(previous)
+
+    registry_remove(obj.name)
+    obj["section_id"] = section_id
+    obj["camera_number"] = camera_number
+    obj["camera_frame"] = frame
+    obj["camera_name"] = f"Camera {camera_number}"
+    registry_add(obj)
+
+
+def unbind_camera(obj):
+    """Remove the section binding of a camera without deleting it"""
+    registry_remove(obj.name)
+    for key in CAMERA_BINDING_PROPERTIES:
+        if key in obj:
+            del obj[key]
+    registry_add(obj)
+
+
+def forget_camera(obj):
+    """Drop a camera from the registry, call before removing it from bpy.data"""
+    registry_remove(obj.name)
+
+
+def get_duplicate_camera_bindings():
+    ensure_camera_registry()
+    return {key: sorted(names) for key, names in camera_registry["duplicates"].items()}
+
+
+def update_camera_registry(scene, changes):
+    """Re-register the cameras touched, added, removed or renamed by a scene update"""
+    if changes["reset"]:
+        # Undo, redo and file loads replace the objects, the registry is built again on next use
+        camera_registry["valid"] = False
+        return
+    if not camera_registry["valid"]:
+        return
+
+    cameras = camera_registry["cameras"]
+    for name in changes["renamed"]:
+        registry_remove(name)
+    # Cameras unlinked from the scene but still in the file keep their binding
+    for name in changes["removed"]:
+        if name in cameras and name not in bpy.data.objects:
+            registry_remove(name)
+    for name in changes["touched"].keys() | changes["added"]:
+        obj = find_camera_by_name(name)
+        if obj is not None:
+            registry_remove(name)
+            registry_add(obj)
+
+
+def register():
+    scene_changes.add_listener("camera_registry", update_camera_registry)
+
+
+def unregister():
+    scene_changes.remove_listener("camera_registry")
+    camera_registry["valid"] = False
+
+
+if __name__ == "__main__":
+    register()
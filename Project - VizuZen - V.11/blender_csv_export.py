@@ -0,0 +1,336 @@
+###################################################################### CSV export modes
+import bpy
+import os
+import csv
+import json
+import hashlib
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import csv_export_rows
+from csv_export_rows import encode_csv_rows
+
+
+#################################################### Incremental export
+
+# Manifest kept next to the CSV, describes where each object's rows live in it
+MANIFEST_VERSION = 1
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def manifest_path_for(filepath):
+    return f"{filepath}.manifest.json"
+
+
+def load_export_manifest(filepath, export_format):
+    """The manifest of the previous export, or None if it can't be trusted anymore"""
+    try:
+        with open(manifest_path_for(filepath), 'r', encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+        stat = os.stat(filepath)
+    except (OSError, ValueError):
+        return None
+
+    # The CSV must still be exactly the file the manifest was written for
+    if (manifest.get("version") != MANIFEST_VERSION or manifest.get("format") != export_format
+            or manifest.get("size") != stat.st_size or manifest.get("mtime_ns") != stat.st_mtime_ns):
+        return None
+    return manifest
+
+
+def save_export_manifest(filepath, export_format, objects):
+    stat = os.stat(filepath)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "format": export_format,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "objects": objects,
+    }
+    temp_path = f"{manifest_path_for(filepath)}.part"
+    with open(temp_path, 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(temp_path, manifest_path_for(filepath))
+
+
+def snapshot_entry_hash(entry, *extra):
+    """Content hash of one snapshot entry: name, MN, category, work package and document rows"""
+    name, mn_value, category, subcategory, rows = entry
+    content = (name, mn_value, category, subcategory, [sorted(doc.items()) for doc in rows], extra)
+    return hashlib.blake2b(repr(content).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class SpliceWriter:
+    """Writes new bytes and copies unchanged byte ranges of the previous export, merging adjacent ranges"""
+
+    def __init__(self, out, previous_path):
+        self.out = out
+        self.previous = open(previous_path, 'rb') if previous_path else None
+        self.offset = 0
+        self.copy_start = None
+        self.copy_end = None
+
+    def write(self, data):
+        self.flush_copy()
+        self.out.write(data)
+        self.offset += len(data)
+
+    def copy(self, start, length):
+        if self.copy_end != start:
+            self.flush_copy()
+            self.copy_start = start
+        self.copy_end = start + length
+        self.offset += length
+
+    def flush_copy(self):
+        if self.copy_start is None:
+            return
+        self.previous.seek(self.copy_start)
+        remaining = self.copy_end - self.copy_start
+        while remaining > 0:
+            chunk = self.previous.read(min(COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise IOError("Previous export is shorter than its manifest")
+            self.out.write(chunk)
+            remaining -= len(chunk)
+        self.copy_start = self.copy_end = None
+
+    def close(self):
+        self.flush_copy()
+        if self.previous:
+            self.previous.close()
+
+
+def write_incremental_csv(export_format, job, csvfile):
+    """Export that only re-serializes objects whose content hash changed"""
+    fields, iter_objects = EXPORT_FORMATS[export_format]
+    manifest = load_export_manifest(job.filepath, export_format)
+    previous = {}
+    if manifest:
+        previous = {name: (digest, offset, length) for name, digest, offset, length in manifest["objects"]}
+
+    splice = SpliceWriter(csvfile, job.filepath if manifest else None)
+    entries = []
+    reused = 0
+    try:
+        splice.write(encode_csv_rows([fields]))
+        # In the long format a placeholder row depends on the objects before, so that is part of the hash
+        has_custom_string = False
+        for done, (entry, object_rows) in enumerate(zip(job.snapshot, iter_objects(job.snapshot)), 1):
+            if export_format == 'LONG':
+                digest = snapshot_entry_hash(entry, has_custom_string)
+                has_custom_string = has_custom_string or any(row[4] for row in object_rows)
+            else:
+                digest = snapshot_entry_hash(entry)
+
+            start = splice.offset
+            old = previous.get(entry[0])
+            if old and old[0] == digest:
+                splice.copy(old[1], old[2])
+                reused += 1
+            else:
+                splice.write(encode_csv_rows(object_rows))
+            entries.append([entry[0], digest, start, splice.offset - start])
+
+            if done % EXPORT_BATCH_SIZE == 0:
+                job.done = done
+                if job.cancelled():
+                    return
+    finally:
+        splice.close()
+
+    job.done = job.total
+    job.manifest_objects = entries
+    job.summary = f"{job.total - reused} changed, {reused} unchanged"
+
+
+def finish_incremental_export(export_format, job):
+    save_export_manifest(job.filepath, export_format, job.manifest_objects)
+
+
+# Operator to export all objects, reusing the unchanged part of the previous export
+class ExportAllObjectsCSVIncremental(bpy.types.Operator):
+    """Export all objects to CSV, only re-writing objects that changed since the last export"""
+    bl_idname = "export.all_objects_csv_incremental"
+    bl_label = "Export All Objects to CSV (Incremental)"
+
+    _timer = None
+    _job = None
+
+    def make_job(self, context):
+        export_format = context.scene.csv_export_format
+        filepath = os.path.join(bpy.path.abspath("//"), export_filename("all_objects_properties", export_format))
+        return CSVExportJob(snapshot_export_objects(context.scene.objects), filepath,
+                            functools.partial(write_incremental_csv, export_format), binary=True,
+                            finish=functools.partial(finish_incremental_export, export_format))
+
+    def execute(self, context):
+        job = self.make_job(context)
+        job.run()
+        if job.error:
+            self.report({'ERROR'}, f"Export failed: {job.error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported properties of {job.total} objects to {job.filepath} ({job.summary})")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        self._job = self.make_job(context)
+        return start_background_export(self, context)
+
+    def modal(self, context, event):
+        return poll_background_export(self, context, event)
+
+    def cancel(self, context):
+        stop_background_export(self, context)
+
+
+#################################################### Partitioned export
+
+PARTITION_DIRECTORY = "all_objects_properties_partitions"
+
+PARTITION_INDEX_FIELDS = ['partition', 'file', 'objects', 'rows', 'sha256']
+
+# Worker processes writing partitions, spawned with Blender's own Python (sys.executable)
+PARTITION_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def partition_snapshot(snapshot, partition_by):
+    """Group snapshot entries by work package, category or both, keeping the scene order within a group"""
+    partitions = {}
+    for entry in snapshot:
+        name, mn_value, category, work_package, rows = entry
+        if partition_by == 'WORK_PACKAGE':
+            key = (work_package,)
+        elif partition_by == 'CATEGORY':
+            key = (category,)
+        else:
+            key = (work_package, category)
+        partitions.setdefault(key, []).append(entry)
+    return partitions
+
+
+def partition_filename(key):
+    name = "__".join(key)
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name) + ".csv"
+
+
+def remove_partition_files(paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def remove_stale_partitions(directory, keep):
+    """Delete partition files of earlier exports that this export didn't write"""
+    for filename in os.listdir(directory):
+        if filename.endswith(".csv") and filename not in keep:
+            os.remove(os.path.join(directory, filename))
+
+
+def write_partitioned_csv(export_format, partition_by, job, csvfile):
+    """Write every partition file in a process pool, then the index of them to csvfile.
+
+    Encoding is pure-Python work that holds the GIL, so the partitions go to worker
+    processes instead of threads. Workers get the plain snapshot tuples and write
+    <file>.part; the files are moved into place only once every partition is done,
+    so a cancelled or failed export leaves the previous export as it was.
+    """
+    directory = os.path.dirname(job.filepath)
+    partitions = partition_snapshot(job.snapshot, partition_by)
+    filenames = {key: partition_filename(key) for key in partitions}
+    temp_paths = {key: os.path.join(directory, f"{filename}.part") for key, filename in filenames.items()}
+    results = []
+    try:
+        # Spawned workers only import csv_export_rows, they never see the namespace main.py exec'd into
+        with ProcessPoolExecutor(max_workers=min(PARTITION_WORKERS, max(len(partitions), 1)),
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            pending = {
+                pool.submit(csv_export_rows.write_partition_file, export_format, temp_paths[key],
+                            entries, EXPORT_BATCH_SIZE): key
+                for key, entries in partitions.items()
+            }
+            while pending and not job.cancelled():
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    results.append((key, (filenames[key], *future.result())))
+                    job.done += len(partitions[key])
+            for future in pending:
+                future.cancel()
+    except Exception:
+        remove_partition_files(temp_paths.values())
+        raise
+
+    if job.cancelled():
+        remove_partition_files(temp_paths.values())
+        return
+
+    for key, temp_path in temp_paths.items():
+        os.replace(temp_path, os.path.join(directory, filenames[key]))
+    remove_stale_partitions(directory, set(filenames.values()) | {os.path.basename(job.filepath)})
+
+    writer = csv.writer(csvfile)
+    writer.writerow(PARTITION_INDEX_FIELDS)
+    for key, result in sorted(results):
+        writer.writerow([" / ".join(key), *result])
+    job.summary = f"{len(results)} partitions"
+
+
+# Operator to export one CSV per work package and/or category, plus an index file
+class ExportAllObjectsCSVPartitioned(bpy.types.Operator):
+    """Export all objects to one CSV file per work package and/or category"""
+    bl_idname = "export.all_objects_csv_partitioned"
+    bl_label = "Export All Objects to CSV (Partitioned)"
+
+    partition_by: bpy.props.EnumProperty(
+        name="Partition By",
+        items=[
+            ('WORK_PACKAGE', "Work Package", "One file per work package"),
+            ('CATEGORY', "Category", "One file per category"),
+            ('BOTH', "Work Package and Category", "One file per work package and category"),
+        ],
+        default='WORK_PACKAGE'
+    )
+
+    _timer = None
+    _job = None
+
+    def make_job(self, context):
+        export_format = context.scene.csv_export_format
+        directory = os.path.join(bpy.path.abspath("//"), PARTITION_DIRECTORY)
+        if export_format == 'WIDE':
+            directory = f"{directory}_wide"
+        os.makedirs(directory, exist_ok=True)
+        return CSVExportJob(snapshot_export_objects(context.scene.objects), os.path.join(directory, "index.csv"),
+                            functools.partial(write_partitioned_csv, export_format, self.partition_by))
+
+    def execute(self, context):
+        job = self.make_job(context)
+        job.run()
+        if job.error:
+            self.report({'ERROR'}, f"Export failed: {job.error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Exported properties of {job.total} objects to {job.filepath} ({job.summary})")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        self._job = self.make_job(context)
+        return start_background_export(self, context)
+
+    def modal(self, context, event):
+        return poll_background_export(self, context, event)
+
+    def cancel(self, context):
+        stop_background_export(self, context)
+
+
+def register():
+    bpy.utils.register_class(ExportAllObjectsCSVIncremental)
+    bpy.utils.register_class(ExportAllObjectsCSVPartitioned)
+
+def unregister():
+    bpy.utils.unregister_class(ExportAllObjectsCSVIncremental)
+    bpy.utils.unregister_class(ExportAllObjectsCSVPartitioned)
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,405 @@
+###################################################################### CSV import
+import bpy
+import os
+import csv
+import time
+import threading
+
+
+# Lines read between progress updates / cancel checks of the reader thread
+IMPORT_BATCH_SIZE = 5000
+# Main-thread time spent writing properties per timer tick, in seconds
+IMPORT_APPLY_BUDGET = 0.02
+
+DOCUMENT_ROW_FIELDS = DOCUMENT_COLUMNS + ["local_file"]
+IMPORT_DIFF_FIELDS = ['object_name', 'csv_object_name', 'field', 'old_value', 'new_value']
+
+
+def import_diff_path_for(filepath):
+    return f"{os.path.splitext(filepath)[0]}_import_diff.csv"
+
+
+def build_import_index(snapshot):
+    """Hash index of an export snapshot: object name -> entry, MN -> object names"""
+    by_name = {}
+    by_mn = {}
+    for entry in snapshot:
+        by_name[entry[0]] = entry
+        if entry[1]:
+            by_mn.setdefault(entry[1], []).append(entry[0])
+    return by_name, by_mn
+
+
+def parse_long_property(property_name, line_number):
+    """(row, col) of a custom_string_{row}_{col} property name"""
+    if property_name.startswith("custom_string_"):
+        try:
+            i, col = (int(part) for part in property_name[len("custom_string_"):].split("_"))
+        except ValueError:
+            pass
+        else:
+            if 1 <= col <= len(DOCUMENT_COLUMNS):
+                return i, col
+    raise ValueError(f"Line {line_number}: unknown property '{property_name}'")
+
+
+def read_import_records(job, csvfile):
+    """Stream a long or wide format export into (format, {object_name: record})"""
+    reader = csv.reader(csvfile)
+    header = next(reader, None)
+    if header == LONG_FORMAT_FIELDS:
+        export_format = 'LONG'
+    elif header == WIDE_FORMAT_FIELDS:
+        export_format = 'WIDE'
+    else:
+        raise ValueError("Header does not match the long or wide export format")
+
+    records = {}
+    line_number = 1
+    for line_number, line in enumerate(reader, 2):
+        if line_number % IMPORT_BATCH_SIZE == 0:
+            job.done = line_number - 1
+            if job.cancelled():
+                return export_format, records
+        if not line:
+            continue
+        if len(line) != len(header):
+            raise ValueError(f"Line {line_number}: expected {len(header)} columns, got {len(line)}")
+
+        name, mn_value, category, work_package = line[:4]
+        record = records.get(name)
+        if record is None:
+            # Document rows by their position in the file, 1-based like custom_string_{row}_{col}
+            record = records[name] = {"mn": mn_value, "category": category, "work_package": work_package, "rows": {}}
+
+        if export_format == 'LONG':
+            property_name, value = line[4:]
+            # Rows without a property are the placeholder of an object without documents
+            if property_name:
+                i, col = parse_long_property(property_name, line_number)
+                record["rows"].setdefault(i, {})[DOCUMENT_COLUMNS[col - 1]] = value
+        elif any(line[4:]):
+            # A wide line with every document field empty is an object without documents
+            record["rows"][len(record["rows"]) + 1] = dict(zip(DOCUMENT_ROW_FIELDS, line[4:]))
+
+    job.done = line_number - 1
+    return export_format, records
+
+
+def import_document_rows(export_format, imported, current):
+    """Full document rows of an import record, current rows are those of the matched object"""
+    rows = []
+    for position, i in enumerate(sorted(imported)):
+        doc = dict.fromkeys(DOCUMENT_ROW_FIELDS, "")
+        doc.update(imported[i])
+        # The long format has no file column, keep the file of the row at the same position
+        if export_format == 'LONG' and position < len(current):
+            doc["local_file"] = current[position]["local_file"]
+        rows.append(doc)
+    return rows
+
+
+def full_document_rows(rows):
+    """Document rows with every field present, so rows read from a snapshot compare equal to imported ones"""
+    return [dict(dict.fromkeys(DOCUMENT_ROW_FIELDS, ""), **doc) for doc in rows]
+
+
+def document_row_text(doc):
+    return " | ".join(doc[name] for name in DOCUMENT_ROW_FIELDS) if doc else ""
+
+
+def diff_import_records(export_format, records, snapshot):
+    """Match records to the snapshot by name, then by MN, returns (updates, diff report lines, summary).
+
+    Every update is (object name, {field: new value}, {field: snapshot value}), the
+    snapshot values are checked against the live object before anything is written.
+    """
+    by_name, by_mn = build_import_index(snapshot)
+    updates = []
+    report = []
+    unchanged = 0
+    unmatched = 0
+    ambiguous = 0
+
+    # object name -> [(csv name, record)] of every record resolving to it
+    targets = {}
+    for csv_name, record in records.items():
+        entry = by_name.get(csv_name)
+        if entry is None:
+            # Renamed objects are still found through their MN, as long as it is unique
+            candidates = by_mn.get(record["mn"], []) if record["mn"] else []
+            if len(candidates) != 1:
+                reason = f"MN shared by {len(candidates)} objects" if candidates else "no object with this name or MN"
+                report.append(("", csv_name, "unmatched", "", reason))
+                unmatched += 1
+                continue
+            entry = by_name[candidates[0]]
+        targets.setdefault(entry[0], []).append((csv_name, record))
+
+    for name, matched in targets.items():
+        if len(matched) > 1:
+            # One record by name and another by MN, applying both would let the last one silently win
+            csv_names = ", ".join(csv_name for csv_name, _ in matched)
+            for csv_name, _ in matched:
+                report.append((name, csv_name, "ambiguous", "", f"{len(matched)} records match this object ({csv_names}), skipped"))
+            ambiguous += 1
+            continue
+
+        csv_name, record = matched[0]
+        _, mn_value, category, work_package, current = by_name[name]
+        current = full_document_rows(current)
+        update = {}
+        base = {}
+
+        if record["mn"] != mn_value:
+            update["mn"] = record["mn"]
+            base["mn"] = mn_value
+            report.append((name, csv_name, "MN", mn_value, record["mn"]))
+
+        for field, items, label in (("category", EXPORT_CATEGORY_ITEMS, category),
+                                    ("work_package", EXPORT_WORK_PACKAGE_ITEMS, work_package)):
+            new_label = record[field]
+            if new_label == label or new_label == "Invalid selection":
+                continue
+            if new_label not in items:
+                report.append((name, csv_name, field, label, f"unknown value '{new_label}', skipped"))
+                continue
+            update[field] = items.index(new_label)
+            base[field] = label
+            report.append((name, csv_name, field, label, new_label))
+
+        rows = import_document_rows(export_format, record["rows"], current)
+        if rows != current:
+            update["rows"] = rows
+            base["rows"] = current
+            for i in range(max(len(rows), len(current))):
+                old = current[i] if i < len(current) else None
+                new = rows[i] if i < len(rows) else None
+                if old != new:
+                    report.append((name, csv_name, f"document_{i + 1}", document_row_text(old), document_row_text(new)))
+
+        if update:
+            updates.append((name, update, base))
+        else:
+            unchanged += 1
+
+    summary = f"{len(updates)} objects to update, {unchanged} unchanged, {unmatched} unmatched, {ambiguous} ambiguous"
+    return updates, report, summary
+
+
+def stale_import_fields(obj, base):
+    """Fields the user changed in Blender since the import was read, their imported values would overwrite that edit"""
+    _, mn_value, category, work_package, rows = snapshot_export_objects([obj])[0]
+    live = {"mn": mn_value, "category": category, "work_package": work_package}
+    stale = [field for field in ("mn", "category", "work_package") if field in base and live[field] != base[field]]
+    if "rows" in base and full_document_rows(rows) != base["rows"]:
+        stale.append("rows")
+    return stale
+
+
+def apply_import_update(obj, update, base):
+    """Write one object's imported values, must run on the main thread.
+    Fields changed since the import was read are kept as they are, returns their names"""
+    stale = stale_import_fields(obj, base)
+    update = {field: value for field, value in update.items() if field not in stale}
+    if "mn" in update:
+        obj.mn_custom_string = update["mn"]
+    if "category" in update:
+        obj.dropdown_list2 = str(update["category"])
+    if "work_package" in update:
+        obj.dropdown_list1 = str(update["work_package"])
+    if "rows" in update:
+        migrate_document_rows(obj)
+        obj.document_rows.clear()
+        for doc in update["rows"]:
+            row = obj.document_rows.add()
+            for name, value in doc.items():
+                setattr(row, name, value)
+    invalidate_document_rows(obj)
+    return stale
+
+
+def apply_import_updates(objects, updates, skipped):
+    """Apply (name, update, base) entries, collecting "object: field" for everything left alone in skipped"""
+    for name, update, base in updates:
+        obj = objects.get(name)
+        if obj is None:
+            skipped.append(f"{name}: object no longer exists")
+            continue
+        skipped.extend(f"{name}: {field} changed in Blender" for field in apply_import_update(obj, update, base))
+
+
+def import_result_message(job, skipped):
+    for line in skipped:
+        print(f"Import skipped {line}")
+    message = f"Imported {job.filepath}: {job.summary}"
+    if skipped:
+        message += f", {len(skipped)} skipped because they changed while the file was read (see console)"
+    return message
+
+
+class CSVImportJob:
+    """Reads and diffs an import file on a worker thread, writing the diff report next to it.
+
+    Only the snapshot taken on the main thread is compared against, nothing in
+    bpy is touched until the updates are applied by the operator, which checks
+    each field against the live object first.
+    """
+
+    def __init__(self, snapshot, filepath):
+        self.snapshot = snapshot
+        self.filepath = filepath
+        self.report_path = import_diff_path_for(filepath)
+        self.done = 0  # Lines read
+        self.error = None
+        self.summary = None
+        self.updates = []
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def finished(self):
+        return not self.thread.is_alive()
+
+    def run(self):
+        temp_path = f"{self.report_path}.part"
+        try:
+            # utf-8-sig also reads files saved back from Excel with a BOM
+            with open(self.filepath, 'r', newline='', encoding='utf-8-sig') as csvfile:
+                export_format, records = read_import_records(self, csvfile)
+            if self.cancelled():
+                return
+
+            self.updates, report, self.summary = diff_import_records(export_format, records, self.snapshot)
+            with open(temp_path, 'w', newline='', encoding='utf-8') as report_file:
+                writer = csv.writer(report_file)
+                writer.writerow(IMPORT_DIFF_FIELDS)
+                writer.writerows(report)
+            os.replace(temp_path, self.report_path)
+        except Exception as e:
+            self.error = e
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+# Operator to import object properties from an exported and edited CSV file
+class ImportObjectsCSV(bpy.types.Operator):
+    """Import MN, category, work package and documents from a long or wide format CSV.
+    A diff report is always written next to the file, changes are only written when Apply is set"""
+    bl_idname = "import.objects_csv"
+    bl_label = "Import Objects from CSV"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    filter_glob: bpy.props.StringProperty(default="*.csv", options={'HIDDEN'})
+    apply: bpy.props.BoolProperty(
+        name="Apply",
+        description="Write the imported values, otherwise only the diff report is written",
+        default=False
+    )
+
+    _timer = None
+    _job = None
+    _position = None
+    _skipped = None
+
+    def execute(self, context):
+        self._job = CSVImportJob(snapshot_export_objects(context.scene.objects), self.filepath)
+
+        # Without a window (scripts, background mode) everything runs right here
+        if context.window is None:
+            job = self._job
+            job.run()
+            if job.error:
+                self.report({'ERROR'}, f"Import failed: {job.error}")
+                return {'CANCELLED'}
+            if not self.apply:
+                self.report({'INFO'}, f"Dry run: {job.summary}, diff written to {job.report_path}")
+                return {'CANCELLED'}
+            skipped = []
+            apply_import_updates(context.scene.objects, job.updates, skipped)
+            self.report({'INFO'}, import_result_message(job, skipped))
+            return {'FINISHED'}
+
+        self._job.start()
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        job = self._job
+        if self._position is None:
+            if event.type == 'ESC':
+                job.cancel()
+            if event.type != 'TIMER':
+                return {'PASS_THROUGH'}
+            if not job.finished():
+                context.workspace.status_text_set(f"Reading CSV: {job.done} lines (ESC to cancel)")
+                return {'PASS_THROUGH'}
+
+            if job.error:
+                self.stop(context)
+                self.report({'ERROR'}, f"Import failed: {job.error}")
+                return {'CANCELLED'}
+            if job.cancelled():
+                self.stop(context)
+                self.report({'WARNING'}, "Import cancelled")
+                return {'CANCELLED'}
+            if not self.apply or not job.updates:
+                # Nothing was written, so no undo step either
+                self.stop(context)
+                self.report({'INFO'}, f"Dry run: {job.summary}, diff written to {job.report_path}")
+                return {'CANCELLED'}
+            self._position = 0
+            self._skipped = []
+
+        # Other input waits until every update is written, so it can't end up inside the import's undo step
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        scene = context.scene
+        deadline = time.perf_counter() + IMPORT_APPLY_BUDGET
+        while self._position < len(job.updates):
+            apply_import_updates(scene.objects, job.updates[self._position:self._position + 1], self._skipped)
+            self._position += 1
+            if time.perf_counter() >= deadline:
+                context.workspace.status_text_set(f"Importing CSV: {self._position}/{len(job.updates)} objects")
+                return {'RUNNING_MODAL'}
+
+        self.stop(context)
+        self.report({'INFO'}, import_result_message(job, self._skipped))
+        return {'FINISHED'}
+
+    def cancel(self, context):
+        self.stop(context)
+
+    def stop(self, context):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        if self._job and not self._job.finished():
+            self._job.cancel()
+        context.workspace.status_text_set(None)
+
+
+def register():
+    bpy.utils.register_class(ImportObjectsCSV)
+
+def unregister():
+    bpy.utils.unregister_class(ImportObjectsCSV)
+
+if __name__ == "__main__":
+    register()
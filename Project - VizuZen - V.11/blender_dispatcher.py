@@ -0,0 +1,168 @@
+###################################################################### Main-thread RPC dispatcher
+import bpy
+import eel
+import time
+import threading
+import traceback
+import functools
+from collections import deque
+from concurrent.futures import Future
+
+
+# Main-thread time spent on queued RPCs per timer tick, in seconds; a call is never split,
+# so a single slow call can overrun it, but a burst of calls is spread over several ticks
+RPC_TICK_BUDGET = 0.01
+# Seconds between checks of a queued call from eel's thread
+RPC_POLL_INTERVAL = 0.005
+
+
+class MainThreadDispatcher:
+    """Runs eel-exposed functions on Blender's main thread instead of eel's server thread.
+
+    eel's thread only queues the call as a Future and yields (eel.sleep) until it is
+    done, the queue is drained in call order from a bpy.app.timers callback that
+    stops taking new calls once the tick budget is used up. The timer is only
+    registered while calls are queued: the submit that finds the queue empty
+    registers it and the tick that empties the queue ends it. Every registration
+    is a new callable, so a submit racing the last tick never finds the finishing
+    timer still registered and skips its own. A call that returns a Future (an
+    operation waiting for a retry) is answered when that Future is done.
+    """
+
+    def __init__(self):
+        self.queue = deque()  # (func, args, kwargs, future, queued at)
+        self.lock = threading.Lock()
+        self.running = None   # Function of the call being run, so it can hand back a Future
+        self.accepting = False  # Calls submitted while stopped fail right away instead of waiting forever
+        self.timer = None     # Callable of the current registration, None while the queue is drained
+        self.stats = {"calls": 0, "errors": 0, "max_queue": 0, "total_wait": 0.0, "max_wait": 0.0,
+                      "total_run": 0.0, "max_run": 0.0, "busy_ticks": 0}
+
+    def start(self):
+        with self.lock:
+            self.accepting = True
+
+    def wake(self):
+        timer = self.timer = lambda: self.tick()
+        bpy.app.timers.register(timer, first_interval=0.0, persistent=True)
+
+    def submit(self, func, args=(), kwargs=None):
+        future = Future()
+        with self.lock:
+            if not self.accepting:
+                future.set_exception(RuntimeError("Main-thread dispatcher is not running"))
+                return future
+            self.queue.append((func, args, kwargs or {}, future, time.perf_counter()))
+            self.stats["max_queue"] = max(self.stats["max_queue"], len(self.queue))
+            wake = self.timer is None
+            if wake:
+                self.timer = True  # Claimed, wake() puts the real callable in place
+        if wake:
+            self.wake()
+        return future
+
+    def call(self, func, args=(), kwargs=None):
+        """Run func on the main thread and return its result, right away when already on it"""
+        if threading.current_thread() is threading.main_thread():
+            return func(*args, **(kwargs or {}))
+        future = self.submit(func, args, kwargs)
+        # eel's calls share one thread, yield to them instead of blocking it
+        while not future.done():
+            eel.sleep(RPC_POLL_INTERVAL)
+        return future.result()
+
+    def is_running(self, func):
+        return self.running is func
+
+    def run(self, func, args, kwargs, future, queued_at):
+        started = time.perf_counter()
+        self.running = func
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            print(f"Error in {func.__name__}: {e}")
+            traceback.print_exc()
+            self.stats["errors"] += 1
+            future.set_exception(e)
+            return
+        finally:
+            self.running = None
+            finished = time.perf_counter()
+            self.record(started - queued_at, finished - started)
+
+        if isinstance(result, Future):
+            result.add_done_callback(lambda done: future.set_result(done.result()))
+        else:
+            future.set_result(result)
+
+    def record(self, wait, run):
+        stats = self.stats
+        stats["calls"] += 1
+        stats["total_wait"] += wait
+        stats["max_wait"] = max(stats["max_wait"], wait)
+        stats["total_run"] += run
+        stats["max_run"] = max(stats["max_run"], run)
+
+    def tick(self):
+        deadline = time.perf_counter() + RPC_TICK_BUDGET
+        while True:
+            with self.lock:
+                if not self.queue:
+                    self.timer = None
+                    return None
+                item = self.queue.popleft()
+            self.run(*item)
+            if time.perf_counter() >= deadline:
+                break
+
+        # Out of budget, let Blender redraw and handle input before the rest of the queue
+        self.stats["busy_ticks"] += 1
+        return 0.0
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        with self.lock:
+            stats["queued"] = len(self.queue)
+        calls = stats["calls"]
+        stats["average_wait"] = stats["total_wait"] / calls if calls else 0.0
+        stats["average_run"] = stats["total_run"] / calls if calls else 0.0
+        return stats
+
+    def stop(self):
+        with self.lock:
+            timer, self.timer = self.timer, None
+        if callable(timer) and bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+        with self.lock:
+            self.accepting = False
+            pending = list(self.queue)
+            self.queue.clear()
+        for item in pending:
+            item[3].set_exception(RuntimeError("Main-thread dispatcher stopped"))
+
+
+# Re-running the script must not leave the previous dispatcher's timer behind
+if "main_thread_dispatcher" in globals():
+    main_thread_dispatcher.stop()
+
+main_thread_dispatcher = MainThreadDispatcher()
+
+
+def main_thread_rpc(func):
+    """Decorator for eel-exposed functions that touch bpy, the call runs on Blender's main thread"""
+    @functools.wraps(func)  # eel exposes the function under its name
+    def dispatched(*args, **kwargs):
+        return main_thread_dispatcher.call(func, args, kwargs)
+    return dispatched
+
+
+def register():
+    main_thread_dispatcher.start()
+
+
+def unregister():
+    main_thread_dispatcher.stop()
+
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,150 @@
+###################################################################### Outbound event bus
+import eel
+import time
+import itertools
+import threading
+from collections import OrderedDict, deque
+
+
+# At most one websocket message per display frame
+EVENT_BATCH_INTERVAL = 1.0 / 60.0
+# Batches the browser hasn't answered yet before it counts as behind and events pile up here
+EVENT_MAX_IN_FLIGHT = 4
+# Seconds before an unanswered batch is given up on (closed window, no browser connected)
+EVENT_ACK_TIMEOUT = 5.0
+# Queued events while the browser is behind, beyond that the backlog is replaced by one resync event
+EVENT_QUEUE_LIMIT = 500
+
+# Key prefix of events that are never coalesced
+UNKEYED = object()
+
+
+class OutboundEventBus:
+    """Events for the web UI, sent from a thread of their own so publishing never waits on the browser.
+
+    Handlers and timers call publish() and return right away. The sender thread
+    sends everything queued as one receiveEvents(batch) call per EVENT_BATCH_INTERVAL,
+    without waiting for the reply; replies only count how far behind the browser is.
+    Events published with a key replace the queued event with the same key (the
+    latest frame, one preview per camera slot), so a slow browser gets the latest
+    state instead of every step. Unkeyed events that overflow the queue are dropped
+    and replaced by a "resync" event, after which the page fetches its state again.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.events = OrderedDict()  # key -> event, unkeyed events get a unique key
+        self.unkeyed = itertools.count()
+        self.in_flight = deque()     # send times of unanswered batches
+        self.running = False
+        self.thread = None
+        self.stats = {"published": 0, "coalesced": 0, "dropped": 0, "batches": 0, "sent": 0,
+                      "timeouts": 0, "errors": 0}
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def publish(self, event_type, payload=None, key=None, supersedes=()):
+        """Queue an event, `supersedes` lists event types made obsolete by this one"""
+        with self.condition:
+            self.stats["published"] += 1
+            if supersedes:
+                for stale in [k for k, event in self.events.items() if event["type"] in supersedes]:
+                    del self.events[stale]
+                    self.stats["coalesced"] += 1
+            if key is None:
+                key = (UNKEYED, next(self.unkeyed))
+            elif self.events.pop(key, None) is not None:
+                self.stats["coalesced"] += 1
+            self.events[key] = {"type": event_type, "payload": payload}
+            if len(self.events) > EVENT_QUEUE_LIMIT:
+                self.drop_backlog()
+            self.condition.notify()
+
+    def drop_backlog(self):
+        for stale in [key for key in self.events if isinstance(key, tuple) and key[0] is UNKEYED]:
+            del self.events[stale]
+            self.stats["dropped"] += 1
+        self.events["resync"] = {"type": "resync", "payload": None}
+
+    def acknowledge(self, result=None):
+        with self.condition:
+            if self.in_flight:
+                self.in_flight.popleft()
+            self.condition.notify()
+
+    def expire(self, now):
+        while self.in_flight and now - self.in_flight[0] > EVENT_ACK_TIMEOUT:
+            self.in_flight.popleft()
+            self.stats["timeouts"] += 1
+
+    def next_batch(self):
+        with self.condition:
+            while True:
+                if not self.running:
+                    return None
+                self.expire(time.monotonic())
+                if self.events and len(self.in_flight) < EVENT_MAX_IN_FLIGHT:
+                    break
+                self.condition.wait(EVENT_ACK_TIMEOUT if self.in_flight else None)
+            batch = list(self.events.values())
+            self.events.clear()
+            self.in_flight.append(time.monotonic())
+            self.stats["batches"] += 1
+            self.stats["sent"] += len(batch)
+            return batch
+
+    def run(self):
+        while True:
+            batch = self.next_batch()
+            if batch is None:
+                return
+            try:
+                # The callback makes the call return right away, the reply arrives on eel's thread
+                eel.receiveEvents(batch)(self.acknowledge)
+            except Exception as e:
+                with self.condition:
+                    if self.in_flight:
+                        self.in_flight.pop()
+                    self.stats["errors"] += 1
+                if self.stats["errors"] == 1:
+                    print(f"Error sending events to the web UI: {e}")
+            time.sleep(EVENT_BATCH_INTERVAL)
+
+    def get_stats(self):
+        with self.condition:
+            return dict(self.stats, queued=len(self.events), in_flight=len(self.in_flight))
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.events.clear()
+            self.in_flight.clear()
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+
+# Re-running the script must not leave the previous bus's sender thread behind
+if "event_bus" in globals():
+    event_bus.stop()
+
+event_bus = OutboundEventBus()
+
+
+def register():
+    event_bus.start()
+
+
+def unregister():
+    event_bus.stop()
+
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,116 @@
+###################################################################### Timeline marker index
+import bpy
+import array
+import bisect
+
+
+# Markers of the scene sorted by frame, so navigation is a binary search instead of a scan
+marker_index = {
+    "scene": None,              # as_pointer() of the scene the index was built for
+    "raw": array.array('i'),    # marker frames in collection order, compared to spot any change
+    "raw_names": [],            # marker names in collection order, compared to spot renames
+    "frames": [],               # sorted marker frames
+    "names": [],                # marker names, in the order of frames
+    "rebuilds": 0,
+}
+
+# UI marker id (section id or 'start') -> as_pointer() of the Blender marker it was last synced to,
+# so update_markers can tell a moved and renamed section from a removed and added one
+marker_bindings = {}
+
+
+def read_marker_frames(markers):
+    frames = array.array('i', bytes(4 * len(markers)))
+    markers.foreach_get("frame", frames)
+    return frames
+
+
+def ensure_marker_index(scene):
+    """Index of the scene's markers, rebuilt when a marker was added, removed, moved or renamed.
+
+    Markers don't show up in depsgraph updates reliably, so every query reads the
+    frames in one foreach_get and compares them to the indexed ones, a C-level
+    copy and compare. Names can't be read with foreach_get, so they are read in a
+    list comprehension and compared too, that catches renames and is still far
+    cheaper than the sort of a rebuild.
+    """
+    markers = scene.timeline_markers
+    raw = read_marker_frames(markers)
+    raw_names = [marker.name for marker in markers]
+    if (marker_index["scene"] == scene.as_pointer() and marker_index["raw"] == raw
+            and marker_index["raw_names"] == raw_names):
+        return marker_index
+
+    entries = sorted(zip(raw, raw_names))
+    marker_index.update(
+        scene=scene.as_pointer(),
+        raw=raw,
+        raw_names=raw_names,
+        frames=[frame for frame, name in entries],
+        names=[name for frame, name in entries],
+    )
+    marker_index["rebuilds"] += 1
+    return marker_index
+
+
+def invalidate_marker_index():
+    """Force a rebuild on next use"""
+    marker_index["scene"] = None
+
+
+def next_marker_frame(scene, frame):
+    """Frame of the first marker after `frame`, None if there is none"""
+    frames = ensure_marker_index(scene)["frames"]
+    i = bisect.bisect_right(frames, frame)
+    return frames[i] if i < len(frames) else None
+
+
+def previous_marker_frame(scene, frame):
+    """Frame of the last marker before `frame`, None if there is none"""
+    frames = ensure_marker_index(scene)["frames"]
+    i = bisect.bisect_left(frames, frame)
+    return frames[i - 1] if i > 0 else None
+
+
+def nearest_marker_frame(scene, frame):
+    """Frame of the marker closest to `frame` (the earlier one on a tie), None without markers"""
+    frames = ensure_marker_index(scene)["frames"]
+    i = bisect.bisect_left(frames, frame)
+    candidates = frames[max(i - 1, 0):i + 1]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda candidate: (abs(candidate - frame), candidate))
+
+
+def markers_in_range(scene, start, end):
+    """(frame, name) of every marker with start <= frame <= end, sorted by frame"""
+    index = ensure_marker_index(scene)
+    frames = index["frames"]
+    lo = bisect.bisect_left(frames, start)
+    hi = bisect.bisect_right(frames, end)
+    return list(zip(frames[lo:hi], index["names"][lo:hi]))
+
+
+@bpy.app.handlers.persistent
+def reset_marker_index(dummy):
+    """Undo, redo and file loads replace the scene, including renamed markers"""
+    invalidate_marker_index()
+    marker_bindings.clear()
+
+
+def register():
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_marker_index not in handlers:
+            handlers.append(reset_marker_index)
+
+
+def unregister():
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_marker_index in handlers:
+            handlers.remove(reset_marker_index)
+    invalidate_marker_index()
+    marker_bindings.clear()
+
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,133 @@
+###################################################################### Category / work package index
+import bpy
+
+
+# Inverted index of the indexed scene: dropdown_list2 (category) and dropdown_list1
+# (work package) values to object names, kept current from the scene change collector
+object_index = {
+    "scene": None,         # as_pointer() of the indexed scene
+    "objects": {},         # object name -> (category, work_package)
+    "category": {},        # category -> set of object names
+    "work_package": {},    # work package -> set of object names
+}
+
+
+def read_object_classification(obj):
+    """Raw (category, work_package) enum indices of an object, None where the value is invalid"""
+    classification = []
+    for key in ("dropdown_list2", "dropdown_list1"):
+        try:
+            classification.append(int(obj.get(key, 0)))
+        except (TypeError, ValueError):
+            classification.append(None)
+    return tuple(classification)
+
+
+def index_add(obj):
+    name = obj.name
+    category, work_package = read_object_classification(obj)
+    object_index["objects"][name] = (category, work_package)
+    object_index["category"].setdefault(category, set()).add(name)
+    object_index["work_package"].setdefault(work_package, set()).add(name)
+
+
+def index_remove(name):
+    entry = object_index["objects"].pop(name, None)
+    if entry is None:
+        return
+    category, work_package = entry
+    object_index["category"].get(category, set()).discard(name)
+    object_index["work_package"].get(work_package, set()).discard(name)
+
+
+def rebuild_object_index(scene):
+    """Full scan of the scene, done once per file load or scene switch"""
+    object_index.update(scene=scene.as_pointer(), objects={}, category={}, work_package={})
+    for obj in scene.objects:
+        index_add(obj)
+
+
+def ensure_object_index(scene):
+    if object_index["scene"] != scene.as_pointer():
+        rebuild_object_index(scene)
+
+
+def get_object_classification(obj):
+    """(category, work_package) of an object, from the index when it is indexed"""
+    entry = object_index["objects"].get(obj.name)
+    if entry is None:
+        return read_object_classification(obj)
+    return entry
+
+
+def get_objects_in_category(scene, category):
+    ensure_object_index(scene)
+    return object_index["category"].get(int(category), set())
+
+
+def get_objects_in_work_package(scene, work_package):
+    ensure_object_index(scene)
+    return object_index["work_package"].get(int(work_package), set())
+
+
+def update_object_index(scene, changes):
+    """Re-index the objects touched, added, removed or renamed by a scene update"""
+    if changes["reset"]:
+        # Undo, redo and file loads replace the objects, so the index is built again
+        rebuild_object_index(scene)
+        return
+    if object_index["scene"] != scene.as_pointer():
+        return
+
+    for name in changes["removed"] | changes["renamed"].keys():
+        index_remove(name)
+    for name in changes["touched"].keys() | changes["added"]:
+        index_remove(name)
+        obj = scene.objects.get(name)
+        if obj is not None:
+            index_add(obj)
+
+
+# Debug operator to check the index against a full scan of the scene
+class OBJECT_OT_VerifyObjectIndex(bpy.types.Operator):
+    """Compare the category / work package index with a full scan of the scene"""
+    bl_idname = "object.verify_object_index"
+    bl_label = "Verify Object Index"
+
+    def execute(self, context):
+        scene = context.scene
+        ensure_object_index(scene)
+
+        expected = {obj.name: read_object_classification(obj) for obj in scene.objects}
+        indexed = object_index["objects"]
+        mismatches = {name for name in expected.keys() | indexed.keys() if expected.get(name) != indexed.get(name)}
+
+        # The inverted sets must agree with the per-object entries as well
+        for position, key in enumerate(("category", "work_package")):
+            for value, names in object_index[key].items():
+                mismatches.update(name for name in names if name not in expected or expected[name][position] != value)
+                mismatches.update(name for name, entry in expected.items() if entry[position] == value and name not in names)
+
+        if mismatches:
+            for name in sorted(mismatches):
+                print(f"Object index mismatch: {name} indexed as {indexed.get(name)}, scene has {expected.get(name)}")
+            self.report({'WARNING'}, f"Object index out of date for {len(mismatches)} objects, rebuilt")
+            rebuild_object_index(scene)
+        else:
+            self.report({'INFO'}, f"Object index matches the scene ({len(expected)} objects)")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(OBJECT_OT_VerifyObjectIndex)
+    scene_changes.add_listener("object_index", update_object_index)
+
+
+def unregister():
+    bpy.utils.unregister_class(OBJECT_OT_VerifyObjectIndex)
+    scene_changes.remove_listener("object_index")
+    object_index["scene"] = None
+
+
+if __name__ == "__main__":
+    register()
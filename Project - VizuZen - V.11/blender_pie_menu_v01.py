@@ -226,10 +226,9 @@ class WM_OT_custom_data_window(Operator):
         y_offset -= 25
         
         # Document Entries
-        i = 1
         row_height = 30
         
-        while any(f"custom_string_{i}_{col}" in obj.keys() for col in range(1, 5)):
+        for i, doc in enumerate(get_document_rows(obj), 1):
             row_color = self.HOVER_COLOR if i == self.hover_row else self.SECTION_BG
             self.draw_rounded_box(shader,
                                 section_x,
@@ -239,9 +238,8 @@ class WM_OT_custom_data_window(Operator):
                                 row_color)
             
             x_offset = section_x + 20
-            for col in range(1, 5):
-                prop_name = f'custom_string_{i}_{col}'
-                value = obj.get(prop_name, 'N/A')
+            for col, name in enumerate(DOCUMENT_COLUMNS, 1):
+                value = doc.get(name, 'N/A')
                 
                 if col == 3:  # Status column
                     self.draw_status_indicator(shader, x_offset, y_offset - 5, value)
@@ -255,7 +253,6 @@ class WM_OT_custom_data_window(Operator):
                 x_offset += section_width // 4
             
             y_offset -= row_height
-            i += 1
         
         gpu.state.blend_set('NONE')
     
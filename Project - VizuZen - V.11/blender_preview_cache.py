@@ -0,0 +1,143 @@
+###################################################################### Camera preview cache
+import bpy
+import uuid
+
+
+# Scene custom property holding the content stamp, saved with the file
+PREVIEW_STAMP_PROPERTY = "preview_content_stamp"
+
+# Last rendered preview of each camera, reused while the camera, frame and scene are unchanged
+preview_cache = {
+    "version": 0,      # Scene content version, bumped by depsgraph updates that can change a render
+    "stamped": {},     # scene as_pointer() -> version its stamp was made at
+    "entries": {},     # camera object name -> (key, preview store id)
+    "hits": 0,
+    "misses": 0,
+    "disk_hits": 0,
+}
+
+
+def scene_content_stamp(scene):
+    """Random stamp of the scene content, a new one is made on first use after a change.
+
+    Unlike the version counter it is saved with the file, so previews kept on disk
+    are still found after reopening, and edits that are never saved can't collide
+    with later ones.
+    """
+    pointer = scene.as_pointer()
+    if PREVIEW_STAMP_PROPERTY not in scene or preview_cache["stamped"].get(pointer) != preview_cache["version"]:
+        scene[PREVIEW_STAMP_PROPERTY] = uuid.uuid4().hex
+        preview_cache["stamped"][pointer] = preview_cache["version"]
+    return scene[PREVIEW_STAMP_PROPERTY]
+
+
+def preview_cache_key(camera_obj, scene):
+    """Everything a preview render of the camera depends on"""
+    camera = camera_obj.data
+    matrix = tuple(round(value, 6) for row in camera_obj.matrix_world for value in row)
+    lens = (camera.type, camera.lens, camera.ortho_scale, camera.sensor_width, camera.sensor_height,
+            camera.shift_x, camera.shift_y, camera.clip_start, camera.clip_end)
+    return (matrix, lens, scene.preview_engine, scene.frame_current, scene_content_stamp(scene))
+
+
+def lookup_preview(name, key, count=True):
+    entry = preview_cache["entries"].get(name)
+    # The image itself may have been evicted from the preview store since
+    hit = entry is not None and entry[0] == key and preview_store.has(entry[1])
+    if count:
+        preview_cache["hits" if hit else "misses"] += 1
+    return entry[1] if hit else None
+
+
+def store_preview(name, key, image):
+    preview_cache["entries"][name] = (key, image)
+
+
+def invalidate_previews(name=None):
+    """Drop the preview of one camera, or bump the scene version so every preview is re-rendered"""
+    if name is None:
+        preview_cache["version"] += 1
+        preview_cache["stamped"].clear()
+        preview_cache["entries"].clear()
+    else:
+        preview_cache["entries"].pop(name, None)
+
+
+def get_preview_cache_stats():
+    lookups = preview_cache["hits"] + preview_cache["misses"]
+    return {
+        "hits": preview_cache["hits"],
+        "misses": preview_cache["misses"],
+        "disk_hits": preview_cache["disk_hits"],
+        "hit_rate": preview_cache["hits"] / lookups if lookups else 0.0,
+        "entries": len(preview_cache["entries"]),
+        "version": preview_cache["version"],
+    }
+
+
+def is_scene_content_update(id_data):
+    # Cameras are part of the key already, and the preview render itself touches the scene
+    # (active camera, output path) and the Render Result image, so those don't count
+    if isinstance(id_data, (bpy.types.Scene, bpy.types.Camera)):
+        return False
+    if isinstance(id_data, bpy.types.Object) and id_data.type == 'CAMERA':
+        return False
+    if isinstance(id_data, bpy.types.Image) and id_data.type == 'RENDER_RESULT':
+        return False
+    return True
+
+
+@bpy.app.handlers.persistent
+def bump_preview_version_from_depsgraph(scene, depsgraph=None):
+    if depsgraph is None or any(is_scene_content_update(update.id.original) for update in depsgraph.updates):
+        preview_cache["version"] += 1
+
+
+@bpy.app.handlers.persistent
+def clear_preview_cache(dummy):
+    """Undo and redo can change anything, so nothing cached is valid anymore"""
+    invalidate_previews()
+
+
+@bpy.app.handlers.persistent
+def trust_loaded_stamps(dummy):
+    """Stamps of a freshly loaded file describe its content, previews on disk made with them still apply"""
+    preview_cache["entries"].clear()
+    preview_cache["stamped"] = {scene.as_pointer(): preview_cache["version"] for scene in bpy.data.scenes}
+
+
+@bpy.app.handlers.persistent
+def stamp_scenes_before_save(dummy):
+    """A stamp made before the last edits must not be saved as if it described them"""
+    for scene in bpy.data.scenes:
+        if PREVIEW_STAMP_PROPERTY in scene:
+            scene_content_stamp(scene)
+
+
+def register():
+    if bump_preview_version_from_depsgraph not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(bump_preview_version_from_depsgraph)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if clear_preview_cache not in handlers:
+            handlers.append(clear_preview_cache)
+    if trust_loaded_stamps not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(trust_loaded_stamps)
+    if stamp_scenes_before_save not in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.append(stamp_scenes_before_save)
+
+
+def unregister():
+    if bump_preview_version_from_depsgraph in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(bump_preview_version_from_depsgraph)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if clear_preview_cache in handlers:
+            handlers.remove(clear_preview_cache)
+    if trust_loaded_stamps in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(trust_loaded_stamps)
+    if stamp_scenes_before_save in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(stamp_scenes_before_save)
+    invalidate_previews()
+
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,306 @@
+###################################################################### Camera preview disk cache
+import bpy
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Previews kept next to the .blend, least recently used ones are deleted first
+PREVIEW_DISK_CACHE_MAX_MB = 512
+PREVIEW_DISK_SUFFIX = "_previews"
+PREVIEW_DISK_INDEX = "index.json"
+PREVIEW_DISK_INDEX_VERSION = 1
+
+
+def preview_disk_directory():
+    """<blend name>_previews next to the .blend, None for files that were never saved"""
+    if not bpy.data.filepath:
+        return None
+    directory, filename = os.path.split(bpy.data.filepath)
+    return os.path.join(directory, os.path.splitext(filename)[0] + PREVIEW_DISK_SUFFIX)
+
+
+def preview_fingerprint(key):
+    # Cameras with the same view share a preview, so the camera name is not part of it
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def write_file_atomic(path, data):
+    """Write to a temp file in the same directory and rename it over the target, readers never see half a file"""
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class PreviewDiskStore:
+    """Captured previews of a storyboard, kept across sessions in a directory next to the .blend.
+
+    Blobs are stored by preview store id (the hash of the PNG) under <id[:2]>/<id>.png,
+    the index maps preview cache fingerprints to ids and keeps the last use of every
+    blob for LRU eviction. Files are only written by a single worker thread, a blob
+    before any index that references it, and every file is replaced atomically; an
+    index entry whose blob is missing after a crash is dropped when it is loaded.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.directory = None
+        self.keys = {}               # fingerprint -> preview id
+        self.blobs = OrderedDict()   # preview id -> [bytes, last used], least recently used first
+        self.size = 0
+        self.dirty = False           # Index changed since it was last written
+        self.index_queued = False    # A write_index is waiting on the writer, later changes ride along
+        self.lock = threading.Lock()
+        self.writer = ThreadPoolExecutor(max_workers=1)
+
+    def blob_path(self, preview_id):
+        return os.path.join(self.directory, preview_id[:2], f"{preview_id}.png")
+
+    def ensure_open(self):
+        """Follow the current .blend, returns False while there is no directory to use"""
+        directory = preview_disk_directory()
+        if directory != self.directory:
+            self.open(directory)
+        return self.directory is not None
+
+    def open(self, directory):
+        self.flush()
+        with self.lock:
+            self.directory = directory
+            self.keys = {}
+            self.blobs = OrderedDict()
+            self.size = 0
+            self.dirty = False
+            if directory is not None:
+                self.load_index()
+
+    def load_index(self):
+        index_path = os.path.join(self.directory, PREVIEW_DISK_INDEX)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as index_file:
+                index = json.load(index_file)
+            if index.get("version") != PREVIEW_DISK_INDEX_VERSION:
+                raise ValueError(f"unsupported index version {index.get('version')}")
+            keys = index["keys"]
+            blobs = index["blobs"]
+        except FileNotFoundError:
+            keys, blobs = {}, {}
+        except Exception as e:
+            print(f"Ignoring preview index {index_path}: {e}")
+            keys, blobs = {}, {}
+
+        # Blobs without an index entry (crash, unreadable index) are kept as least recently used
+        for preview_id, size in self.scan_blobs().items():
+            blobs.setdefault(preview_id, [size, 0.0])
+        for preview_id, (size, last_used) in sorted(blobs.items(), key=lambda item: item[1][1]):
+            if os.path.exists(self.blob_path(preview_id)):
+                self.blobs[preview_id] = [size, last_used]
+                self.size += size
+        self.keys = {fingerprint: preview_id for fingerprint, preview_id in keys.items() if preview_id in self.blobs}
+        self.dirty = len(self.keys) != len(keys) or len(self.blobs) != len(blobs)
+        self.evict()
+
+    def scan_blobs(self):
+        """preview id -> size of every blob file in the directory, temp files of interrupted writes are removed"""
+        found = {}
+        if not os.path.isdir(self.directory):
+            return found
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".part"):
+                os.remove(entry.path)
+            elif entry.is_dir() and len(entry.name) == 2:
+                for blob in os.scandir(entry.path):
+                    if blob.name.endswith(".png"):
+                        found[blob.name[:-4]] = blob.stat().st_size
+                    elif blob.name.endswith(".part"):
+                        os.remove(blob.path)
+        return found
+
+    def get(self, fingerprint):
+        """PNG bytes of the preview stored for a fingerprint, None if there is none"""
+        with self.lock:
+            preview_id = self.keys.get(fingerprint)
+        if preview_id is None:
+            return None
+        return self.get_blob(preview_id)
+
+    def has(self, preview_id):
+        with self.lock:
+            return preview_id in self.blobs
+
+    def get_blob(self, preview_id):
+        """PNG bytes of a preview by its id, None if it isn't stored"""
+        with self.lock:
+            if preview_id not in self.blobs:
+                return None
+            path = self.blob_path(preview_id)
+        try:
+            with open(path, 'rb') as blob_file:
+                data = blob_file.read()
+        except OSError:
+            with self.lock:
+                self.drop(preview_id)
+            return None
+        with self.lock:
+            if preview_id in self.blobs:
+                self.blobs[preview_id][1] = time.time()
+                self.blobs.move_to_end(preview_id)
+                self.dirty = True
+        self.queue_index()
+        return data
+
+    def put(self, fingerprint, preview_id, data):
+        with self.lock:
+            self.keys[fingerprint] = preview_id
+            self.dirty = True
+            if preview_id in self.blobs:
+                self.blobs[preview_id][1] = time.time()
+                self.blobs.move_to_end(preview_id)
+            else:
+                self.blobs[preview_id] = [len(data), time.time()]
+                self.size += len(data)
+                self.writer.submit(self.write_blob, self.blob_path(preview_id), data)
+                self.evict()
+        self.queue_index()
+
+    def queue_index(self):
+        with self.lock:
+            if self.index_queued:
+                return
+            self.index_queued = True
+        self.writer.submit(self.write_index)
+
+    def drop(self, preview_id):
+        blob = self.blobs.pop(preview_id, None)
+        if blob is None:
+            return
+        self.size -= blob[0]
+        self.keys = {fingerprint: kept for fingerprint, kept in self.keys.items() if kept != preview_id}
+        self.dirty = True
+        self.writer.submit(self.remove_blob, self.blob_path(preview_id))
+
+    def evict(self):
+        while self.size > self.max_bytes and len(self.blobs) > 1:
+            self.drop(next(iter(self.blobs)))
+
+    def write_blob(self, path, data):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_file_atomic(path, data)
+        except Exception as e:
+            print(f"Error writing preview {path}: {e}")
+
+    def remove_blob(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error removing preview {path}: {e}")
+
+    def write_index(self):
+        with self.lock:
+            self.index_queued = False
+            if not self.dirty or self.directory is None:
+                return
+            index = {
+                "version": PREVIEW_DISK_INDEX_VERSION,
+                "keys": dict(self.keys),
+                "blobs": {preview_id: list(blob) for preview_id, blob in self.blobs.items()},
+            }
+            path = os.path.join(self.directory, PREVIEW_DISK_INDEX)
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_file_atomic(path, json.dumps(index).encode('utf-8'))
+        except Exception as e:
+            print(f"Error writing preview index {path}: {e}")
+            with self.lock:
+                self.dirty = True
+
+    def flush(self):
+        """Write the index and wait for every pending file, before the directory changes or Blender quits"""
+        self.writer.submit(self.write_index).result()
+
+    def close(self):
+        self.flush()
+        self.writer.shutdown(wait=True)
+
+
+# Re-running the script must not lose the previous store's pending writes
+if "preview_disk" in globals():
+    preview_disk.close()
+
+preview_disk = PreviewDiskStore(PREVIEW_DISK_CACHE_MAX_MB * 1024 * 1024)
+
+
+def find_cached_preview(name, key, count=True):
+    """Preview id of a camera from memory, or from the disk cache of the .blend, None if it needs a render"""
+    preview_id = lookup_preview(name, key, count=False)
+    if preview_id is None and preview_disk.ensure_open():
+        data = preview_disk.get(preview_fingerprint(key))
+        if data is not None:
+            preview_id = preview_store.put(data, "image/png")
+            store_preview(name, key, preview_id)
+            preview_cache["disk_hits"] += 1
+    if count:
+        preview_cache["hits" if preview_id is not None else "misses"] += 1
+    return preview_id
+
+
+def preview_available(preview_id):
+    """Whether a preview id handed out earlier, maybe in a previous session, can still be served"""
+    return preview_store.has(preview_id) or (preview_disk.ensure_open() and preview_disk.has(preview_id))
+
+
+def restore_preview(preview_id):
+    """Put a preview the memory store no longer has back from the disk cache, False if it's gone.
+    Only reads the directory already open, the preview route calls this off the main thread"""
+    data = preview_disk.get_blob(preview_id)
+    if data is None:
+        return False
+    preview_store.put(data, "image/png")
+    return True
+
+
+def save_preview_to_disk(key, preview_id):
+    blob = preview_store.get(preview_id)
+    if blob is not None and preview_disk.ensure_open():
+        preview_disk.put(preview_fingerprint(key), preview_id, blob[0])
+
+
+@bpy.app.handlers.persistent
+def flush_preview_disk(dummy):
+    """Index on disk is written before the file is left, and follows the file to its new path on save as"""
+    preview_disk.flush()
+    preview_disk.ensure_open()
+
+
+def register():
+    for handlers in (bpy.app.handlers.load_pre, bpy.app.handlers.save_post):
+        if flush_preview_disk not in handlers:
+            handlers.append(flush_preview_disk)
+
+
+def unregister():
+    for handlers in (bpy.app.handlers.load_pre, bpy.app.handlers.save_post):
+        if flush_preview_disk in handlers:
+            handlers.remove(flush_preview_disk)
+    preview_disk.flush()
+
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,132 @@
+###################################################################### Camera preview render queue
+import bpy
+import eel
+import threading
+import traceback
+from concurrent.futures import Future
+
+
+# Seconds between two queued renders, gives Blender a chance to redraw and handle input
+PREVIEW_QUEUE_INTERVAL = 0.05
+
+
+class PreviewRenderQueue:
+    """Renders requested camera previews on the main thread, one per bpy.app.timers tick.
+
+    RPCs only call request() and return right away, finished previews are pushed to
+    the web UI as camera_preview events. A slot that is
+    requested again while waiting keeps its place in the queue, and the slot the
+    user is looking at (set_focus) is always rendered next.
+    """
+
+    def __init__(self):
+        self.pending = {}  # (section_id, camera_number) -> camera object name, in request order
+        self.focus = None
+        self.lock = threading.Lock()  # request() is called from eel's thread
+        self.timer = self.tick  # Keep one bound method so the timer can be unregistered
+
+    def request(self, section_id, camera_number, camera_name):
+        with self.lock:
+            self.pending[(section_id, camera_number)] = camera_name
+        if not bpy.app.timers.is_registered(self.timer):
+            bpy.app.timers.register(self.timer, first_interval=0.0, persistent=True)
+
+    def set_focus(self, section_id, camera_number):
+        with self.lock:
+            self.focus = (section_id, camera_number)
+
+    def cancel_slot(self, section_id, camera_number):
+        with self.lock:
+            self.pending.pop((section_id, camera_number), None)
+
+    def cancel_section(self, section_id):
+        with self.lock:
+            for key in [key for key in self.pending if key[0] == section_id]:
+                del self.pending[key]
+            if self.focus is not None and self.focus[0] == section_id:
+                self.focus = None
+
+    def next_request(self):
+        with self.lock:
+            if not self.pending:
+                return None
+            key = self.focus if self.focus in self.pending else next(iter(self.pending))
+            return key, self.pending.pop(key)
+
+    def tick(self):
+        request = self.next_request()
+        if request is None:
+            return None
+
+        (section_id, camera_number), camera_name = request
+        try:
+            # The slot may have been rebound or deleted since it was queued
+            camera_obj = find_camera(section_id, camera_number)
+            if camera_obj is not None and camera_obj.name == camera_name:
+                # Already counted as a miss when it was queued
+                preview_id = get_camera_preview(camera_obj, count=False)
+                if isinstance(preview_id, Future):
+                    # The render failed and waits for a retry, the queue moves on meanwhile
+                    preview_id.add_done_callback(
+                        lambda done: self.publish(section_id, camera_number, camera_name, done.result()))
+                else:
+                    self.publish(section_id, camera_number, camera_name, preview_id)
+        except Exception as e:
+            print(f"Error rendering queued preview for {camera_name}: {e}")
+            traceback.print_exc()
+
+        with self.lock:
+            return PREVIEW_QUEUE_INTERVAL if self.pending else None
+
+    def publish(self, section_id, camera_number, camera_name, preview_id):
+        # Renders that failed for good come back as an error dict
+        if isinstance(preview_id, str):
+            event_bus.publish("camera_preview", {
+                "section_id": section_id,
+                "camera_number": camera_number,
+                "blender_name": camera_name,
+                "preview_url": preview_url(preview_id),
+            }, key=("camera_preview", section_id, camera_number))
+
+    def cancel(self):
+        if bpy.app.timers.is_registered(self.timer):
+            bpy.app.timers.unregister(self.timer)
+        with self.lock:
+            self.pending.clear()
+            self.focus = None
+
+
+# Re-running the script must not leave the previous queue's timer behind
+if "preview_queue" in globals():
+    preview_queue.cancel()
+
+preview_queue = PreviewRenderQueue()
+
+
+def queue_camera_preview(camera_obj, section_id, camera_number, render_missing=True):
+    """Cached preview of a camera if it is current, otherwise queue a render (unless render_missing is off) and return None"""
+    preview_id = find_cached_preview(camera_obj.name, preview_cache_key(camera_obj, bpy.context.scene))
+    if preview_id is None and render_missing:
+        preview_queue.request(section_id, camera_number, camera_obj.name)
+    return preview_id
+
+
+@bpy.app.handlers.persistent
+def cancel_preview_queue(dummy):
+    """Queued slots belong to the previous file"""
+    preview_queue.cancel()
+
+
+def register():
+    if cancel_preview_queue not in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.append(cancel_preview_queue)
+
+
+def unregister():
+    if cancel_preview_queue in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(cancel_preview_queue)
+    preview_queue.cancel()
+
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,199 @@
+###################################################################### Camera preview blob store
+import bottle
+import io
+import os
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image  # Not bundled with Blender, without it imbuf's JPEG writer is used
+except ImportError:
+    Image = None
+
+try:
+    import imbuf
+except ImportError:
+    imbuf = None
+
+
+# Preview images kept in memory for the web UI, least recently used ones are dropped first
+PREVIEW_STORE_MAX_BYTES = 128 * 1024 * 1024
+PREVIEW_ROUTE = "/previews"
+
+# Sizes derived from every capture, by width in pixels, None keeps the captured width
+PREVIEW_SIZES = {"card": 320, "hover": 640, "full": None}
+PREVIEW_QUALITY = 80
+PREVIEW_ENCODE_WORKERS = 2
+
+
+def preview_content_type(data):
+    if data[:2] == b"\xff\xd8":
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
+
+
+def scaled_size(width, height, target_width):
+    if not target_width or width <= target_width:
+        return width, height
+    return target_width, max(1, round(height * target_width / width))
+
+
+def encode_sizes_with_pil(data):
+    image = Image.open(io.BytesIO(data)).convert("RGB")
+    sizes = {}
+    for size, target_width in PREVIEW_SIZES.items():
+        dimensions = scaled_size(image.width, image.height, target_width)
+        variant = image if dimensions == image.size else image.resize(dimensions, Image.LANCZOS)
+        out = io.BytesIO()
+        variant.save(out, "WEBP", quality=PREVIEW_QUALITY)
+        sizes[size] = out.getvalue()
+    return sizes
+
+
+def encode_sizes_with_imbuf(data):
+    # imbuf only reads and writes files, and works on its own buffers so it is fine off the main thread
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, "preview.png")
+        with open(source_path, 'wb') as source_file:
+            source_file.write(data)
+        image = imbuf.load(source_path)
+
+        sizes = {}
+        for size, target_width in PREVIEW_SIZES.items():
+            variant = image.copy()
+            dimensions = scaled_size(*variant.size, target_width)
+            if dimensions != tuple(variant.size):
+                variant.resize(dimensions, method='BILINEAR')
+            variant.file_format = 'JPEG'
+            target_path = os.path.join(directory, f"{size}.jpg")
+            imbuf.write(variant, filepath=target_path)
+            with open(target_path, 'rb') as target_file:
+                sizes[size] = target_file.read()
+        return sizes
+
+
+def encode_preview_sizes(data):
+    """Every PREVIEW_SIZES variant of a captured PNG, in a lossy format"""
+    if Image is not None:
+        return encode_sizes_with_pil(data)
+    if imbuf is not None:
+        return encode_sizes_with_imbuf(data)
+    return {}
+
+
+class PreviewStore:
+    """Content-addressed preview images, served to the web UI from PREVIEW_ROUTE.
+
+    An id is the hash of the captured PNG, so a URL always points at the same
+    image and the browser may cache it for good. RPCs only hand out ids / URLs.
+    The card, hover and full sizes are encoded on worker threads after put();
+    until they are ready a size request is answered with the captured PNG.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.blobs = OrderedDict()  # preview id -> {"data", "content_type", "sizes": {size: bytes}}
+        self.size = 0
+        self.lock = threading.Lock()  # The route is served from eel's thread
+        self.encoder = ThreadPoolExecutor(max_workers=PREVIEW_ENCODE_WORKERS)
+
+    def put(self, data, content_type="image/png"):
+        preview_id = hashlib.blake2b(data, digest_size=16).hexdigest()
+        with self.lock:
+            if preview_id in self.blobs:
+                self.blobs.move_to_end(preview_id)
+                return preview_id
+            self.blobs[preview_id] = {"data": data, "content_type": content_type, "sizes": {}}
+            self.size += len(data)
+            self.evict()
+        self.encoder.submit(self.encode, preview_id, data)
+        return preview_id
+
+    def encode(self, preview_id, data):
+        try:
+            sizes = encode_preview_sizes(data)
+        except Exception as e:
+            print(f"Error encoding preview sizes: {e}")
+            return
+        with self.lock:
+            blob = self.blobs.get(preview_id)
+            if blob is None:
+                return
+            blob["sizes"] = sizes
+            self.size += sum(map(len, sizes.values()))
+            self.evict()
+
+    def evict(self):
+        while self.size > self.max_bytes and len(self.blobs) > 1:
+            evicted, blob = self.blobs.popitem(last=False)
+            self.size -= len(blob["data"]) + sum(map(len, blob["sizes"].values()))
+
+    def get(self, preview_id, size=None):
+        """(bytes, content type, is the requested size) of a preview, None if it is unknown"""
+        with self.lock:
+            blob = self.blobs.get(preview_id)
+            if blob is None:
+                return None
+            self.blobs.move_to_end(preview_id)
+            if size in blob["sizes"]:
+                data = blob["sizes"][size]
+                return data, preview_content_type(data), True
+            return blob["data"], blob["content_type"], size is None
+
+    def has(self, preview_id):
+        with self.lock:
+            return preview_id in self.blobs
+
+    def clear(self):
+        with self.lock:
+            self.blobs.clear()
+            self.size = 0
+
+    def close(self):
+        self.encoder.shutdown(wait=False)
+        self.clear()
+
+
+# Re-running the script must not leave the previous store's encoder threads behind
+if "preview_store" in globals():
+    preview_store.close()
+
+preview_store = PreviewStore(PREVIEW_STORE_MAX_BYTES)
+
+
+def preview_url(preview_id):
+    # Failed captures come back as None or an error dict
+    return f"{PREVIEW_ROUTE}/{preview_id}" if isinstance(preview_id, str) else None
+
+
+# eel serves its pages from bottle's default app, so the routes live next to them. Bottle tries
+# dynamic routes in the order they were added, this file is loaded before eel.start adds its /<path:path>
+@bottle.route(f"{PREVIEW_ROUTE}/<preview_id>")
+@bottle.route(f"{PREVIEW_ROUTE}/<preview_id>/<size>")
+def serve_preview(preview_id, size=None):
+    if size is not None and size not in PREVIEW_SIZES:
+        return bottle.HTTPResponse(status=404)
+    blob = preview_store.get(preview_id, size)
+    # Ids outlive the memory store: saved projects keep their URLs across sessions and evictions
+    if blob is None and restore_preview(preview_id):
+        blob = preview_store.get(preview_id, size)
+    if blob is None:
+        return bottle.HTTPResponse(status=404)
+
+    data, content_type, exact = blob
+    if exact:
+        etag = f'"{preview_id}-{size}"' if size else f'"{preview_id}"'
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=31536000, immutable"}
+    else:
+        # The size is still being encoded, the browser has to ask again next time
+        etag = f'"{preview_id}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if bottle.request.headers.get("If-None-Match") == etag:
+        return bottle.HTTPResponse(status=304, headers=headers)
+    return bottle.HTTPResponse(body=data, status=200, headers=dict(headers, **{"Content-Type": content_type}))
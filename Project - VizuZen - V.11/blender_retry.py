@@ -0,0 +1,184 @@
+###################################################################### Retry policy for Blender operations
+import bpy
+import eel
+import time
+import random
+import threading
+import traceback
+import functools
+from concurrent.futures import Future
+
+
+# Attempts per operation, and the exponential backoff between them in seconds
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 4.0
+# Every delay is scaled by a random factor in [1 - jitter, 1 + jitter], so failed calls don't retry in lockstep
+RETRY_JITTER = 0.5
+# Seconds between checks of a retrying operation from eel's thread
+RETRY_POLL_INTERVAL = 0.02
+
+# Blender's context / poll failures and file system hiccups can pass, anything else
+# (bad arguments, removed data, bugs) fails the same way on every attempt
+RETRYABLE_ERRORS = (RuntimeError, OSError)
+FATAL_ERRORS = (NotImplementedError, RecursionError)
+
+
+def is_retryable_error(error):
+    return isinstance(error, RETRYABLE_ERRORS) and not isinstance(error, FATAL_ERRORS)
+
+
+def retry_delay(attempt):
+    """Delay before the attempt after `attempt` failed ones"""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return delay * random.uniform(1.0 - RETRY_JITTER, 1.0 + RETRY_JITTER)
+
+
+# Per operation name: outcome counters and latency from the call to its final result, in seconds
+operation_stats = {}
+stats_lock = threading.Lock()  # Operations finish on eel's thread and on Blender's timers
+
+
+def record_operation(name, outcome, retries, latency):
+    with stats_lock:
+        stats = operation_stats.setdefault(name, {
+            "calls": 0, "succeeded": 0, "failed": 0, "fatal": 0, "retries": 0,
+            "total_latency": 0.0, "max_latency": 0.0,
+        })
+        stats["calls"] += 1
+        stats[outcome] += 1
+        stats["retries"] += retries
+        stats["total_latency"] += latency
+        stats["max_latency"] = max(stats["max_latency"], latency)
+
+
+def get_operation_stats():
+    with stats_lock:
+        return {
+            name: dict(stats, average_latency=stats["total_latency"] / stats["calls"])
+            for name, stats in operation_stats.items()
+        }
+
+
+class RetryOperation:
+    """One call of a Blender operation, retried on bpy.app.timers until it succeeds or gives up.
+
+    The first attempt runs right away in the caller's thread, later ones on
+    Blender's main thread after a backoff delay, so nothing ever sleeps. The
+    final result, or the error dict of the last failure, is set on `future`.
+    """
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.attempts = 0
+        self.started = time.perf_counter()
+        self.future = Future()
+        self.timer = self.attempt  # Keep one bound method so the timer can be unregistered
+
+    def attempt(self):
+        """Run once, returns the delay before the next attempt or None when finished (timer protocol)"""
+        self.attempts += 1
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            return self.failed(e)
+        self.finish(result, "succeeded")
+        return None
+
+    def failed(self, error):
+        name = self.func.__name__
+        if is_retryable_error(error) and self.attempts < MAX_RETRIES:
+            delay = retry_delay(self.attempts)
+            print(f"Blender operation {name} failed (attempt {self.attempts}/{MAX_RETRIES}): {error}")
+            print(f"Retrying in {delay:.2f} seconds...")
+            return delay
+
+        if is_retryable_error(error):
+            print(f"All retry attempts failed for {name}: {error}")
+            self.finish({"success": False, "message": f"Operation failed after {self.attempts} attempts: {error}"}, "failed")
+        else:
+            print(f"Blender operation {name} failed with a non-retryable error: {error}")
+            self.finish({"success": False, "message": f"Operation failed: {error}"}, "fatal")
+        return None
+
+    def finish(self, result, outcome):
+        pending_operations.discard(self)
+        record_operation(self.func.__name__, outcome, self.attempts - 1, time.perf_counter() - self.started)
+        self.future.set_result(result)
+
+    def cancel(self, reason):
+        if bpy.app.timers.is_registered(self.timer):
+            bpy.app.timers.unregister(self.timer)
+        if not self.future.done():
+            self.finish({"success": False, "message": f"Operation cancelled: {reason}"}, "failed")
+
+
+# Re-running the script must not leave the previous retries' timers behind
+if "pending_operations" in globals():
+    cancel_pending_retries("the script was reloaded")
+
+# Operations waiting for a retry, dropped when another file is loaded
+pending_operations = set()
+
+
+def run_with_retry(func, args=(), kwargs=None):
+    """Start an operation, returns a Future that is already done unless a retry was scheduled"""
+    operation = RetryOperation(func, args, kwargs or {})
+    delay = operation.attempt()
+    if delay is not None:
+        pending_operations.add(operation)
+        bpy.app.timers.register(operation.timer, first_interval=delay, persistent=True)
+    return operation.future
+
+
+def safe_blender_operation(func):
+    """Decorator to make Blender operations more robust with retry logic.
+    The wrapped function raises on failure, errors it catches and turns into a result are never retried"""
+    @functools.wraps(func)  # This preserves the original function name and metadata
+    def safe_wrapper(*args, **kwargs):
+        future = run_with_retry(func, args, kwargs)
+        if future.done():
+            return future.result()
+
+        if threading.current_thread() is threading.main_thread():
+            # A dispatched RPC answers eel once the retries are done
+            if main_thread_dispatcher.is_running(safe_wrapper):
+                return future
+            # Blender can't wait for its own timers, the retries carry on in the background
+            return {"success": False, "retrying": True, "message": f"{func.__name__} failed, retrying in the background"}
+
+        # eel's calls share one thread, yield to them while the retries run on Blender's timers
+        while not future.done():
+            eel.sleep(RETRY_POLL_INTERVAL)
+        return future.result()
+
+    return safe_wrapper  # Return the wrapped function with preserved name
+
+
+def cancel_pending_retries(reason):
+    for operation in list(pending_operations):
+        operation.cancel(reason)
+
+
+@bpy.app.handlers.persistent
+def cancel_retries_on_load(dummy):
+    """Retries were meant for the objects of the previous file"""
+    cancel_pending_retries("a new file was loaded")
+
+
+def register():
+    if cancel_retries_on_load not in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.append(cancel_retries_on_load)
+
+
+def unregister():
+    if cancel_retries_on_load in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(cancel_retries_on_load)
+    cancel_pending_retries("the add-on was unregistered")
+
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,53 @@
+###################################################################### Document row model
+import bpy
+
+
+# Parsed document rows per object name, shared by the spreadsheet panel, the static
+# data panel, the data viewer overlay, the web table and the CSV export
+document_row_cache = {}
+
+
+def get_document_model(obj):
+    """Cached {"rows": [...], "legacy": bool} for an object, parsed on first use"""
+    model = document_row_cache.get(obj.name)
+    if model is None:
+        legacy = has_legacy_document_rows(obj) and not obj.document_rows
+        model = {"rows": read_document_rows(obj), "legacy": legacy}
+        document_row_cache[obj.name] = model
+    return model
+
+
+def get_document_rows(obj):
+    """Cached document rows of an object as dicts, see read_document_rows"""
+    return get_document_model(obj)["rows"]
+
+
+def invalidate_document_rows(obj=None):
+    """Drop the cached rows of one object, or of every object when obj is None"""
+    if obj is None:
+        document_row_cache.clear()
+    else:
+        document_row_cache.pop(obj.name, None)
+
+
+def invalidate_document_rows_from_scene_changes(scene, changes):
+    """Property edits made through the UI tag their object, so only those entries are dropped.
+    Undo, redo and file loads replace the objects, so nothing cached is valid anymore"""
+    if changes["reset"]:
+        document_row_cache.clear()
+        return
+    for name in changes["touched"].keys() | changes["removed"] | changes["renamed"].keys():
+        document_row_cache.pop(name, None)
+
+
+def register():
+    scene_changes.add_listener("document_rows", invalidate_document_rows_from_scene_changes)
+
+
+def unregister():
+    scene_changes.remove_listener("document_rows")
+    document_row_cache.clear()
+
+
+if __name__ == "__main__":
+    register()
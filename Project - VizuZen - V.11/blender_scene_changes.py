@@ -0,0 +1,142 @@
+###################################################################### Scene change collector
+import bpy
+
+
+class SceneChangeCollector:
+    """Work out once per depsgraph update what changed in the scene, for every index that follows it.
+
+    The document row cache, the object index, the camera registry and the web table
+    all need the same facts about an update: which objects were touched, which were
+    added to or removed from the scene and which were renamed. One depsgraph handler
+    collects them and hands the same changes dict to every listener, so the scene
+    membership is scanned once per collection or scene update instead of once per index.
+
+    Listeners are called as listener(scene, changes) with
+        "reset":   True after a file load, undo, redo or scene switch, rebuild from scratch
+        "touched": object name -> object, for objects tagged by the update
+        "added":   names that joined the scene
+        "removed": names that left the scene
+        "renamed": old name -> new name
+    """
+
+    def __init__(self):
+        self.scene = None     # as_pointer() of the tracked scene
+        self.names = set()    # object names in the tracked scene
+        self.pointers = {}    # object as_pointer() -> name (catches renames)
+        self.listeners = {}   # name -> listener(scene, changes)
+
+    def add_listener(self, name, listener):
+        self.listeners[name] = listener
+
+    def remove_listener(self, name):
+        self.listeners.pop(name, None)
+
+    def rebuild(self, scene):
+        """Full scan of the scene, done once per file load, undo or scene switch"""
+        self.scene = scene.as_pointer()
+        self.names = set()
+        self.pointers = {}
+        for obj in scene.objects:
+            self.names.add(obj.name)
+            self.pointers[obj.as_pointer()] = obj.name
+
+    def reset(self, scene):
+        self.rebuild(scene)
+        self.dispatch(scene, {"reset": True, "touched": {}, "added": set(), "removed": set(), "renamed": {}})
+
+    def collect(self, scene, depsgraph):
+        """Hand the changes of one depsgraph update to the listeners"""
+        touched = {}
+        membership_changed = False
+        for update in depsgraph.updates:
+            id_data = update.id.original
+            if isinstance(id_data, bpy.types.Object):
+                touched[id_data.name] = id_data
+            elif isinstance(id_data, (bpy.types.Collection, bpy.types.Scene)):
+                membership_changed = True
+        self.apply(scene, touched, membership_changed)
+
+    def reconcile(self, scene):
+        """Check the scene membership in full, for deletions that didn't tag a collection"""
+        self.apply(scene, {}, True)
+
+    def apply(self, scene, touched, membership_changed):
+        if self.scene != scene.as_pointer():
+            self.reset(scene)
+            return
+
+        # A renamed object keeps its pointer, so its old name is still on record
+        renamed = {}
+        for name, obj in touched.items():
+            pointer = obj.as_pointer()
+            old_name = self.pointers.get(pointer)
+            if old_name is not None and old_name != name and old_name in self.names:
+                renamed[old_name] = name
+                self.names.discard(old_name)
+                self.names.add(name)
+            self.pointers[pointer] = name
+
+        # Deleted and unlinked objects only show up as a collection or scene update
+        if membership_changed:
+            current = set(scene.objects.keys())
+            added = current - self.names
+            removed = self.names - current
+            self.names = current
+        else:
+            added = {name for name in touched if name not in self.names and name in scene.objects}
+            removed = {name for name in touched if name in self.names and name not in scene.objects}
+            self.names |= added
+            self.names -= removed
+        if removed:
+            self.pointers = {p: n for p, n in self.pointers.items() if n not in removed}
+
+        if touched or added or removed or renamed:
+            self.dispatch(scene, {"reset": False, "touched": touched, "added": added, "removed": removed, "renamed": renamed})
+
+    def dispatch(self, scene, changes):
+        for name, listener in list(self.listeners.items()):
+            try:
+                listener(scene, changes)
+            except Exception as e:
+                print(f"Error updating {name} from scene changes: {e}")
+
+
+# Listeners registered by the scripts loaded after this one carry over a re-run
+scene_changes_listeners = scene_changes.listeners if "scene_changes" in globals() else {}
+scene_changes = SceneChangeCollector()
+scene_changes.listeners = scene_changes_listeners
+
+
+@bpy.app.handlers.persistent
+def collect_scene_changes(scene, depsgraph=None):
+    if depsgraph is None:
+        scene_changes.reset(scene)
+    else:
+        scene_changes.collect(scene, depsgraph)
+
+
+@bpy.app.handlers.persistent
+def reset_scene_changes(dummy):
+    """Undo, redo and file loads replace the objects, every listener rebuilds"""
+    scene_changes.reset(bpy.context.scene)
+
+
+def register():
+    if collect_scene_changes not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(collect_scene_changes)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_scene_changes not in handlers:
+            handlers.append(reset_scene_changes)
+
+
+def unregister():
+    if collect_scene_changes in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(collect_scene_changes)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_scene_changes in handlers:
+            handlers.remove(reset_scene_changes)
+    scene_changes.scene = None
+
+
+if __name__ == "__main__":
+    register()
@@ -1,8 +1,118 @@
 ###################################################################### Interactive Spreadsheet
 import bpy
 import os
+import sys
+import importlib
 import subprocess
 
+# Rows of the CSV exports live in a plain module, so export worker processes can import them
+if bpy.path.abspath("//") not in sys.path:
+    sys.path.append(bpy.path.abspath("//"))
+if "csv_export_rows" in sys.modules:
+    importlib.reload(sys.modules["csv_export_rows"])  # Re-running main.py picks up edits
+from csv_export_rows import DOCUMENT_COLUMNS
+
+
+# One document row of an object, stored in obj.document_rows
+class DocumentRowPropertyGroup(bpy.types.PropertyGroup):
+    description: bpy.props.StringProperty(name="Description")
+    sap_dir: bpy.props.StringProperty(name="SAP Dir")
+    status: bpy.props.StringProperty(name="Status")
+    version: bpy.props.StringProperty(name="Version")
+    local_file: bpy.props.StringProperty(name="Local File", subtype="FILE_PATH")
+
+
+def read_legacy_document_rows(obj, used_keys=None):
+    """Read rows stored in the old flat custom_string_{i}_{col} / custom_file_{i} layout,
+    the keys that went into a row are added to used_keys if given"""
+    legacy = {}
+    files = {}
+    for key in obj.keys():
+        if key.startswith("custom_string_"):
+            try:
+                i, col = (int(part) for part in key[len("custom_string_"):].split("_"))
+            except ValueError:
+                continue
+            if 1 <= col <= len(DOCUMENT_COLUMNS):
+                legacy.setdefault(i, {})[DOCUMENT_COLUMNS[col - 1]] = (key, str(obj[key]))
+        elif key.startswith("custom_file_"):
+            try:
+                files[int(key[len("custom_file_"):])] = (key, str(obj[key]))
+            except ValueError:
+                continue
+
+    # Rows are ordered by their old index, files without a row were never shown and are skipped
+    rows = []
+    for i in sorted(legacy):
+        cells = dict(legacy[i])
+        if i in files:
+            cells["local_file"] = files[i]
+        row = {name: value for name, (key, value) in cells.items()}
+        row.setdefault("local_file", "")
+        rows.append(row)
+        if used_keys is not None:
+            used_keys.update(key for key, value in cells.values())
+    return rows
+
+
+def read_document_rows(obj):
+    """Document rows of an object as dicts, from obj.document_rows or the old flat layout"""
+    document_rows = getattr(obj, "document_rows", None)
+    if document_rows:
+        return [{name: getattr(row, name) for name in DOCUMENT_COLUMNS + ["local_file"]} for row in document_rows]
+    return read_legacy_document_rows(obj)
+
+
+def has_legacy_document_rows(obj):
+    return any(key.startswith(("custom_string_", "custom_file_")) for key in obj.keys())
+
+
+def legacy_document_keys(obj):
+    return [key for key in obj.keys() if key.startswith(("custom_string_", "custom_file_"))]
+
+
+def migrate_document_rows(obj):
+    """Move the old flat layout of an object into obj.document_rows, returns True if anything changed.
+
+    Only keys that went into a row are deleted. Keys that could not be read as a row, and
+    all keys of objects that already have a document table, are kept for the user to check.
+    """
+    if obj.document_rows or not has_legacy_document_rows(obj):
+        return False
+
+    used_keys = set()
+    for legacy_row in read_legacy_document_rows(obj, used_keys):
+        row = obj.document_rows.add()
+        for name, value in legacy_row.items():
+            setattr(row, name, value)
+
+    for key in used_keys:
+        del obj[key]
+    return bool(used_keys)
+
+
+# Operator to convert every object of the file to the document table layout
+class OBJECT_OT_MigrateDocumentRows(bpy.types.Operator):
+    """Convert custom_string_{i}_{col} / custom_file_{i} properties of all objects into document rows"""
+    bl_idname = "object.migrate_document_rows"
+    bl_label = "Migrate Document Rows"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        migrated = 0
+        kept = 0
+        for obj in bpy.data.objects:
+            if migrate_document_rows(obj):
+                migrated += 1
+            kept += len(legacy_document_keys(obj))
+        invalidate_document_rows()
+
+        if kept:
+            self.report({'WARNING'}, f"Migrated document rows of {migrated} objects, kept {kept} old properties that could not be migrated")
+        else:
+            self.report({'INFO'}, f"Migrated document rows of {migrated} objects")
+        return {'FINISHED'}
+
 
 # Operator to add a new row with predefined columns to the selected object
 class AddStringRowToObjectOperator(bpy.types.Operator):
@@ -15,14 +125,15 @@ class AddStringRowToObjectOperator(bpy.types.Operator):
             self.report({'ERROR'}, "No object selected")
             return {'CANCELLED'}
 
-        # Determine the next row index
-        i = 1
-        while any(f"custom_string_{i}_{col}" in obj.keys() for col in range(1, 5)):
-            i += 1
+        migrate_document_rows(obj)
 
-        # Add new properties for each column in the row
-        for col in range(1, 5):
-            obj[f"custom_string_{i}_{col}"] = f"Row{i}Col{col}"
+        # Add the new row at the end of the document table
+        row = obj.document_rows.add()
+        i = len(obj.document_rows)
+        for col, name in enumerate(DOCUMENT_COLUMNS, 1):
+            setattr(row, name, f"Row{i}Col{col}")
+
+        invalidate_document_rows(obj)
 
         self.report({'INFO'}, "Added new string row to object")
         return {'FINISHED'}
@@ -43,8 +154,12 @@ class OBJECT_OT_open_filebrowser(bpy.types.Operator):
     def execute(self, context):
         obj = context.object
         if obj:
-            prop_name = f"custom_file_{self.row_index}"
-            obj[prop_name] = self.filepath
+            migrate_document_rows(obj)
+            if not 1 <= self.row_index <= len(obj.document_rows):
+                self.report({'ERROR'}, f"Row {self.row_index} does not exist")
+                return {'CANCELLED'}
+            obj.document_rows[self.row_index - 1].local_file = self.filepath
+            invalidate_document_rows(obj)
             self.report({'INFO'}, f"File path stored for row {self.row_index}: {self.filepath}")
         return {'FINISHED'}
 
@@ -91,23 +206,17 @@ class RemoveStringRowFromObjectOperator(bpy.types.Operator):
             self.report({'ERROR'}, "No object selected")
             return {'CANCELLED'}
 
-        # Find the highest index of the custom string rows
-        max_index = -1
-        for key in obj.keys():
-            if key.startswith("custom_string_"):
-                index = int(key.split("_")[2])
-                max_index = max(max_index, index)
+        migrate_document_rows(obj)
 
-        # If no custom string properties were found, report and exit
-        if max_index == -1:
+        # If there are no document rows, report and exit
+        max_index = len(obj.document_rows)
+        if max_index == 0:
             self.report({'INFO'}, "No custom string rows to remove")
             return {'CANCELLED'}
 
-        # Remove properties for the highest index found
-        for col in range(1, 5):
-            prop_name = f"custom_string_{max_index}_{col}"
-            if prop_name in obj.keys():
-                del obj[prop_name]
+        # Remove the last row
+        obj.document_rows.remove(max_index - 1)
+        invalidate_document_rows(obj)
 
         self.report({'INFO'}, f"Removed string row {max_index} from object")
         return {'FINISHED'}
@@ -144,41 +253,18 @@ class DeleteStringRowFromObjectOperator(bpy.types.Operator):
             self.report({'ERROR'}, "No object selected")
             return {'CANCELLED'}
 
-        base_prop_name_to_delete = f"custom_string_{self.row_index}_"
-        file_prop_name_to_delete = f"custom_file_{self.row_index}"
-
-        # Delete properties related to the specified row
-        for key in list(obj.keys()):
-            if key.startswith(base_prop_name_to_delete) or key == file_prop_name_to_delete:
-                del obj[key]
-
-        # Reindex the rows after the deleted row
-        max_index = self.find_max_row_index(obj)
-        for i in range(self.row_index + 1, max_index + 1):
-            for col in range(1, 5):
-                old_key = f"custom_string_{i}_{col}"
-                new_key = f"custom_string_{i - 1}_{col}"
-                if old_key in obj:
-                    obj[new_key] = obj[old_key]
-                    del obj[old_key]
-
-            old_file_key = f"custom_file_{i}"
-            new_file_key = f"custom_file_{i - 1}"
-            if old_file_key in obj:
-                obj[new_file_key] = obj[old_file_key]
-                del obj[old_file_key]
+        migrate_document_rows(obj)
+        if not 1 <= self.row_index <= len(obj.document_rows):
+            self.report({'ERROR'}, f"Row {self.row_index} does not exist")
+            return {'CANCELLED'}
+
+        # Following rows move up by themselves, no reindexing needed
+        obj.document_rows.remove(self.row_index - 1)
+        invalidate_document_rows(obj)
 
         self.report({'INFO'}, f"Deleted data for row {self.row_index} and reindexed subsequent rows.")
         return {'FINISHED'}
 
-    def find_max_row_index(self, obj):
-        max_index = 0
-        for key in obj.keys():
-            if key.startswith("custom_string_"):
-                index = int(key.split("_")[2])
-                max_index = max(max_index, index)
-        return max_index
-
 
 
 # Modified Panel to display and edit the rows with custom column names
@@ -223,18 +309,25 @@ class CustomObjectSpreadsheetPanel(bpy.types.Panel):
 
 
             #### Revisist this link https://chat.openai.com/c/060b0551-a44d-4e2f-b43c-fad2beb47471
+            # Rows in the old flat layout are shown read-only until the file is migrated
+            model = get_document_model(obj)
+            if model["legacy"]:
+                layout.operator("object.migrate_document_rows", text="Migrate Document Rows", icon='FILE_REFRESH')
+                for j, doc in enumerate(model["rows"], 1):
+                    row = layout.row()
+                    row.label(text=f"Doc{j}")
+                    for name in DOCUMENT_COLUMNS + ["local_file"]:
+                        row.label(text=doc.get(name, ""))
+
             # Display rows with custom named columns and file select button
-            j = 1
-            while any(f"custom_string_{j}_{col}" in obj.keys() for col in range(1, 5)):  # Adjusted for 3 columns + file
+            for j, doc in enumerate(obj.document_rows, 1):
                 row = layout.row()
                 row.label(text=f"Doc{j}")
-                for col in range(1, 5):  # Only iterate over the first three columns
-                    prop_name = f'custom_string_{j}_{col}'
-                    row.prop(obj, f'["{prop_name}"]', text="")
+                for name in DOCUMENT_COLUMNS:
+                    row.prop(doc, name, text="")
 
                 # File selection button and display for each row
-                file_prop_name = f"custom_file_{j}"
-                file_path = obj.get(file_prop_name, "")
+                file_path = doc.local_file
                 op = row.operator("object.open_filebrowser", text="Select File", icon='FILE_FOLDER')
                 op.row_index = j  # Pass the row index to the operator
 
@@ -247,9 +340,6 @@ class CustomObjectSpreadsheetPanel(bpy.types.Panel):
                 # Add the delete button here
                 op_del = row.operator("object.delete_string_row", text="", icon='TRASH')
                 op_del.row_index = j  # Pass the current row index to the delete operator
-                
-                
-                j += 1
         else:
             layout.label(text="No object selected.")
 
@@ -257,6 +347,8 @@ class CustomObjectSpreadsheetPanel(bpy.types.Panel):
 
 # Registration function remains mostly unchanged
 def register():
+    bpy.utils.register_class(DocumentRowPropertyGroup)
+    bpy.utils.register_class(OBJECT_OT_MigrateDocumentRows)
     bpy.utils.register_class(AddStringRowToObjectOperator)
     bpy.utils.register_class(RemoveStringRowFromObjectOperator)
     bpy.utils.register_class(RenameObjectOperator)
@@ -275,6 +367,8 @@ def register():
         default=""
     )
 
+    bpy.types.Object.document_rows = bpy.props.CollectionProperty(type=DocumentRowPropertyGroup)
+
 
 def unregister():
     bpy.utils.unregister_class(AddStringRowToObjectOperator)
@@ -287,6 +381,9 @@ def unregister():
     del bpy.types.Object.dropdown_list
     # Unregister the "MN" custom string property
     del bpy.types.Object.mn_custom_string
+    del bpy.types.Object.document_rows
+    bpy.utils.unregister_class(OBJECT_OT_MigrateDocumentRows)
+    bpy.utils.unregister_class(DocumentRowPropertyGroup)
 
 if __name__ == "__main__":
     register()
@@ -355,11 +452,9 @@ class StaticDataPanel(bpy.types.Panel):
                 row.label(text=name)
 
             
-            i = 1
-            while any(f"custom_string_{i}_{col}" in obj.keys() for col in range(1, 5)):
+            for doc in get_document_rows(obj):
                 row = layout.row()
-                prop_name_sap_dir = f'custom_string_{i}_2'  # Assuming SAP Dir is the second column
-                sap_dir_value = obj.get(prop_name_sap_dir, 'N/A')
+                sap_dir_value = doc.get("sap_dir", 'N/A')
                 
                 # Create a button with the document identifier that opens the SAP Dir URL
                 if sap_dir_value != 'N/A':
@@ -372,8 +467,7 @@ class StaticDataPanel(bpy.types.Panel):
               
               
                 # File selection button and display for each row
-                file_prop_name = f"custom_file_{i}"
-                file_path = obj.get(file_prop_name, "")
+                file_path = doc.get("local_file", "")
                 
                 if file_path:
                     op = row.operator("object.open_file", text="", icon='FILE_TICK')
@@ -383,11 +477,9 @@ class StaticDataPanel(bpy.types.Panel):
                     
                     
                 # Display other property values (Stated before) 4 columns (1-5)
-                for col in range(1, 5):
-                        prop_name = f'custom_string_{i}_{col}'
-                        value = obj.get(prop_name, 'N/A')
+                for name in DOCUMENT_COLUMNS:
+                        value = doc.get(name, 'N/A')
                         row.label(text=value)        
-                i += 1
         else:
             layout.label(text="No object selected.")
 
@@ -441,12 +533,10 @@ def update_object_list(self, context):
     selected_category = scene.my_tool.selected_tab
     # Clear existing list
     scene.object_list.clear()
-    # Populate list based on selected tab
-    for obj in scene.objects:
-        # Assuming `dropdown_list2` stores the category as string equivalent of the index
-        if hasattr(obj, "dropdown_list2") and str(obj.dropdown_list2) == selected_category:
-            item = scene.object_list.add()
-            item.name = obj.name
+    # Populate list based on selected tab, straight from the category index
+    for name in sorted(get_objects_in_category(scene, selected_category)):
+        item = scene.object_list.add()
+        item.name = name
 
 
 class MyToolPropertyGroup(bpy.types.PropertyGroup):
@@ -541,6 +631,8 @@ class OBJECT_PT_CustomPanel(bpy.types.Panel):
         layout.prop(my_tool, "selected_tab", expand=True)
         # New button to collect all categorized objects
         layout.operator("object.collect_all_categorized_objects", text="Collect All Categorized Objects")
+        # Debug check of the category index against a full scan
+        layout.operator("object.verify_object_index", text="Verify Object Index", icon='CHECKMARK')
         
         #List view of objects
         layout.template_list("SCENE_UL_ObjectList", "The_List", scene, "object_list", scene, "list_index")
@@ -568,10 +660,10 @@ class OBJECT_OT_CollectAllCategorizedObjects(bpy.types.Operator):
         scene.object_list.clear()
 
         # Fetch objects with dropdown_list2 set to 1, 2, or 3
-        for obj in scene.objects:
-            if "dropdown_list2" in obj and obj["dropdown_list2"] in {1, 2, 3}:
+        for category in (1, 2, 3):
+            for name in sorted(get_objects_in_category(scene, category)):
                 item = scene.object_list.add()
-                item.name = obj.name
+                item.name = name
 
         return {'FINISHED'}
 
@@ -661,6 +753,9 @@ if __name__ == "__main__":
 import bpy
 import os
 import csv
+import threading
+import functools
+from csv_export_rows import LONG_FORMAT_FIELDS, WIDE_FORMAT_FIELDS, EXPORT_FORMATS
 
 # Operator to export custom properties of the selected object to a CSV file
 class ExportSelectedObjectCSV(bpy.types.Operator):
@@ -670,8 +765,9 @@ class ExportSelectedObjectCSV(bpy.types.Operator):
     def execute(self, context):
         object = context.object
         if object:
-            filepath = os.path.join(bpy.path.abspath("//"), f"{object.name}_properties.csv")
-            export_custom_properties_to_csv([object], filepath)
+            export_format = context.scene.csv_export_format
+            filepath = os.path.join(bpy.path.abspath("//"), export_filename(f"{object.name}_properties", export_format))
+            export_custom_properties_to_csv([object], filepath, export_format)
             self.report({'INFO'}, f"Exported properties of '{object.name}' to {filepath}")
         else:
             self.report({'ERROR'}, "No object selected")
@@ -679,72 +775,191 @@ class ExportSelectedObjectCSV(bpy.types.Operator):
 
 # Operator to export custom properties of all objects in the scene to a CSV file
 class ExportAllObjectsCSV(bpy.types.Operator):
+    """Export all objects to CSV on a background thread, ESC cancels"""
     bl_idname = "export.all_objects_csv"
     bl_label = "Export All Objects to CSV"
 
+    _timer = None
+    _job = None
+
     def execute(self, context):
         objects = context.scene.objects
-        filepath = os.path.join(bpy.path.abspath("//"), "all_objects_properties.csv")
-        export_custom_properties_to_csv(objects, filepath)
+        export_format = context.scene.csv_export_format
+        filepath = os.path.join(bpy.path.abspath("//"), export_filename("all_objects_properties", export_format))
+        export_custom_properties_to_csv(objects, filepath, export_format)
         self.report({'INFO'}, f"Exported properties of all objects to {filepath}")
         return {'FINISHED'}
 
-def export_custom_properties_to_csv(objects, filepath):
-    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-        # Include additional fields for MN, dropdown_list2, and dropdown_list1
-        fieldnames = ['object_name', 'MN', 'Category', 'Subcategory', 'property_name', 'property_value']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        has_custom_string = False
-        
-        
-        
-        item1 = ['WP_X', 'WP03', 'WP04', 'WP05', 'WP06','WP07','WP08', 'WP09', 'WP10','RTP', 'CPI']
-        item2 = ['-','Main Equipment', 'Tools', 'Auxillary Equipment']
-        ## ^^^^ ['-','Main Equipment', 'Tools', 'Auxillary Equipment'] if '-' is with by deafualt, it will include Everything!
-        
-        for obj in objects:
-            mn_value = obj.get("mn_custom_string", "")
-            # Convert stored index to integer and use it to access the respective list
-            # Ensure to handle cases where the property might not exist or have a non-integer value
-            try:
-                dropdown_list1_index = int(obj.get("dropdown_list1", ""))  # Default to 0 (now replaced with "") or any appropriate default index
-                dropdown_list1_value = item1[dropdown_list1_index]
-            except (ValueError, IndexError):
-                dropdown_list1_value = "Invalid selection"  # Handle invalid index
-            
-            try:
-                dropdown_list2_index = int(obj.get("dropdown_list2", ""))  # Default to 0
-                dropdown_list2_value = item2[dropdown_list2_index]
-            except (ValueError, IndexError):
-                dropdown_list2_value = "Invalid selection"  # Handle invalid index
-    
-            
-
-            
-            for key in obj.keys():
-                if key.startswith("custom_string_"):
-                    writer.writerow({
-                        'object_name': obj.name,
-                        'MN': mn_value,
-                        'Category': dropdown_list2_value,  # Assuming 'Category' represents 'dropdown_list2'
-                        'Subcategory': dropdown_list1_value,  # Assuming 'Subcategory' represents 'dropdown_list1'
-                        'property_name': key,
-                        'property_value': obj[key]
-                    })
-                    has_custom_string = True
-            
-            # If the object doesn't have custom_string_ properties but you still want to output its other properties
-            if not has_custom_string:
-                writer.writerow({
-                    'object_name': obj.name,
-                    'MN': mn_value,
-                    'Category': dropdown_list2_value,
-                    'Subcategory': dropdown_list1_value,
-                    'property_name': '',
-                    'property_value': ''
-                })
+    def invoke(self, context, event):
+        export_format = context.scene.csv_export_format
+        filepath = os.path.join(bpy.path.abspath("//"), export_filename("all_objects_properties", export_format))
+        self._job = CSVExportJob(snapshot_export_objects(context.scene.objects), filepath,
+                                 functools.partial(write_format_csv, export_format))
+        return start_background_export(self, context)
+
+    def modal(self, context, event):
+        return poll_background_export(self, context, event)
+
+    def cancel(self, context):
+        stop_background_export(self, context)
+
+
+# Objects written per batch by the background exporter, also how often progress is updated
+EXPORT_BATCH_SIZE = 2000
+
+
+def export_label(obj, key, items):
+    # Convert stored index to integer and use it to access the respective list
+    # Ensure to handle cases where the property might not exist or have a non-integer value
+    try:
+        return items[int(obj.get(key, ""))]  # Default to "" so unset values count as invalid
+    except (ValueError, IndexError):
+        return "Invalid selection"  # Handle invalid index
+
+
+# Labels written for dropdown_list1 / dropdown_list2, the CSV import maps them back
+EXPORT_WORK_PACKAGE_ITEMS = ['WP_X', 'WP03', 'WP04', 'WP05', 'WP06','WP07','WP08', 'WP09', 'WP10','RTP', 'CPI']
+EXPORT_CATEGORY_ITEMS = ['-','Main Equipment', 'Tools', 'Auxillary Equipment']
+## ^^^^ ['-','Main Equipment', 'Tools', 'Auxillary Equipment'] if '-' is with by deafualt, it will include Everything!
+
+
+def snapshot_export_objects(objects):
+    """Cheap main-thread copy of everything the CSV writers need, safe to hand to a worker thread"""
+    item1 = EXPORT_WORK_PACKAGE_ITEMS
+    item2 = EXPORT_CATEGORY_ITEMS
+
+    # (object_name, MN, Category (dropdown_list2), Subcategory (dropdown_list1), document rows)
+    return [
+        (obj.name,
+         obj.get("mn_custom_string", ""),
+         export_label(obj, "dropdown_list2", item2),
+         export_label(obj, "dropdown_list1", item1),
+         get_document_rows(obj))
+        for obj in objects
+    ]
+
+
+def export_filename(base, export_format):
+    return f"{base}_wide.csv" if export_format == 'WIDE' else f"{base}.csv"
+
+
+def write_format_csv(export_format, job, csvfile):
+    fields, iter_objects = EXPORT_FORMATS[export_format]
+    writer = csv.writer(csvfile)
+    writer.writerow(fields)
+    batch = []
+    for done, object_rows in enumerate(iter_objects(job.snapshot), 1):
+        batch.extend(object_rows)
+        if done % EXPORT_BATCH_SIZE == 0:
+            writer.writerows(batch)
+            batch.clear()
+            job.done = done
+            if job.cancelled():
+                return
+    writer.writerows(batch)
+    job.done = job.total
+
+
+def export_custom_properties_to_csv(objects, filepath, export_format='LONG'):
+    job = CSVExportJob(snapshot_export_objects(objects), filepath, functools.partial(write_format_csv, export_format))
+    job.run()
+    if job.error:
+        raise job.error
+
+
+class CSVExportJob:
+    """Writes an export snapshot on a worker thread.
+
+    The file is written next to the target and moved into place when complete,
+    so a cancelled or failed export never leaves a half written CSV behind.
+    """
+
+    def __init__(self, snapshot, filepath, write, binary=False, finish=None):
+        self.snapshot = snapshot
+        self.filepath = filepath
+        self.write = write
+        self.binary = binary
+        self.finish = finish  # Called on the worker thread once the file is in place
+        self.total = len(snapshot)
+        self.done = 0
+        self.error = None
+        self.summary = None
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def finished(self):
+        return not self.thread.is_alive()
+
+    def run(self):
+        temp_path = f"{self.filepath}.part"
+        try:
+            if self.binary:
+                csvfile = open(temp_path, 'wb', buffering=1024 * 1024)
+            else:
+                csvfile = open(temp_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024)
+            with csvfile:
+                self.write(self, csvfile)
+            if self.cancelled():
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, self.filepath)
+                if self.finish:
+                    self.finish(self)
+        except Exception as e:
+            self.error = e
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+def start_background_export(operator, context):
+    """Start operator._job and poll it from a modal timer, progress goes to the status bar"""
+    operator._job.start()
+    wm = context.window_manager
+    operator._timer = wm.event_timer_add(0.1, window=context.window)
+    wm.modal_handler_add(operator)
+    return {'RUNNING_MODAL'}
+
+
+def poll_background_export(operator, context, event):
+    job = operator._job
+    if event.type == 'ESC':
+        job.cancel()
+
+    if event.type != 'TIMER':
+        return {'PASS_THROUGH'}
+
+    if not job.finished():
+        context.workspace.status_text_set(f"Exporting CSV: {job.done}/{job.total} objects (ESC to cancel)")
+        return {'PASS_THROUGH'}
+
+    stop_background_export(operator, context)
+    if job.error:
+        operator.report({'ERROR'}, f"Export failed: {job.error}")
+        return {'CANCELLED'}
+    if job.cancelled():
+        operator.report({'WARNING'}, "Export cancelled")
+        return {'CANCELLED'}
+    summary = f" ({job.summary})" if job.summary else ""
+    operator.report({'INFO'}, f"Exported properties of {job.total} objects to {job.filepath}{summary}")
+    return {'FINISHED'}
+
+
+def stop_background_export(operator, context):
+    if operator._timer:
+        context.window_manager.event_timer_remove(operator._timer)
+        operator._timer = None
+    if operator._job and not operator._job.finished():
+        operator._job.cancel()
+    context.workspace.status_text_set(None)
 
 # Panel to hold the export buttons
 class OBJECT_PT_CustomPropertiesExportPanel(bpy.types.Panel):
@@ -756,18 +971,34 @@ class OBJECT_PT_CustomPropertiesExportPanel(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
+        layout.prop(context.scene, "csv_export_format", expand=True)
         layout.operator("export.selected_object_csv", text="Export Selected Object")
         layout.operator("export.all_objects_csv", text="Export All Objects")
+        layout.operator("export.all_objects_csv_incremental", text="Export All Objects (Incremental)")
+        layout.operator("export.all_objects_csv_partitioned", text="Export per Work Package").partition_by = 'WORK_PACKAGE'
+        layout.operator("export.all_objects_csv_partitioned", text="Export per Category").partition_by = 'CATEGORY'
+        layout.separator()
+        layout.operator("import.objects_csv", text="Import CSV (Dry Run)").apply = False
+        layout.operator("import.objects_csv", text="Import CSV").apply = True
 
 def register():
     bpy.utils.register_class(ExportSelectedObjectCSV)
     bpy.utils.register_class(ExportAllObjectsCSV)
     bpy.utils.register_class(OBJECT_PT_CustomPropertiesExportPanel)
+    bpy.types.Scene.csv_export_format = bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ('LONG', "Long", "One CSV row per document cell"),
+            ('WIDE', "Wide", "One CSV row per document, with a column per document field"),
+        ],
+        default='LONG'
+    )
 
 def unregister():
     bpy.utils.unregister_class(ExportSelectedObjectCSV)
     bpy.utils.unregister_class(ExportAllObjectsCSV)
     bpy.utils.unregister_class(OBJECT_PT_CustomPropertiesExportPanel)
+    del bpy.types.Scene.csv_export_format
 
 if __name__ == "__main__":
     register()
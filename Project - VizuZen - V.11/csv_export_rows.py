@@ -0,0 +1,85 @@
+###################################################################### CSV export rows
+# Plain Python, no bpy: the scripts exec'd by main.py import this module, and so do
+# the worker processes of the partitioned export, which run Blender's Python without Blender
+import io
+import csv
+import hashlib
+
+
+# Document table columns, in the order of the old custom_string_{i}_{col} columns 1-4
+DOCUMENT_COLUMNS = ["description", "sap_dir", "status", "version"]
+
+LONG_FORMAT_FIELDS = ['object_name', 'MN', 'Category', 'Subcategory', 'property_name', 'property_value']
+WIDE_FORMAT_FIELDS = ['object_name', 'MN', 'Category', 'Subcategory', 'Description', 'SAP Dir', 'Status', 'Version', 'Local File']
+
+
+def iter_long_format_objects(snapshot):
+    """Long format CSV rows of each snapshot entry, one list per object"""
+    # Not reset per object, so objects after the first one with documents get no placeholder row
+    has_custom_string = False
+    for name, mn_value, category, subcategory, rows in snapshot:
+        object_rows = []
+        # Document cells keep their old custom_string_{row}_{col} names in the long format
+        for i, doc in enumerate(rows, 1):
+            for col, column in enumerate(DOCUMENT_COLUMNS, 1):
+                if column in doc:
+                    object_rows.append((name, mn_value, category, subcategory, f"custom_string_{i}_{col}", doc[column]))
+                    has_custom_string = True
+
+        # If the object doesn't have custom_string_ properties but you still want to output its other properties
+        if not has_custom_string:
+            object_rows.append((name, mn_value, category, subcategory, '', ''))
+        yield object_rows
+
+
+def iter_wide_format_objects(snapshot):
+    """Wide format CSV rows of each snapshot entry, one line per document, one list per object"""
+    for name, mn_value, category, subcategory, rows in snapshot:
+        if not rows:
+            yield [(name, mn_value, category, subcategory, '', '', '', '', '')]
+            continue
+        yield [(name, mn_value, category, subcategory,
+                doc.get("description", ''), doc.get("sap_dir", ''), doc.get("status", ''),
+                doc.get("version", ''), doc.get("local_file", ''))
+               for doc in rows]
+
+
+# Export format -> (header, per-object row generator)
+EXPORT_FORMATS = {
+    'LONG': (LONG_FORMAT_FIELDS, iter_long_format_objects),
+    'WIDE': (WIDE_FORMAT_FIELDS, iter_wide_format_objects),
+}
+
+
+def encode_csv_rows(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def write_partition_file(export_format, temp_path, entries, batch_size):
+    """Write the rows of snapshot entries to temp_path, returns (objects, rows, sha256).
+
+    Runs in a worker process of the partitioned export; entries are plain snapshot
+    tuples, and moving the file into place is left to the caller.
+    """
+    fields, iter_objects = EXPORT_FORMATS[export_format]
+    checksum = hashlib.sha256()
+    row_count = 0
+    with open(temp_path, 'wb', buffering=1024 * 1024) as out:
+        def emit(rows):
+            data = encode_csv_rows(rows)
+            checksum.update(data)
+            out.write(data)
+
+        emit([fields])
+        batch = []
+        for done, object_rows in enumerate(iter_objects(entries), 1):
+            batch.extend(object_rows)
+            if done % batch_size == 0:
+                emit(batch)
+                row_count += len(batch)
+                batch = []
+        emit(batch)
+        row_count += len(batch)
+    return len(entries), row_count, checksum.hexdigest()
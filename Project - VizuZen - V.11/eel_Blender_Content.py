@@ -2,6 +2,8 @@ import bpy
 import eel
 import threading
 import json
+import time
+from collections import deque
 
 # Global variable to track current page and frame update state
 current_page = None
@@ -39,16 +41,115 @@ def run_eel():
         print(f"Error starting Eel: {e}")
 
 # Enhanced timeline functionality
-def update_timeline(frame):
-    """Update Blender's timeline to the specified frame"""
+def scrub_to_frame(frame):
+    """Evaluate the scene at a frame, returns the frame reached (main thread only)"""
     global is_updating
     if not is_updating:
         try:
             is_updating = True
-            bpy.context.scene.frame_set(int(frame))
-            return bpy.context.scene.frame_current
+            bpy.context.scene.frame_set(frame)
         finally:
             is_updating = False
+    return bpy.context.scene.frame_current
+
+class FrameScrubChannel:
+    """Latest-wins frame requests from the timeline slider.
+
+    Every frame_set is a full depsgraph evaluation, so only the newest requested
+    frame is kept and at most one evaluation is queued on the main-thread
+    dispatcher at a time; it reads the newest frame when it runs. A request that
+    is superseded before it was evaluated is answered right away with the frame
+    Blender last reached, so the UI never waits on a backlog. When the queued
+    evaluation is dropped (dispatcher stopped) or fails, every pending request is
+    answered with the error and the next request schedules a new evaluation.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sequence = 0
+        self.latest = None           # (sequence, frame) of the newest request not evaluated yet
+        self.reached = (0, None)     # (sequence, frame) of the last evaluated request
+        self.scheduled = False
+        self.failed = (0, None)      # (sequence, error) of the newest request whose evaluation was lost
+        self.stats = {"requests": 0, "evaluations": 0, "failures": 0}
+
+    def request(self, frame):
+        with self.lock:
+            self.sequence += 1
+            self.latest = (self.sequence, frame)
+            self.stats["requests"] += 1
+            sequence = self.sequence
+            schedule = not self.scheduled
+            self.scheduled = True
+        if schedule:
+            self.schedule()
+        return sequence
+
+    def schedule(self):
+        main_thread_dispatcher.submit(self.evaluate).add_done_callback(self.evaluation_done)
+
+    def evaluation_done(self, future):
+        error = future.exception()
+        if error is None:
+            return
+        print(f"Frame scrub evaluation dropped: {error}")
+        with self.lock:
+            self.scheduled = False
+            self.latest = None
+            self.failed = (self.sequence, str(error))
+            self.stats["failures"] += 1
+
+    def evaluate(self):
+        with self.lock:
+            sequence, frame = self.latest
+            self.latest = None
+        try:
+            reached = scrub_to_frame(frame)
+        except Exception as e:
+            print(f"Error scrubbing to frame {frame}: {e}")
+            reached = bpy.context.scene.frame_current
+        with self.lock:
+            self.reached = (sequence, reached)
+            self.stats["evaluations"] += 1
+            self.scheduled = self.latest is not None
+            if not self.scheduled:
+                return
+        self.schedule()
+
+    def wait(self, sequence):
+        """{"frame": frame reached, "superseded": whether a newer request replaced this one},
+        plus "error" when the evaluation of this request was lost"""
+        while True:
+            with self.lock:
+                reached_sequence, reached = self.reached
+                if reached_sequence >= sequence or self.sequence > sequence:
+                    return {"frame": reached, "superseded": reached_sequence != sequence}
+                failed_sequence, error = self.failed
+                if failed_sequence >= sequence:
+                    return {"frame": reached, "superseded": False, "error": error}
+            eel.sleep(RPC_POLL_INTERVAL)
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats, superseded=self.stats["requests"] - self.stats["evaluations"])
+
+frame_scrub = FrameScrubChannel()
+
+def update_timeline(frame):
+    """Update Blender's timeline to the specified frame, superseded requests are dropped"""
+    frame = int(frame)
+    if threading.current_thread() is threading.main_thread():
+        return {"success": True, "requested": frame, "frame": scrub_to_frame(frame), "superseded": False}
+    result = frame_scrub.wait(frame_scrub.request(frame))
+    return dict(result, success="error" not in result, requested=frame)
+
+def get_event_bus_stats():
+    """Events published for the web UI, how many were coalesced or dropped, and batches awaiting a reply"""
+    return {"success": True, "stats": event_bus.get_stats()}
+
+def get_scrub_stats():
+    """Frames requested by the timeline slider and how many of them were actually evaluated"""
+    return {"success": True, "stats": frame_scrub.get_stats()}
 
 def get_current_frame():
     """Get the current frame from Blender's timeline"""
@@ -61,46 +162,211 @@ def set_current_frame(frame):
         try:
             is_updating = True
             bpy.context.scene.frame_current = frame
-            eel.updateCurrentFrame(frame)()  # Update UI
+            event_bus.publish("frame", frame, key="frame")  # Update UI
         finally:
             is_updating = False
 
+def match_markers(markers_data, existing):
+    """Pair UI markers with existing ones: by last sync, then same name and frame, same name, same frame.
+    Every lookup is a dict pop, so the sync stays linear in the number of markers.
+    Returns ([(ui marker, Blender marker or None)], unmatched Blender markers)"""
+    free = {marker.as_pointer(): marker for marker in existing}
+    indexes = ({}, {}, {})  # (name, frame), name, frame -> markers, in collection order
+    for marker in existing:
+        for index, key in zip(indexes, ((marker.name, marker.frame), marker.name, marker.frame)):
+            index.setdefault(key, deque()).append(marker)
+    pairs = [[entry, None] for entry in markers_data]
+
+    for pair in pairs:
+        marker_id = pair[0].get('id')
+        if marker_id is not None:
+            pair[1] = free.pop(marker_bindings.get(str(marker_id)), None)
+
+    for index, key_of in zip(indexes, (lambda entry: (entry['name'], entry['frame']),
+                                       lambda entry: entry['name'],
+                                       lambda entry: entry['frame'])):
+        for pair in pairs:
+            if pair[1] is not None:
+                continue
+            candidates = index.get(key_of(pair[0]))
+            # Markers claimed through another index are still listed here, skip them on the way
+            while candidates:
+                marker = free.pop(candidates.popleft().as_pointer(), None)
+                if marker is not None:
+                    pair[1] = marker
+                    break
+
+    return pairs, list(free.values())
+
 def update_markers(markers_data):
-    """Update timeline markers with error handling"""
+    """Sync timeline markers with the sections, only the markers that differ are added, moved, renamed or removed.
+    Kept markers keep their camera bindings and selection. Returns the applied diff"""
     try:
         scene = bpy.context.scene
-        scene.timeline_markers.clear()
-        for marker in markers_data:
-            scene.timeline_markers.new(marker['name'], frame=marker['frame'])
+        markers = scene.timeline_markers
+        markers_data = [dict(entry, frame=int(entry['frame'])) for entry in markers_data]
+        pairs, unmatched = match_markers(markers_data, list(markers))
+        diff = {"added": [], "moved": [], "renamed": [], "removed": []}
+        unchanged = 0
+
+        for marker in unmatched:
+            diff["removed"].append({"name": marker.name, "frame": marker.frame})
+            markers.remove(marker)
+
+        marker_bindings.clear()
+        for entry, marker in pairs:
+            marker_id = entry.get('id')
+            if marker is None:
+                marker = markers.new(entry['name'], frame=entry['frame'])
+                diff["added"].append({"id": marker_id, "name": entry['name'], "frame": entry['frame']})
+            else:
+                changed = False
+                if marker.frame != entry['frame']:
+                    diff["moved"].append({"id": marker_id, "name": entry['name'], "from": marker.frame, "to": entry['frame']})
+                    marker.frame = entry['frame']
+                    changed = True
+                if marker.name != entry['name']:
+                    diff["renamed"].append({"id": marker_id, "frame": entry['frame'], "from": marker.name, "to": entry['name']})
+                    marker.name = entry['name']
+                    changed = True
+                unchanged += not changed
+            # Markers without an id are matched by name and frame only
+            if marker_id is not None:
+                marker_bindings[str(marker_id)] = marker.as_pointer()
+
+        if any(diff.values()):
+            invalidate_marker_index()
+        return {"success": True, "diff": diff, "unchanged": unchanged}
     except Exception as e:
         print(f"Error updating markers: {e}")
+        return {"success": False, "message": str(e)}
 
-@bpy.app.handlers.frame_change_post.append
-def frame_change_handler(scene):
-    """Handler for frame changes in Blender"""
-    global is_updating
+@bpy.app.handlers.persistent
+def frame_change_handler(scene, depsgraph=None):
+    """Handler for frame changes in Blender, the push itself is coalesced by the push scheduler"""
     if not is_updating:
         try:
-            is_updating = True
-            current_frame = scene.frame_current
-            eel.updateCurrentFrame(current_frame)()
+            # During playback the browser runs its own clock, frames only correct its direction
+            if playback_clock.active or playback_clock.detect_start(scene):
+                playback_clock.frame_changed(scene)
+            else:
+                push_scheduler.mark_dirty("frame", scene.frame_current)
         except Exception as e:
             print(f"Error in frame change handler: {e}")
-        finally:
-            is_updating = False
+
+def push_current_frame(frame, idle):
+    """Send the latest frame to the web UI, a frame still queued for a slow browser is replaced"""
+    event_bus.publish("frame", frame, key="frame")
+
+# Seconds between drift corrections sent to the browser's playback clock
+PLAYBACK_SYNC_INTERVAL = 1.0
+
+def is_animation_playing():
+    screen = bpy.context.screen
+    if screen is not None:
+        return screen.is_animation_playing
+    return any(window.screen.is_animation_playing for window in bpy.context.window_manager.windows)
+
+class PlaybackClock:
+    """Timeline sync while Blender plays the animation.
+
+    Instead of a frame push per played frame the browser gets one playback_start
+    event with the frame, fps, range and direction, and animates the slider with
+    its own clock. A timer sends a playback_sync correction with the current frame
+    every PLAYBACK_SYNC_INTERVAL and ends the playback (playback_stop, with the
+    final frame) once Blender has stopped. Playback is noticed by the playback
+    handlers where Blender has them, and by the first played frame otherwise.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.direction = 1
+        self.last_frame = None
+        self.timer = self.tick  # Keep one bound method so the timer can be unregistered
+
+    def detect_start(self, scene):
+        if is_animation_playing():
+            self.start(scene)
+        return self.active
+
+    def start(self, scene):
+        if self.active:
+            return
+        self.active = True
+        self.direction = 1
+        self.last_frame = scene.frame_current
+        self.publish_start(scene)
+        if not bpy.app.timers.is_registered(self.timer):
+            bpy.app.timers.register(self.timer, first_interval=PLAYBACK_SYNC_INTERVAL, persistent=True)
+
+    def publish_start(self, scene):
+        if scene.use_preview_range:
+            frame_start, frame_end = scene.frame_preview_start, scene.frame_preview_end
+        else:
+            frame_start, frame_end = scene.frame_start, scene.frame_end
+        event_bus.publish("playback_start", {
+            "frame": scene.frame_current,
+            "fps": scene.render.fps / scene.render.fps_base,
+            "frame_start": frame_start,
+            "frame_end": frame_end,
+            "direction": self.direction,
+        }, key="playback")
+
+    def frame_changed(self, scene):
+        frame = scene.frame_current
+        step = frame - self.last_frame
+        self.last_frame = frame
+        # A jump over half the range is the loop back to the other end, not the direction
+        frame_range = max(scene.frame_end - scene.frame_start, 1)
+        if step and abs(step) < frame_range / 2 and (step > 0) != (self.direction > 0):
+            self.direction = 1 if step > 0 else -1
+            self.publish_start(scene)
+
+    def tick(self):
+        scene = bpy.context.scene
+        if not is_animation_playing():
+            self.stop(scene)
+            return None
+        event_bus.publish("playback_sync", {"frame": scene.frame_current}, key="playback_sync")
+        return PLAYBACK_SYNC_INTERVAL
+
+    def stop(self, scene=None):
+        if bpy.app.timers.is_registered(self.timer):
+            bpy.app.timers.unregister(self.timer)
+        if not self.active:
+            return
+        self.active = False
+        if scene is not None:
+            event_bus.publish("playback_stop", {"frame": scene.frame_current}, key="playback")
+
+# Re-running the script must not leave the previous clock's timer behind
+if "playback_clock" in globals():
+    playback_clock.stop()
+
+playback_clock = PlaybackClock()
+
+@bpy.app.handlers.persistent
+def playback_started(scene, depsgraph=None):
+    playback_clock.start(scene)
+
+@bpy.app.handlers.persistent
+def playback_stopped(scene, depsgraph=None):
+    playback_clock.stop(scene)
+
+# Blender versions without the playback handlers fall back on the frame handler and the timer
+PLAYBACK_HANDLERS = [
+    (getattr(bpy.app.handlers, "animation_playback_pre", None), playback_started),
+    (getattr(bpy.app.handlers, "animation_playback_post", None), playback_stopped),
+]
 
 def jump_to_next_marker():
     """Jump to next marker with error handling"""
     try:
         scene = bpy.context.scene
         current_frame = scene.frame_current
-        next_marker = None
-        for marker in scene.timeline_markers:
-            if marker.frame > current_frame:
-                if next_marker is None or marker.frame < next_marker.frame:
-                    next_marker = marker
-        if next_marker:
-            set_current_frame(next_marker.frame)
+        next_frame = next_marker_frame(scene, current_frame)
+        if next_frame is not None:
+            set_current_frame(next_frame)
         return scene.frame_current
     except Exception as e:
         print(f"Error jumping to next marker: {e}")
@@ -111,18 +377,38 @@ def jump_to_previous_marker():
     try:
         scene = bpy.context.scene
         current_frame = scene.frame_current
-        prev_marker = None
-        for marker in scene.timeline_markers:
-            if marker.frame < current_frame:
-                if prev_marker is None or marker.frame > prev_marker.frame:
-                    prev_marker = marker
-        if prev_marker:
-            set_current_frame(prev_marker.frame)
+        prev_frame = previous_marker_frame(scene, current_frame)
+        if prev_frame is not None:
+            set_current_frame(prev_frame)
         return scene.frame_current
     except Exception as e:
         print(f"Error jumping to previous marker: {e}")
         return current_frame
 
+def get_marker_frames(start, end):
+    """Every marker from start to end (inclusive) in one call, sorted by frame"""
+    try:
+        markers = markers_in_range(bpy.context.scene, int(start), int(end))
+        return {"success": True, "markers": [{"frame": frame, "name": name} for frame, name in markers]}
+    except Exception as e:
+        print(f"Error getting marker frames: {e}")
+        return {"success": False, "message": str(e)}
+
+def get_marker_neighbours(frame):
+    """Frames of the previous, next and nearest marker around a frame, None where there is none"""
+    try:
+        scene = bpy.context.scene
+        frame = int(frame)
+        return {
+            "success": True,
+            "previous": previous_marker_frame(scene, frame),
+            "next": next_marker_frame(scene, frame),
+            "nearest": nearest_marker_frame(scene, frame),
+        }
+    except Exception as e:
+        print(f"Error getting marker neighbours: {e}")
+        return {"success": False, "message": str(e)}
+
 def switch_page(page_name):
     """Handle page switching requests from JavaScript"""
     try:
@@ -138,50 +424,129 @@ def switch_page(page_name):
 
 # eel_Blender_Contents Python script is moved here for now.
 
+# Table sync mode: 'delta' pushes only changed objects, 'full' re-sends the whole scene
+TABLE_SYNC_MODE = 'delta'
+
+# What the web2 table currently holds, used to work out deltas
+table_sync_state = {
+    "scene": None,  # as_pointer() of the scene the client was last fully synced with
+    "rows": {},     # object name -> serialized object
+}
+
+def serialize_object(obj):
+    """Serialize a single object the way the web2 table expects it"""
+    return {
+        "name": obj.name,
+        "category": get_category(obj),
+        "wp": get_work_package(obj),
+        "mn": obj.get("mn_custom_string", ""),
+        "properties": get_custom_properties(obj)
+    }
+
 def get_object_data():
+    """Full snapshot of the scene, also resets the delta baseline for the client"""
+    scene = bpy.context.scene
     data = []
-    for obj in bpy.context.scene.objects:
-        obj_data = {
-            "name": obj.name,
-            "category": get_category(obj),
-            "wp": get_work_package(obj),
-            "mn": obj.get("mn_custom_string", ""),
-            "properties": get_custom_properties(obj)
-        }
+    rows = {}
+    for obj in scene.objects:
+        obj_data = serialize_object(obj)
         data.append(obj_data)
+        rows[obj.name] = obj_data
+    table_sync_state.update(scene=scene.as_pointer(), rows=rows)
     return json.dumps(data)
 
+CATEGORY_LABELS = ['-', 'Main Equipment', 'Tools', 'Auxiliary Equipment']
+WORK_PACKAGE_LABELS = ['WP_X', 'WP03', 'WP04', 'WP05', 'WP06', 'WP07', 'WP08', 'WP09', 'WP10', 'RTP', 'CPI']
+
 def get_category(obj):
-    categories = ['-', 'Main Equipment', 'Tools', 'Auxiliary Equipment']
+    category = get_object_classification(obj)[0]
     try:
-        return categories[int(obj.get("dropdown_list2", 0))]
-    except (ValueError, IndexError):
+        return CATEGORY_LABELS[category]
+    except (TypeError, IndexError):
         return "Uncategorized"
 
 def get_work_package(obj):
-    wp_list = ['WP_X', 'WP03', 'WP04', 'WP05', 'WP06', 'WP07', 'WP08', 'WP09', 'WP10', 'RTP', 'CPI']
+    work_package = get_object_classification(obj)[1]
     try:
-        return wp_list[int(obj.get("dropdown_list1", 0))]
-    except (ValueError, IndexError):
+        return WORK_PACKAGE_LABELS[work_package]
+    except (TypeError, IndexError):
         return "Unknown"
 
 def get_custom_properties(obj):
     props = {}
-    for i in range(1, 100):  # Assuming a maximum of 99 rows
-        row_props = {}
-        for col in range(1, 5):  # 4 columns
-            key = f"custom_string_{i}_{col}"
-            if key in obj:
-                row_props[f"col{col}"] = obj[key]
-        if row_props:
-            props[f"row{i}"] = row_props
-        else:
-            break  # No more rows
+    for i, doc in enumerate(get_document_rows(obj), 1):
+        props[f"row{i}"] = {f"col{col}": doc[name] for col, name in enumerate(DOCUMENT_COLUMNS, 1) if name in doc}
     return props
 
 
-def update_eel_data(dummy):
-    eel.updateTable(get_object_data())
+def collect_table_changes(changes):
+    """(names to send again, names to delete, full resync) for one scene update"""
+    if changes["reset"]:
+        return set(), set(), True
+    return (changes["touched"].keys() | changes["added"],
+            changes["removed"] | changes["renamed"].keys(), False)
+
+def compute_table_delta(scene, upserts, drops):
+    """Build insert/update/delete deltas against what the client holds, or None if a full resync is needed"""
+    if table_sync_state["scene"] != scene.as_pointer():
+        return None
+
+    rows = table_sync_state["rows"]
+    changed = []
+    deletes = [name for name in drops if rows.pop(name, None) is not None]
+
+    for name in upserts:
+        obj = scene.objects.get(name)
+        if obj is None:
+            if rows.pop(name, None) is not None:
+                deletes.append(name)
+            continue
+
+        obj_data = serialize_object(obj)
+        if rows.get(name) != obj_data:
+            rows[name] = obj_data
+            changed.append(obj_data)
+
+    # Rows can be deleted and re-inserted under the same name within one update
+    deletes = [name for name in deletes if name not in rows]
+    return {"upsert": changed, "delete": deletes}
+
+def merge_table_changes(pending, changes):
+    """Accumulate changed object names between two table pushes"""
+    if pending is None:
+        return changes
+    return pending[0] | changes[0], pending[1] | changes[1], pending[2] or changes[2]
+
+def push_table_changes(changes, idle):
+    """Send the accumulated table changes, the idle flush also reconciles scene membership"""
+    scene = bpy.context.scene
+    if idle:
+        # Not every deletion tags a collection, so check membership once things settle down.
+        # Anything found comes back through update_eel_data as another push
+        scene_changes.reconcile(scene)
+        return
+
+    upserts, drops, reset = changes
+    if reset:
+        table_sync_state.update(scene=None, rows={})
+    if TABLE_SYNC_MODE != 'delta':
+        publish_full_table()
+        return
+
+    delta = compute_table_delta(scene, upserts, drops)
+    if delta is None:
+        publish_full_table()
+    elif delta["upsert"] or delta["delete"]:
+        event_bus.publish("table_delta", json.dumps(delta))
+
+def publish_full_table():
+    # A full snapshot makes every delta still queued for the browser obsolete
+    event_bus.publish("table", get_object_data(), key="table", supersedes=("table_delta",))
+
+def update_eel_data(scene, changes):
+    """Record which objects changed, the push itself is coalesced by the push scheduler.
+    Undo, redo and newly loaded files always get a full resync"""
+    push_scheduler.mark_dirty("table", collect_table_changes(changes))
 
 class EelOperator(bpy.types.Operator):
     bl_idname = "wm.run_eel"
@@ -193,12 +558,118 @@ class EelOperator(bpy.types.Operator):
 
 def register():
     bpy.utils.register_class(EelOperator)
-    bpy.app.handlers.depsgraph_update_post.append(update_eel_data)
+    scene_changes.add_listener("table", update_eel_data)
 
 def unregister():
     bpy.utils.unregister_class(EelOperator)
-    bpy.app.handlers.depsgraph_update_post.remove(update_eel_data)
+    scene_changes.remove_listener("table")
+
+
+
+#################################################################################### Push scheduler
+
+# Rate limits for depsgraph driven UI pushes (flushes per second) and the settle delay in seconds
+TABLE_PUSH_RATE = 4.0
+TABLE_IDLE_DELAY = 0.5
+FRAME_PUSH_RATE = 30.0
+
+class PushScheduler:
+    """Coalesce dirty signals from Blender handlers into rate limited UI pushes.
+
+    Handlers only call mark_dirty(), the pushes run from a bpy.app.timers callback.
+    Each channel flushes at most max_rate times per second; signals arriving during
+    the cooldown are merged and sent as one trailing flush. Channels with an
+    idle_delay get one more flush (with idle=True) once no signal has arrived for
+    that long, which is where settle work such as full reconciliation belongs.
+    """
+
+    def __init__(self):
+        self.channels = {}
+        self.next_tick = None
+        self.in_tick = False
+        self.timer = self.tick  # Keep one bound method so the timer can be unregistered
+
+    def add_channel(self, name, flush, max_rate=10.0, idle_delay=None, merge=None):
+        self.channels[name] = {
+            "flush": flush,
+            "merge": merge or (lambda pending, payload: payload),
+            "min_interval": 1.0 / max_rate if max_rate else 0.0,
+            "idle_delay": idle_delay,
+            "dirty": False,
+            "pending": None,
+            "idle_pending": False,
+            "last_flush": 0.0,
+            "last_signal": 0.0,
+        }
+
+    def mark_dirty(self, name, payload=None):
+        channel = self.channels[name]
+        channel["pending"] = channel["merge"](channel["pending"] if channel["dirty"] else None, payload)
+        channel["dirty"] = True
+        channel["last_signal"] = time.monotonic()
+        self.schedule(self.due_time(channel))
+
+    def due_time(self, channel):
+        if channel["dirty"]:
+            return channel["last_flush"] + channel["min_interval"]
+        if channel["idle_pending"]:
+            return channel["last_signal"] + channel["idle_delay"]
+        return None
+
+    def schedule(self, due):
+        # While ticking, the tick itself works out when to run next
+        if due is None or self.in_tick:
+            return
+        if self.next_tick is not None and self.next_tick <= due and bpy.app.timers.is_registered(self.timer):
+            return
+        if bpy.app.timers.is_registered(self.timer):
+            bpy.app.timers.unregister(self.timer)
+        self.next_tick = due
+        bpy.app.timers.register(self.timer, first_interval=max(due - time.monotonic(), 0.0), persistent=True)
+
+    def flush(self, name, channel, now):
+        idle = not channel["dirty"]
+        payload = channel["pending"]
+        channel.update(dirty=False, pending=None, last_flush=now)
+        channel["idle_pending"] = channel["idle_delay"] is not None and not idle
+        try:
+            channel["flush"](payload, idle)
+        except Exception as e:
+            print(f"Error flushing {name} push: {e}")
+
+    def tick(self):
+        now = time.monotonic()
+        self.in_tick = True
+        try:
+            for name, channel in self.channels.items():
+                due = self.due_time(channel)
+                if due is not None and due <= now:
+                    self.flush(name, channel, now)
+        finally:
+            self.in_tick = False
+
+        dues = [due for due in map(self.due_time, self.channels.values()) if due is not None]
+        next_due = min(dues) if dues else None
+        self.next_tick = next_due
+        if next_due is None:
+            return None
+        return max(next_due - time.monotonic(), 0.0)
 
+    def cancel(self):
+        if bpy.app.timers.is_registered(self.timer):
+            bpy.app.timers.unregister(self.timer)
+        self.next_tick = None
+        for channel in self.channels.values():
+            channel.update(dirty=False, pending=None, idle_pending=False)
+
+# Re-running the script must not leave the previous scheduler's timer behind
+if "push_scheduler" in globals():
+    push_scheduler.cancel()
+
+push_scheduler = PushScheduler()
+push_scheduler.add_channel("table", push_table_changes, max_rate=TABLE_PUSH_RATE,
+                           idle_delay=TABLE_IDLE_DELAY, merge=merge_table_changes)
+push_scheduler.add_channel("frame", push_current_frame, max_rate=FRAME_PUSH_RATE)
 
 
 ###################################################################################3
@@ -212,19 +683,29 @@ def register():
         # Add frame change handler
         if frame_change_handler not in bpy.app.handlers.frame_change_post:
             bpy.app.handlers.frame_change_post.append(frame_change_handler)
+        for handlers, handler in PLAYBACK_HANDLERS:
+            if handlers is not None and handler not in handlers:
+                handlers.append(handler)
+
+        # Add object table change feed
+        scene_changes.add_listener("table", update_eel_data)
         
         # Clear and re-expose functions
         eel._exposed_functions.clear()
         
-        # Expose functions to JavaScript
-        eel.expose(update_markers)
-        eel.expose(get_current_frame)
-        eel.expose(set_current_frame)
-        eel.expose(update_timeline)
-        eel.expose(jump_to_next_marker)
-        eel.expose(jump_to_previous_marker)
+        # Expose functions to JavaScript, everything touching bpy runs on Blender's main thread
+        eel.expose(main_thread_rpc(update_markers))
+        eel.expose(main_thread_rpc(get_current_frame))
+        eel.expose(main_thread_rpc(set_current_frame))
+        eel.expose(update_timeline)  # Has its own latest-wins queue on the dispatcher
+        eel.expose(get_scrub_stats)
+        eel.expose(get_event_bus_stats)
+        eel.expose(main_thread_rpc(jump_to_next_marker))
+        eel.expose(main_thread_rpc(jump_to_previous_marker))
+        eel.expose(main_thread_rpc(get_marker_frames))
+        eel.expose(main_thread_rpc(get_marker_neighbours))
         eel.expose(switch_page)
-        eel.expose(get_object_data)
+        eel.expose(main_thread_rpc(get_object_data))
         
         print("Timeline handlers registered successfully")
     except Exception as e:
@@ -236,6 +717,16 @@ def unregister():
         # Remove frame change handler
         if frame_change_handler in bpy.app.handlers.frame_change_post:
             bpy.app.handlers.frame_change_post.remove(frame_change_handler)
+        for handlers, handler in PLAYBACK_HANDLERS:
+            if handlers is not None and handler in handlers:
+                handlers.remove(handler)
+        playback_clock.stop()
+
+        # Remove object table change feed
+        scene_changes.remove_listener("table")
+
+        # Drop any pushes still waiting on the scheduler
+        push_scheduler.cancel()
         
         print("Timeline handlers unregistered successfully")
     except Exception as e:
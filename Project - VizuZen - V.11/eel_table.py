@@ -1,24 +1,50 @@
 
 import bpy
 import eel
+import os
 import json
 import threading
 
+# Table pushes go through the outbound event bus and follow the scene change collector,
+# when this script runs on its own both are loaded here and register themselves
+for shared_name, shared_script in (("event_bus", 'blender_event_bus.py'), ("scene_changes", 'blender_scene_changes.py')):
+    if shared_name not in globals():
+        with open(os.path.join(bpy.path.abspath("//"), shared_script), 'r') as file:
+            exec(file.read())
+
 def run_eel():
     eel.init('web2')
     eel.start('index.html', mode='chrome', size=(800, 600))
 
+# Table sync mode: 'delta' pushes only changed objects, 'full' re-sends the whole scene
+TABLE_SYNC_MODE = 'delta'
+
+# What the web2 table currently holds, used to work out deltas
+table_sync_state = {
+    "scene": None,  # as_pointer() of the scene the client was last fully synced with
+    "rows": {},     # object name -> serialized object
+}
+
+def serialize_object(obj):
+    """Serialize a single object the way the web2 table expects it"""
+    return {
+        "name": obj.name,
+        "category": get_category(obj),
+        "wp": get_work_package(obj),
+        "mn": obj.get("mn_custom_string", ""),
+        "properties": get_custom_properties(obj)
+    }
+
 def get_object_data():
+    """Full snapshot of the scene, also resets the delta baseline for the client"""
+    scene = bpy.context.scene
     data = []
-    for obj in bpy.context.scene.objects:
-        obj_data = {
-            "name": obj.name,
-            "category": get_category(obj),
-            "wp": get_work_package(obj),
-            "mn": obj.get("mn_custom_string", ""),
-            "properties": get_custom_properties(obj)
-        }
+    rows = {}
+    for obj in scene.objects:
+        obj_data = serialize_object(obj)
         data.append(obj_data)
+        rows[obj.name] = obj_data
+    table_sync_state.update(scene=scene.as_pointer(), rows=rows)
     return json.dumps(data)
 
 def get_category(obj):
@@ -35,8 +61,18 @@ def get_work_package(obj):
     except (ValueError, IndexError):
         return "Unknown"
 
+# Document table columns, in the order of the old custom_string_{i}_{col} columns 1-4
+DOCUMENT_COLUMNS = ["description", "sap_dir", "status", "version"]
+
 def get_custom_properties(obj):
     props = {}
+    document_rows = getattr(obj, "document_rows", None)
+    if document_rows:
+        for i, row in enumerate(document_rows, 1):
+            props[f"row{i}"] = {f"col{col}": getattr(row, name) for col, name in enumerate(DOCUMENT_COLUMNS, 1)}
+        return props
+
+    # Objects not migrated yet still use the flat custom_string_{i}_{col} layout
     for i in range(1, 100):  # Assuming a maximum of 99 rows
         row_props = {}
         for col in range(1, 5):  # 4 columns
@@ -50,8 +86,48 @@ def get_custom_properties(obj):
     return props
 
 
-def update_eel_data(dummy):
-    eel.updateTable(get_object_data())
+def compute_table_delta(scene, changes):
+    """Build insert/update/delete deltas against what the client holds, or None if a full resync is needed"""
+    if table_sync_state["scene"] != scene.as_pointer():
+        return None
+
+    rows = table_sync_state["rows"]
+    upserts = []
+    deletes = [name for name in changes["removed"] | changes["renamed"].keys() if rows.pop(name, None) is not None]
+
+    for name in changes["touched"].keys() | changes["added"]:
+        obj = scene.objects.get(name)
+        if obj is None:
+            if rows.pop(name, None) is not None:
+                deletes.append(name)
+            continue
+
+        obj_data = serialize_object(obj)
+        if rows.get(name) != obj_data:
+            rows[name] = obj_data
+            upserts.append(obj_data)
+
+    # Rows can be deleted and re-inserted under the same name within one update
+    deletes = [name for name in deletes if name not in rows]
+    return {"upsert": upserts, "delete": deletes}
+
+def update_eel_data(scene, changes):
+    if changes["reset"]:
+        # A newly loaded file always gets a full resync
+        table_sync_state.update(scene=None, rows={})
+    if TABLE_SYNC_MODE != 'delta':
+        publish_full_table()
+        return
+
+    delta = compute_table_delta(scene, changes)
+    if delta is None:
+        publish_full_table()
+    elif delta["upsert"] or delta["delete"]:
+        event_bus.publish("table_delta", json.dumps(delta))
+
+def publish_full_table():
+    # A full snapshot makes every delta still queued for the browser obsolete
+    event_bus.publish("table", get_object_data(), key="table", supersedes=("table_delta",))
 
 class EelOperator(bpy.types.Operator):
     bl_idname = "wm.run_eel"
@@ -62,12 +138,13 @@ class EelOperator(bpy.types.Operator):
         return {'FINISHED'}
 
 def register():
+    event_bus.start()
     bpy.utils.register_class(EelOperator)
-    bpy.app.handlers.depsgraph_update_post.append(update_eel_data)
+    scene_changes.add_listener("table", update_eel_data)
 
 def unregister():
     bpy.utils.unregister_class(EelOperator)
-    bpy.app.handlers.depsgraph_update_post.remove(update_eel_data)
+    scene_changes.remove_listener("table")
 
 
 # Clear existing exposed functions
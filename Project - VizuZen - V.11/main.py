@@ -21,6 +21,106 @@ except FileNotFoundError:
     print(f"Could not find file: {script1_path}")
 
 
+# Execute script - scene change collector - one depsgraph handler feeding every index below
+script_scene_changes_path = os.path.join(current_dir, 'blender_scene_changes.py')
+print("Trying to open:", script_scene_changes_path)
+
+try:
+    with open(script_scene_changes_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_scene_changes_path}")
+
+
+# Execute script - document row model - cached rows shared by panels, overlay and web table
+script_row_model_path = os.path.join(current_dir, 'blender_row_model.py')
+print("Trying to open:", script_row_model_path)
+
+try:
+    with open(script_row_model_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_row_model_path}")
+
+
+# Execute script - category / work package index - object lists without full scene scans
+script_object_index_path = os.path.join(current_dir, 'blender_object_index.py')
+print("Trying to open:", script_object_index_path)
+
+try:
+    with open(script_object_index_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_object_index_path}")
+
+
+# Execute script - CSV export modes - incremental and partitioned exports in long or wide format
+script_csv_export_path = os.path.join(current_dir, 'blender_csv_export.py')
+print("Trying to open:", script_csv_export_path)
+
+try:
+    with open(script_csv_export_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_csv_export_path}")
+
+
+# Execute script - CSV import - dry-run diff and batched apply of edited exports
+script_csv_import_path = os.path.join(current_dir, 'blender_csv_import.py')
+print("Trying to open:", script_csv_import_path)
+
+try:
+    with open(script_csv_import_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_csv_import_path}")
+
+
+# Execute script - main-thread dispatcher - eel calls that touch bpy run on Blender's main thread
+script_dispatcher_path = os.path.join(current_dir, 'blender_dispatcher.py')
+print("Trying to open:", script_dispatcher_path)
+
+try:
+    with open(script_dispatcher_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_dispatcher_path}")
+
+
+# Execute script - event bus - non-blocking pushes from Blender to the web UI
+script_event_bus_path = os.path.join(current_dir, 'blender_event_bus.py')
+print("Trying to open:", script_event_bus_path)
+
+try:
+    with open(script_event_bus_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_event_bus_path}")
+
+
+# Execute script - marker index - sorted marker frames for timeline navigation
+script_marker_index_path = os.path.join(current_dir, 'blender_marker_index.py')
+print("Trying to open:", script_marker_index_path)
+
+try:
+    with open(script_marker_index_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_marker_index_path}")
+
+
+# Execute script - camera preview store - preview images served to the web UI over HTTP
+## Loaded before the web UI: its /previews route has to be on bottle's app before eel.start adds its catch-all route
+script_preview_store_path = os.path.join(current_dir, 'blender_preview_store.py')
+print("Trying to open:", script_preview_store_path)
+
+try:
+    with open(script_preview_store_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_preview_store_path}")
+
+
 # Execute script - Webbrowser UI and navigation 
 ## Table, and timlelinemanager
 script2_path = os.path.join(current_dir, 'eel_Blender_Content.py')
@@ -44,6 +144,61 @@ except FileNotFoundError:
     print(f"Could not find file: {script3_path}")
     
 
+# Execute script - camera registry - section slot and name lookups for the camera RPCs
+script_camera_registry_path = os.path.join(current_dir, 'blender_camera_registry.py')
+print("Trying to open:", script_camera_registry_path)
+
+try:
+    with open(script_camera_registry_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_camera_registry_path}")
+
+
+# Execute script - camera preview cache - skips re-rendering unchanged cameras
+script_preview_cache_path = os.path.join(current_dir, 'blender_preview_cache.py')
+print("Trying to open:", script_preview_cache_path)
+
+try:
+    with open(script_preview_cache_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_preview_cache_path}")
+
+
+# Execute script - camera preview disk cache - previews kept next to the .blend across sessions
+script_preview_disk_path = os.path.join(current_dir, 'blender_preview_disk.py')
+print("Trying to open:", script_preview_disk_path)
+
+try:
+    with open(script_preview_disk_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_preview_disk_path}")
+
+
+# Execute script - retry policy - non-blocking retries with backoff for the camera RPCs
+script_retry_path = os.path.join(current_dir, 'blender_retry.py')
+print("Trying to open:", script_retry_path)
+
+try:
+    with open(script_retry_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_retry_path}")
+
+
+# Execute script - camera preview queue - renders previews in the background and pushes them to the UI
+script_preview_queue_path = os.path.join(current_dir, 'blender_preview_queue.py')
+print("Trying to open:", script_preview_queue_path)
+
+try:
+    with open(script_preview_queue_path, 'r') as file:
+        exec(file.read())
+except FileNotFoundError:
+    print(f"Could not find file: {script_preview_queue_path}")
+
+
 # Execute script - Bledner pie-menu - popupbox showing
 script4_path = os.path.join(current_dir, 'blender_camera.py')
 print("Trying to open:", script4_path)
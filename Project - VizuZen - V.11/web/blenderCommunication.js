@@ -22,7 +22,13 @@ const BlenderCommunication = {
             });
         }
 
-        await eel.update_markers(markers)();
+        // Blender only applies what changed and reports it back, nothing has to be re-read
+        const result = await eel.update_markers(markers)();
+        if (!result || !result.success) {
+            console.error('Failed to update markers:', result && result.message);
+            return null;
+        }
+        return result.diff;
     },
     
     async jumpToNextMarker() {
@@ -33,6 +39,17 @@ const BlenderCommunication = {
         return await eel.jump_to_previous_marker()();
     },
 
+    // Markers from start to end (inclusive) as [{frame, name}], sorted by frame
+    async getMarkerFrames(start, end) {
+        const result = await eel.get_marker_frames(start, end)();
+        return result.success ? result.markers : [];
+    },
+
+    // Frames of the previous, next and nearest marker around a frame, null where there is none
+    async getMarkerNeighbours(frame) {
+        return await eel.get_marker_neighbours(frame)();
+    },
+
     async setCurrentFrame(frame) {
         await eel.set_current_frame(frame)();
     },
@@ -42,14 +59,39 @@ const BlenderCommunication = {
     }
 };
 
-// Function to be called from Python when the frame changes
-eel.expose(updateCurrentFrame);
-async function updateCurrentFrame(frame) {
-    if (TimelineManager && TimelineManager.setCurrentFrame) {
-        await TimelineManager.setCurrentFrame(frame);
-    } else {
-        console.error('TimelineManager is not defined or does not have setCurrentFrame method');
-    }
+// Events pushed from Blender, one batch per call; the return value only tells Blender the batch arrived
+eel.expose(receiveEvents);
+function receiveEvents(batch) {
+    batch.forEach(({ type, payload }) => {
+        try {
+            switch (type) {
+                case 'frame':
+                    TimelineManager.handleBlenderFrameUpdate(payload);
+                    break;
+                case 'playback_start':
+                    TimelineManager.startPlaybackClock(payload);
+                    break;
+                case 'playback_sync':
+                    TimelineManager.syncPlaybackClock(payload.frame);
+                    break;
+                case 'playback_stop':
+                    TimelineManager.stopPlaybackClock(payload.frame);
+                    break;
+                case 'camera_preview':
+                    CameraManager.applyQueuedPreview(payload.section_id, payload.camera_number, payload.blender_name, payload.preview_url);
+                    break;
+                case 'resync':
+                    // Events were dropped while the page was behind, fetch the current state instead
+                    TimelineManager.syncWithBlender();
+                    CameraManager.resetLoadedSections();
+                    SectionManager.renderSections();
+                    break;
+            }
+        } catch (error) {
+            console.error(`Error handling ${type} event:`, error);
+        }
+    });
+    return true;
 }
 
 // We'll initialize Blender communication in main.js now
\ No newline at end of file
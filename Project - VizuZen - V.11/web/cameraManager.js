@@ -4,6 +4,9 @@ const CameraManager = {
     // Store all available cameras in the Blender scene
     availableCameras: [],
     
+    // Sections whose cameras were loaded from Blender since the project was opened
+    loadedSections: new Set(),
+    
     // Method to fetch all cameras from Blender
     async fetchAvailableCameras() {
         try {
@@ -21,6 +24,71 @@ const CameraManager = {
         }
     },
 
+    // Forget which sections were loaded, after a project load or a resync
+    resetLoadedSections() {
+        this.loadedSections.clear();
+    },
+    
+    // Refresh the saved cameras of many sections from Blender in one call, the first time they are rendered
+    async loadSectionCameras(sectionIds) {
+        sectionIds = sectionIds.filter(sectionId => !this.loadedSections.has(sectionId));
+        if (sectionIds.length === 0) return;
+        sectionIds.forEach(sectionId => this.loadedSections.add(sectionId));
+        
+        // Only slots without any preview get a render queued, the others just pick up a cached one.
+        // Blender checks the ids of the saved URLs too, previews it can't serve anymore are rendered again
+        const missingPreviews = [];
+        const knownPreviews = [];
+        sectionIds.forEach(sectionId => {
+            const cameras = DataStore.getTableData(sectionId, 'cameras') || {};
+            Object.entries(cameras).forEach(([cameraNumber, cameraData]) => {
+                if (!cameraData) return;
+                if (cameraData.preview_url) {
+                    knownPreviews.push([sectionId, Number(cameraNumber), cameraData.preview_url.split('/').pop()]);
+                } else if (!cameraData.preview_image) {
+                    missingPreviews.push([sectionId, Number(cameraNumber)]);
+                }
+            });
+        });
+        
+        try {
+            const result = await eel.get_section_cameras(sectionIds, missingPreviews, knownPreviews)();
+            if (!result.success) {
+                console.error("Failed to load section cameras:", result.message);
+                return;
+            }
+            this.availableCameras = result.available_cameras;
+            
+            result.cameras.forEach(({ section_id, camera_number, camera_data }) => {
+                const cameras = DataStore.getTableData(section_id, 'cameras') || {};
+                const cameraData = cameras[camera_number];
+                // Only slots the project knows about, the label and order stay as saved
+                if (!cameraData) return;
+                
+                Object.assign(cameraData, {
+                    position: camera_data.position,
+                    rotation: camera_data.rotation,
+                    frame: camera_data.frame,
+                    blender_name: camera_data.blender_name
+                });
+                // Nothing cached keeps the preview the slot already has, such as a viewport screenshot,
+                // unless Blender can't serve it anymore
+                if (camera_data.preview_expired) {
+                    delete cameraData.preview_url;
+                }
+                if (camera_data.preview_url) {
+                    cameraData.preview_url = camera_data.preview_url;
+                    cameraData.preview_pending = false;
+                } else if (camera_data.preview_pending) {
+                    cameraData.preview_pending = true;
+                }
+                this.saveCameraData(section_id, camera_number, cameraData);
+            });
+        } catch (error) {
+            console.error("Error loading section cameras:", error);
+        }
+    },
+
     async addCamera(sectionId) {
         const sectionContent = document.querySelector(`#section-content-${sectionId}`);
         if (!sectionContent) return null;
@@ -248,24 +316,12 @@ const CameraManager = {
         // Create camera preview container
         const cameraPreview = document.createElement('div');
         cameraPreview.className = 'camera-preview';
+        this.showPreview(cameraPreview, cameraNumber, cameraData);
         
-        // If we have a preview image, display it
-        if (cameraData.preview_image) {
-            const img = document.createElement('img');
-            img.src = `data:image/png;base64,${cameraData.preview_image}`;
-            img.alt = `Camera ${cameraNumber} Preview`;
-            img.style.maxWidth = '100%';
-            img.style.maxHeight = '300px';
-            cameraPreview.appendChild(img);
-            
-            // Add click handler to open full-size image
-            img.style.cursor = 'pointer';
-            img.addEventListener('click', () => {
-                window.open(img.src, '_blank');
-            });
-        } else {
-            cameraPreview.innerHTML = '<div style="text-align: center; padding: 20px; color: #e0e0e0;">No preview available</div>';
-        }
+        // Queued renders of the camera under the mouse are done first
+        cameraWrapper.addEventListener('mouseenter', () => {
+            eel.focus_camera_preview(sectionId, cameraNumber);
+        });
         
         // Create camera info
         const cameraInfo = document.createElement('div');
@@ -457,12 +513,38 @@ const CameraManager = {
             positionInfo.textContent = `Pos: ${formatVector(cameraData.position)}`;
         }
         
-        // Update camera preview if available
-        if (cameraData.preview_image) {
-            const cameraPreview = cameraWrapper.querySelector('.camera-preview');
-            cameraPreview.innerHTML = '';
+        // Update camera preview if available, or show that one is being rendered
+        if (cameraData.preview_url || cameraData.preview_pending) {
+            this.showPreview(cameraWrapper.querySelector('.camera-preview'), cameraNumber, cameraData);
+        }
+        
+        // Update camera info
+        const cameraInfo = cameraWrapper.querySelector('.camera-info');
+        cameraInfo.innerHTML = `
+            <div>Position: X: ${cameraData.position.x.toFixed(2)}, Y: ${cameraData.position.y.toFixed(2)}, Z: ${cameraData.position.z.toFixed(2)}</div>
+            <div>Rotation: X: ${cameraData.rotation.x.toFixed(2)}, Y: ${cameraData.rotation.y.toFixed(2)}, Z: ${cameraData.rotation.z.toFixed(2)}</div>
+            <div>Frame: ${cameraData.frame}</div>
+        `;
+        
+        // Save updated camera data
+        this.saveCameraData(sectionId, cameraNumber, cameraData);
+    },
+    
+    showPreview(cameraPreview, cameraNumber, cameraData) {
+        cameraPreview.innerHTML = '';
+        // Projects saved before previews were served over HTTP still carry base64 images
+        const legacySrc = cameraData.preview_image ? `data:image/png;base64,${cameraData.preview_image}` : null;
+        if (cameraData.preview_url || legacySrc) {
             const img = document.createElement('img');
-            img.src = `data:image/png;base64,${cameraData.preview_image}`;
+            if (cameraData.preview_url) {
+                // The browser only downloads the size the card is shown at, hover for wide / high-DPI cards
+                const url = cameraData.preview_url;
+                img.src = `${url}/card`;
+                img.srcset = `${url}/card 320w, ${url}/hover 640w`;
+                img.sizes = `${cameraPreview.clientWidth || 320}px`;
+            } else {
+                img.src = legacySrc;
+            }
             img.alt = `Camera ${cameraNumber} Preview`;
             img.style.maxWidth = '100%';
             img.style.maxHeight = '300px';
@@ -470,25 +552,44 @@ const CameraManager = {
             // Add click handler to open full-size image
             img.style.cursor = 'pointer';
             img.addEventListener('click', () => {
-                window.open(img.src, '_blank');
+                window.open(cameraData.preview_url ? `${cameraData.preview_url}/full` : legacySrc, '_blank');
+            });
+            
+            // Blender lost the preview (disk cache evicted or deleted), it is rendered again when the project is next loaded
+            img.addEventListener('error', () => {
+                cameraPreview.innerHTML = '<div style="text-align: center; padding: 20px; color: #e0e0e0;">No preview available</div>';
             });
             
             cameraPreview.appendChild(img);
+        } else if (cameraData.preview_pending) {
+            cameraPreview.innerHTML = '<div style="text-align: center; padding: 20px; color: #e0e0e0;">Rendering preview...</div>';
+        } else {
+            cameraPreview.innerHTML = '<div style="text-align: center; padding: 20px; color: #e0e0e0;">No preview available</div>';
         }
+    },
+    
+    // Called from Python when a queued preview render is done
+    applyQueuedPreview(sectionId, cameraNumber, blenderName, previewUrl) {
+        const cameras = DataStore.getTableData(sectionId, 'cameras') || {};
+        const cameraData = cameras[cameraNumber];
+        // The slot may have been switched to another camera since the render was queued
+        if (!cameraData || cameraData.blender_name !== blenderName) return;
         
-        // Update camera info
-        const cameraInfo = cameraWrapper.querySelector('.camera-info');
-        cameraInfo.innerHTML = `
-            <div>Position: X: ${cameraData.position.x.toFixed(2)}, Y: ${cameraData.position.y.toFixed(2)}, Z: ${cameraData.position.z.toFixed(2)}</div>
-            <div>Rotation: X: ${cameraData.rotation.x.toFixed(2)}, Y: ${cameraData.rotation.y.toFixed(2)}, Z: ${cameraData.rotation.z.toFixed(2)}</div>
-            <div>Frame: ${cameraData.frame}</div>
-        `;
-        
-        // Save updated camera data
+        cameraData.preview_url = previewUrl;
+        cameraData.preview_pending = false;
         this.saveCameraData(sectionId, cameraNumber, cameraData);
+        
+        const cameraWrapper = document.getElementById(`camera-wrapper-${sectionId}-${cameraNumber}`);
+        if (cameraWrapper) {
+            this.showPreview(cameraWrapper.querySelector('.camera-preview'), cameraNumber, cameraData);
+        }
     },
     
     saveCameraData(sectionId, cameraNumber, cameraData) {
+        // Only the URL is kept, so saved projects don't carry the image itself
+        if (cameraData.preview_url) {
+            delete cameraData.preview_image;
+        }
         const cameras = DataStore.getTableData(sectionId, 'cameras') || {};
         cameras[cameraNumber] = cameraData;
         DataStore.setTableData(sectionId, 'cameras', cameras);
@@ -535,6 +636,7 @@ const CameraManager = {
     }
 };
 
+
 // Helper function to format position vectors more concisely
 function formatVector(vector) {
     return `(${vector.x.toFixed(1)}, ${vector.y.toFixed(1)}, ${vector.z.toFixed(1)})`;
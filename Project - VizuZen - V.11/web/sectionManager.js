@@ -36,6 +36,9 @@ const SectionManager = {
         UIManager.updateSlider();
         await TimelineManager.updateTimelineSlider();
         
+        // One round trip for the cameras of sections shown for the first time, queued previews are pushed later
+        await CameraManager.loadSectionCameras(sectionsToRestore);
+        
         // Restore content for all sections in queue
         for (const sectionId of sectionsToRestore) {
             try {
@@ -297,7 +300,12 @@ const SectionManager = {
         while (endIndex < sections.length && sections[endIndex].level > sectionLevel) {
             endIndex++;
         }
-        sections.splice(sectionIndex, endIndex - sectionIndex);
+        const removed = sections.splice(sectionIndex, endIndex - sectionIndex);
+
+        // Previews still queued for the removed sections are no longer needed
+        if (typeof eel !== 'undefined') {
+            eel.cancel_section_previews(removed.map(section => section.id));
+        }
 
         DataStore.setSections(sections);
         this.updateStepCounters();
@@ -3,6 +3,7 @@
 const TimelineManager = {
     startValue: 1,
     isFolded: false,
+    markerFrames: null, // Sorted frames of Blender's markers on the timeline, null until loaded
     isUpdating: false, // New: Added for sync protection
 
     init() {
@@ -15,7 +16,7 @@ const TimelineManager = {
 
     // New: Blender sync methods
     initBlenderSync() {
-        eel.expose(this.handleBlenderFrameUpdate.bind(this), 'updateCurrentFrame');
+        // Frame changes arrive as 'frame' events through receiveEvents in blenderCommunication.js
         this.syncWithBlender();
     },
 
@@ -34,6 +35,55 @@ const TimelineManager = {
         }
     },
 
+    // Playback clock: while Blender plays, the slider is animated here and only corrected from Blender
+    playbackClock: null,
+    playbackFrameRequest: null,
+
+    startPlaybackClock({ frame, fps, frame_start, frame_end, direction }) {
+        cancelAnimationFrame(this.playbackFrameRequest);
+        this.playbackClock = {
+            fps: fps,
+            start: frame_start,
+            end: frame_end,
+            direction: direction,
+            anchorFrame: frame,
+            anchorTime: performance.now(),
+            shownFrame: null
+        };
+        this.playbackFrameRequest = requestAnimationFrame(this.advancePlaybackClock.bind(this));
+    },
+
+    syncPlaybackClock(frame) {
+        const clock = this.playbackClock;
+        if (!clock) return;
+        // Blender drops or holds frames to keep up, so re-anchor on the frame it actually reached
+        clock.anchorFrame = frame;
+        clock.anchorTime = performance.now();
+    },
+
+    stopPlaybackClock(frame) {
+        cancelAnimationFrame(this.playbackFrameRequest);
+        this.playbackClock = null;
+        this.handleBlenderFrameUpdate(frame);
+    },
+
+    advancePlaybackClock(now) {
+        const clock = this.playbackClock;
+        if (!clock) return;
+        
+        // Blender loops over the range, so the clock wraps the same way
+        const length = clock.end - clock.start + 1;
+        const elapsedFrames = clock.direction * Math.max(0, now - clock.anchorTime) / 1000 * clock.fps;
+        const offset = Math.floor(clock.anchorFrame + elapsedFrames) - clock.start;
+        const frame = clock.start + ((offset % length) + length) % length;
+        
+        if (frame !== clock.shownFrame) {
+            clock.shownFrame = frame;
+            this.handleBlenderFrameUpdate(frame);
+        }
+        this.playbackFrameRequest = requestAnimationFrame(this.advancePlaybackClock.bind(this));
+    },
+
     updateUIWithoutBlenderSync(frame) {
         const slider = document.getElementById('timeline-slider');
         if (slider) {
@@ -200,8 +250,8 @@ const TimelineManager = {
 
     // Modified: Updated to handle Blender sync
     async setCurrentFrame(frame) {
-        if (this.isUpdating) return;
-
+        // Every request is sent, Blender only evaluates the newest one and answers older ones right away
+        this.pendingFrameRequests = (this.pendingFrameRequests || 0) + 1;
         try {
             this.isUpdating = true;
             const slider = document.getElementById('timeline-slider');
@@ -212,11 +262,19 @@ const TimelineManager = {
             this.updateCurrentStep(frame);
 
             // Update Blender's timeline
-            await eel.update_timeline(frame)();
+            const result = await eel.update_timeline(frame)();
+            
+            if (result && !result.success) {
+                console.error('Blender did not reach frame', frame, result.error);
+            } else if (result && !result.superseded && result.frame !== null && result.frame !== frame) {
+                // Show where Blender actually ended up, unless a newer request is on its way
+                this.updateUIWithoutBlenderSync(result.frame);
+            }
         } catch (error) {
             console.error('Error setting current frame:', error);
         } finally {
-            this.isUpdating = false;
+            this.pendingFrameRequests -= 1;
+            this.isUpdating = this.pendingFrameRequests > 0;
         }
     },
 
@@ -255,9 +313,46 @@ const TimelineManager = {
 
         if (BlenderCommunication) {
             await BlenderCommunication.sendMarkers();
+            await this.loadMarkerFrames();
         }
     },
 
+    // Every marker frame of the timeline in one call, section navigation then needs no round trip
+    async loadMarkerFrames() {
+        try {
+            const markers = await BlenderCommunication.getMarkerFrames(this.startValue, DataStore.getMaxTimelineValue());
+            this.markerFrames = markers.map(marker => marker.frame);
+        } catch (error) {
+            console.error('Error loading marker frames:', error);
+            this.markerFrames = null;
+        }
+    },
+
+    // Frame of the marker before or after a frame, from the loaded frames or Blender's marker index
+    async findNeighbourMarker(frame, direction) {
+        const frames = this.markerFrames;
+        if (frames && frames.length > 0) {
+            // Binary search for the first marker after frame (or at it, looking backwards)
+            let lo = 0;
+            let hi = frames.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (direction > 0 ? frames[mid] <= frame : frames[mid] < frame) {
+                    lo = mid + 1;
+                } else {
+                    hi = mid;
+                }
+            }
+            if (direction > 0) {
+                return lo < frames.length ? frames[lo] : null;
+            }
+            return lo > 0 ? frames[lo - 1] : null;
+        }
+        const neighbours = await BlenderCommunication.getMarkerNeighbours(frame);
+        if (!neighbours || !neighbours.success) return null;
+        return direction > 0 ? neighbours.next : neighbours.previous;
+    },
+
     updateSectionSlider() {
         const sectionSlider = document.getElementById('section-slider');
         if (!sectionSlider) return;
@@ -343,19 +438,10 @@ const TimelineManager = {
         const timelineSlider = document.getElementById('timeline-slider');
         if (!timelineSlider) return;
         
-        const currentStep = parseInt(timelineSlider.value);
-        const sections = DataStore.getSections();
-        
-        if (currentStep === this.startValue) {
-            const firstSection = sections[0];
-            if (firstSection) {
-                await this.setCurrentFrame(firstSection.steps);
-            }
-        } else {
-            const nextSection = sections.find(s => s.steps > currentStep);
-            if (nextSection) {
-                await this.setCurrentFrame(nextSection.steps);
-            }
+        // Markers are the start frame and one per section, see BlenderCommunication.sendMarkers
+        const nextFrame = await this.findNeighbourMarker(parseInt(timelineSlider.value), 1);
+        if (nextFrame !== null) {
+            await this.setCurrentFrame(nextFrame);
         }
     },
 
@@ -364,16 +450,9 @@ const TimelineManager = {
         const timelineSlider = document.getElementById('timeline-slider');
         if (!timelineSlider) return;
         
-        const currentStep = parseInt(timelineSlider.value);
-        const sections = DataStore.getSections();
-        
-        if (currentStep > this.startValue && currentStep <= sections[0].steps) {
-            await this.setCurrentFrame(this.startValue);
-        } else {
-            const previousSection = sections.reverse().find(s => s.steps < currentStep);
-            if (previousSection) {
-                await this.setCurrentFrame(previousSection.steps);
-            }
+        const previousFrame = await this.findNeighbourMarker(parseInt(timelineSlider.value), -1);
+        if (previousFrame !== null) {
+            await this.setCurrentFrame(previousFrame);
         }
     },
 
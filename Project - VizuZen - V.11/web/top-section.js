@@ -147,6 +147,7 @@ const TopSection = {
         // Reset DataStore to default values
         DataStore.resetToDefault();
         DataStore.setSections(defaultSections);
+        CameraManager.resetLoadedSections();
 
         // Clear all existing content
         const sectionsContainer = document.getElementById('sections-container');
@@ -233,6 +234,7 @@ const TopSection = {
     loadProjectData(projectData) {
         // Load sections
         DataStore.setSections(projectData.sections);
+        CameraManager.resetLoadedSections();
 
         // Load max timeline value
         DataStore.setMaxTimelineValue(projectData.maxTimelineValue);
@@ -456,6 +458,7 @@ const TopSection = {
             
             // Load basic data
             DataStore.setSections(projectData.sections || []);
+            CameraManager.resetLoadedSections();
             DataStore.setMaxTimelineValue(projectData.maxTimelineValue || 250);
             DataStore.tableDatas = projectData.tableDatas || {};
 
@@ -506,6 +509,7 @@ const TopSection = {
 
         DataStore.resetToDefault();
         DataStore.setSections(defaultSections);
+        CameraManager.resetLoadedSections();
         
         const sectionsContainer = document.getElementById('sections-container');
         if (sectionsContainer) {
@@ -2,6 +2,7 @@
 
 let table;
 let columnsVisible = true;
+let rowIdsByObject = {};  // object name -> ids of its table rows, used to apply deltas
 
 document.addEventListener('DOMContentLoaded', function() {
     addBackButton();
@@ -88,6 +89,7 @@ function createTable(objectData) {
     ];
 
     table = new Tabulator("#object-table", {
+        index: "id",
         data: formatObjectData(objectData),
         columns: columns,
         layout: "fitDataFill",
@@ -161,8 +163,12 @@ function applySearch(value) {
 function formatObjectData(objectData) {
     let formattedData = [];
     objectData.forEach(obj => {
+        rowIdsByObject[obj.name] = [];
         Object.entries(obj.properties).forEach(([rowKey, rowData]) => {
+            const id = `${obj.name}::${rowKey}`;
+            rowIdsByObject[obj.name].push(id);
             formattedData.push({
+                id: id,
                 name: obj.name,
                 category: obj.category,
                 wp: obj.wp,
@@ -194,16 +200,58 @@ function updateGrouping(groupBy) {
 
 function refreshData() {
     eel.get_object_data()(function(data) {
+        rowIdsByObject = {};
         table.setData(formatObjectData(JSON.parse(data)));
         adjustColumnWidths();
     });
 }
 
+// Events pushed from Blender, one batch per call; the return value only tells Blender the batch arrived
+eel.expose(receiveEvents);
+function receiveEvents(batch) {
+    batch.forEach(({ type, payload }) => {
+        if (type === 'table') {
+            updateTable(payload);
+        } else if (type === 'table_delta') {
+            applyTableDelta(payload);
+        } else if (type === 'resync') {
+            // Deltas were dropped while the page was behind, only a full reload is consistent again
+            refreshData();
+        }
+    });
+    return true;
+}
+
 eel.expose(updateTable);
 function updateTable(newData) {
     if (table) {
         let parsedData = JSON.parse(newData);
+        rowIdsByObject = {};
         table.setData(formatObjectData(parsedData));
         adjustColumnWidths();
     }
+}
+
+// Apply an insert/update/delete delta pushed from Blender instead of rebuilding the table
+eel.expose(applyTableDelta);
+function applyTableDelta(deltaData) {
+    if (table) {
+        let delta = JSON.parse(deltaData);
+        let staleIds = [];
+        delta.delete.concat(delta.upsert.map(obj => obj.name)).forEach(name => {
+            if (rowIdsByObject[name]) {
+                staleIds.push(...rowIdsByObject[name]);
+                delete rowIdsByObject[name];
+            }
+        });
+
+        if (staleIds.length) {
+            table.deleteRow(staleIds);
+        }
+
+        let newRows = formatObjectData(delta.upsert);
+        if (newRows.length) {
+            table.addData(newRows);
+        }
+    }
 }
\ No newline at end of file